@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_filer_action import CteraFilerAction
+
+
+class ActionModule(CteraFilerAction):
+    """
+    Run ctera_filer_backup in the controller process
+    """
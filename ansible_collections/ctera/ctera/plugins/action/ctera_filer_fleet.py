@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.text.converters import to_text
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_gateway_proxy import TimingInterceptor
+from ansible_collections.ctera.ctera.plugins.plugin_utils import ctera_module_runner
+
+
+class ActionModule(ActionBase):
+    """
+    Run a Filer module of the collection on many filers, in a bounded thread pool of the controller process
+    """
+
+    TRANSFERS_FILES = False
+    _requires_connection = False
+
+    argument_spec = dict(
+        filers=dict(type='list', elements='raw', required=True),
+        module=dict(type='str', required=True),
+        module_args=dict(type='dict', default={}),
+        concurrency=dict(type='int', default=20),
+        filer_user=dict(type='str'),
+        filer_password=dict(type='str', no_log=True),
+        filer_port=dict(type='int'),
+    )
+    filer_keys = ('filer_host', 'filer_user', 'filer_password', 'filer_port')
+
+    def run(self, tmp=None, task_vars=None):
+        result = super().run(tmp, task_vars)
+        del tmp
+
+        dummy, params = self.validate_argument_spec(argument_spec=self.argument_spec)
+        if not ctera_module_runner.supported():
+            raise AnsibleActionFail('ctera.ctera.ctera_filer_fleet requires ansible-core 2.19 or later')
+        if params['concurrency'] < 1:
+            raise AnsibleActionFail('concurrency must be a positive number')
+        try:
+            module = ctera_module_runner.load_module(params['module'])
+        except ValueError as error:
+            raise AnsibleActionFail(to_text(error))
+        filers = [self._filer(filer) for filer in params['filers']]
+
+        args_list = [self._module_args(params, filer) for filer in filers]
+        results = ctera_module_runner.run_module_concurrently(
+            module, args_list, params['concurrency'], check_mode=self._play_context.check_mode, diff=self._play_context.diff, no_log=self._task.no_log
+        )
+        for filer, host_result in zip(filers, results):
+            host_result['filer_host'] = filer['filer_host']
+
+        failed_hosts = [self._address(filer) for filer, host_result in zip(filers, results) if host_result.get('failed')]
+        result.update(
+            changed=any(host_result.get('changed', False) for host_result in results),
+            results=results,
+            failed_hosts=failed_hosts
+        )
+        self._aggregate(result, results)
+        if failed_hosts:
+            result.update(failed=True, msg='%d of %d filers failed: %s' % (len(failed_hosts), len(results), ', '.join(failed_hosts)))
+        else:
+            result['msg'] = 'Ran %s on %d filers' % (ctera_module_runner.module_name(params['module']), len(results))
+        return result
+
+    @staticmethod
+    def _aggregate(result, results):
+        # The ctera_timings callback reads the timings and retries at the top level of the result
+        timings = [host_result['ctera_timings'] for host_result in results if host_result.get('ctera_timings')]
+        if timings:
+            timing = TimingInterceptor()
+            timing.calls = [call for host_timings in timings for call in host_timings['calls']]
+            result['ctera_timings'] = timing.summary()
+        retries = [host_result['ctera_retries'] for host_result in results if host_result.get('ctera_retries')]
+        if retries:
+            calls = {}
+            for host_retries in retries:
+                for name, count in host_retries['calls'].items():
+                    calls[name] = calls.get(name, 0) + count
+            result['ctera_retries'] = dict(count=sum(calls.values()), calls=calls)
+
+    @staticmethod
+    def _filer(filer):
+        if isinstance(filer, dict):
+            unknown = set(filer) - set(ActionModule.filer_keys)
+            if unknown or 'filer_host' not in filer:
+                raise AnsibleActionFail('Each filer must be a host name or a dictionary with filer_host and optionally %s. Got: %s' % (
+                    ', '.join(ActionModule.filer_keys[1:]), ', '.join(sorted(filer))
+                ))
+            return filer
+        return dict(filer_host=to_text(filer))
+
+    @staticmethod
+    def _address(filer):
+        if filer.get('filer_port') is None:
+            return filer['filer_host']
+        return '%s:%s' % (filer['filer_host'], filer['filer_port'])
+
+    @staticmethod
+    def _module_args(params, filer):
+        args = dict(params['module_args'])
+        for key in ActionModule.filer_keys[1:]:
+            if params[key] is not None:
+                args[key] = params[key]
+        args.update(filer)
+        return args
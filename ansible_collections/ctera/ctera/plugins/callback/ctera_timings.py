@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: ctera_timings
+type: aggregate
+short_description: Aggregates the request timings of CTERA-Networks Filer tasks
+description:
+    - Aggregates the C(ctera_timings) returned by the modules of the ctera.ctera collection when C(ctera_timings=True).
+    - At the end of the play, displays the number of requests, their total and slowest duration and the number of failures per request name,
+      followed by the slowest tasks.
+version_added: "2.10"
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+requirements:
+    - enable in configuration
+options:
+  top:
+    description: Number of request names and tasks to display
+    type: int
+    default: 10
+    ini:
+      - section: callback_ctera_timings
+        key: top
+    env:
+      - name: CTERA_TIMINGS_TOP
+'''
+
+from ansible.plugins.callback import CallbackBase
+
+
+class CallbackModule(CallbackBase):
+    """
+    Aggregate the request timings of CTERA Filer tasks across the play
+    """
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'ctera.ctera.ctera_timings'
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self):
+        super().__init__()
+        self.requests = {}
+        self.tasks = []
+
+    def _record(self, result):
+        ctera_timings = result._result.get('ctera_timings')  # pylint: disable=protected-access
+        if not ctera_timings:
+            return
+        self.tasks.append(dict(
+            name='%s: %s' % (result._host.get_name(), result._task.get_name()),  # pylint: disable=protected-access
+            count=ctera_timings['count'],
+            total=ctera_timings['total']
+        ))
+        for call in ctera_timings['calls']:
+            request = self.requests.setdefault(call['name'], dict(count=0, total=0.0, slowest=0.0, failed=0))
+            request['count'] += 1
+            request['total'] += call['duration']
+            request['slowest'] = max(request['slowest'], call['duration'])
+            if not call['success']:
+                request['failed'] += 1
+
+    def v2_runner_on_ok(self, result):
+        self._record(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._record(result)
+
+    def v2_playbook_on_stats(self, stats):
+        if not self.tasks:
+            return
+        top = self.get_option('top')
+        self._display.banner('CTERA TIMINGS')
+        self._display.display('%-40s %8s %10s %10s %8s' % ('Request', 'Count', 'Total', 'Slowest', 'Failed'))
+        for name, request in sorted(self.requests.items(), key=lambda item: item[1]['total'], reverse=True)[:top]:
+            self._display.display('%-40s %8d %9.3fs %9.3fs %8d' % (name, request['count'], request['total'], request['slowest'], request['failed']))
+        self._display.display('')
+        self._display.display('%-59s %8s %10s' % ('Task', 'Requests', 'Total'))
+        for task in sorted(self.tasks, key=lambda task: task['total'], reverse=True)[:top]:
+            self._display.display('%-59s %8d %9.3fs' % (task['name'], task['count'], task['total']))
+        self._display.display('')
+        self._display.display('%d requests in %d tasks took %.3fs' % (
+            sum(request['count'] for request in self.requests.values()),
+            len(self.tasks),
+            sum(request['total'] for request in self.requests.values())
+        ))
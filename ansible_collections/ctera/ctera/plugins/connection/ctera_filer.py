@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: ctera_filer
+short_description: Persistent session to CTERA-Networks filers
+description:
+    - Keeps one authenticated session per filer and user alive for the duration of the play.
+    - Modules of the ctera.ctera collection borrow the session instead of logging in and out on every task.
+    - Modules are executed locally on the controller, the same way they are executed with C(connection=local).
+version_added: "2.10"
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+options:
+  session_idle_timeout:
+    description:
+    - Number of seconds a session may stay unused before it is re-established with a new login
+    - Should be lower than the session timeout configured on the filer
+    type: int
+    default: 600
+    vars:
+      - name: ctera_session_idle_timeout
+  ctera_connect_timeout:
+    description:
+    - Seconds to wait for a connection to the filer. C(0) waits indefinitely
+    type: float
+    default: 10
+    env:
+      - name: CTERA_CONNECT_TIMEOUT
+    vars:
+      - name: ctera_connect_timeout
+  ctera_read_timeout:
+    description:
+    - Seconds to wait for the filer to answer a request. C(0) waits indefinitely
+    type: float
+    default: 60
+    env:
+      - name: CTERA_READ_TIMEOUT
+    vars:
+      - name: ctera_read_timeout
+  ctera_pool_size:
+    description:
+    - The number of connections to the filer that are kept open for reuse by the session
+    type: int
+    default: 10
+    env:
+      - name: CTERA_POOL_SIZE
+    vars:
+      - name: ctera_pool_size
+  ctera_keep_alive:
+    description:
+    - Whether to reuse the connections to the filer for the following requests of the session
+    type: bool
+    default: True
+    env:
+      - name: CTERA_KEEP_ALIVE
+    vars:
+      - name: ctera_keep_alive
+  persistent_connect_timeout:
+    description:
+    - Configures, in seconds, the amount of time to wait when trying to initially establish a persistent connection.
+    type: int
+    default: 30
+    ini:
+      - section: persistent_connection
+        key: connect_timeout
+    env:
+      - name: ANSIBLE_PERSISTENT_CONNECT_TIMEOUT
+    vars:
+      - name: ansible_connect_timeout
+  persistent_command_timeout:
+    description:
+    - Configures, in seconds, the amount of time to wait for a command to return from the persistent connection.
+    type: int
+    default: 30
+    ini:
+      - section: persistent_connection
+        key: command_timeout
+    env:
+      - name: ANSIBLE_PERSISTENT_COMMAND_TIMEOUT
+    vars:
+      - name: ansible_command_timeout
+  persistent_log_messages:
+    description:
+    - This flag will enable logging the command executed and response received from target device in the ansible log file.
+    type: bool
+    default: False
+    ini:
+      - section: persistent_connection
+        key: log_messages
+    env:
+      - name: ANSIBLE_PERSISTENT_LOG_MESSAGES
+    vars:
+      - name: ansible_persistent_log_messages
+requirements:
+    - cterasdk
+'''
+
+EXAMPLES = '''
+- name: Configure the CTERA Edge Filer
+  hosts: filers
+  connection: ctera.ctera.ctera_filer
+  tasks:
+  - name: Set Hostname
+    ctera.ctera.ctera_filer_hostname:
+      hostname: Example
+      filer_host: "{{ ansible_host }}"
+      filer_user: "{{ ctera_filer_user }}"
+      filer_password: "{{ ctera_filer_password }}"
+'''
+
+import hashlib
+import time
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.basic import missing_required_lib
+from ansible.module_utils._text import to_bytes
+from ansible.plugins.connection import NetworkConnectionBase, ensure_connect
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_http as ctera_http
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+class Connection(NetworkConnectionBase):
+
+    transport = 'ctera.ctera.ctera_filer'
+    has_pipelining = False
+
+    def __init__(self, play_context, *args, **kwargs):
+        super().__init__(play_context, *args, **kwargs)
+        self._sessions = {}
+
+    def _connect(self):
+        if ctera_sdk.import_error() is not None:
+            raise AnsibleError(missing_required_lib('CTERASDK'))
+        if self.get_option('ctera_pool_size') < 1:
+            raise AnsibleError('ctera_pool_size must be at least 1')
+        self._connected = True
+
+    @ensure_connect
+    def get_session(self, host, username, password):
+        """
+        Return the cookies of an authenticated session, logging in only if there is no usable session for the host, user and password
+        """
+        key = (host, username, hashlib.sha256(to_bytes(password)).hexdigest())
+        session = self._sessions.get(key)
+        if session is None or time.time() - session['last_used'] > self.get_option('session_idle_timeout'):
+            # A session of the user that logged in with another password is not reused
+            self.invalidate_session(host, username)
+            session = dict(gateway=self._login(host, username, password))
+            self._sessions[key] = session
+        session['last_used'] = time.time()
+        return ctera_sdk.dict_from_cookiejar(session['gateway']._ctera_client.http_client.session.cookies)  # pylint: disable=protected-access
+
+    def invalidate_session(self, host, username):
+        """
+        Drop the sessions of the host and user, so that the next session is established with a new login
+        """
+        for key in [key for key in self._sessions if key[:2] == (host, username)]:
+            self._drop_session(key)
+
+    def close(self):
+        for key in list(self._sessions):
+            self._drop_session(key)
+        super().close()
+
+    def _login(self, host, username, password):
+        address, _, port = host.rpartition(':')
+        gateway = ctera_sdk.Gateway(address, int(port)) if address and port.isdigit() else ctera_sdk.Gateway(host)
+        ctera_http.configure(
+            gateway._ctera_client.http_client,  # pylint: disable=protected-access
+            pool_size=self.get_option('ctera_pool_size'),
+            connect_timeout=self.get_option('ctera_connect_timeout') or None,
+            read_timeout=self.get_option('ctera_read_timeout') or None,
+            keep_alive=self.get_option('ctera_keep_alive')
+        )
+        try:
+            gateway.login(username, password)
+        except ctera_sdk.CTERAException as error:
+            raise AnsibleError(ctera_sdk.tojsonstr(error, False))
+        self.queue_message('vvvv', 'Logged in to %s as %s' % (host, username))
+        return gateway
+
+    def _drop_session(self, key):
+        session = self._sessions.pop(key, None)
+        if session is None:
+            return
+        try:
+            session['gateway'].logout()
+        except ctera_sdk.CTERAException:
+            self.queue_message('vvvv', 'Failed to log out from %s' % key[0])
@@ -19,6 +19,110 @@ options:
     description: Password of the user
     required: True
     type: str
+  filer_port:
+    description: The HTTP port of the CTERA Networks Filer. Defaults to 80
+    type: int
+  session_cache:
+    description:
+    - Keep the authenticated session alive between tasks by storing its cookie in a local file readable only by the current user
+    - A cached session is validated before it is reused, and a new login is performed only if it has expired or was rejected by the Filer
+    - Ignored when the task runs over the ctera.ctera.ctera_filer connection
+    type: bool
+    default: False
+  session_cache_ttl:
+    description:
+    - Number of seconds a cached session may be reused
+    - Should be lower than the session timeout configured on the Filer
+    type: int
+    default: 600
+  session_cache_dir:
+    description: Directory of the session cache files. Defaults to ~/.ansible/ctera/sessions
+    type: path
+  ctera_timings:
+    description:
+    - Return the duration and outcome of every request made to the Filer in C(ctera_timings)
+    - The summary includes the number of requests, their total duration, the median and 95th percentile durations and the slowest request
+    - Enable the ctera.ctera.ctera_timings callback plugin to aggregate the timings of all the tasks in the play
+    type: bool
+    default: False
+  ctera_retries:
+    description:
+    - Number of times to retry a request that failed with a transient error, such as one of the I(ctera_retry_status_codes),
+      a connection error or a timeout
+    - Only the requests that read from the Filer, login and logout are retried, unless I(ctera_retry_mutations) is set
+    - The number of retries of each request is returned in C(ctera_retries)
+    type: int
+    default: 0
+  ctera_retry_backoff:
+    description: Number of seconds to wait before the first retry. The delay is doubled before each of the following retries
+    type: float
+    default: 1.0
+  ctera_retry_max_backoff:
+    description: Maximum number of seconds to wait before a retry
+    type: float
+    default: 30.0
+  ctera_retry_jitter:
+    description:
+    - Fraction of each delay that is randomized, between 0 and 1
+    - Randomized delays keep tasks that failed together from retrying together
+    type: float
+    default: 0.5
+  ctera_retry_status_codes:
+    description: The HTTP status codes of the responses that are retried
+    type: list
+    elements: int
+    default: [500, 502, 503, 504]
+  ctera_retry_mutations:
+    description:
+    - Retry also the requests that change the configuration of the Filer
+    - Enable only if repeating a change that may have been applied is harmless
+    type: bool
+    default: False
+  ctera_connect_timeout:
+    description:
+    - Number of seconds to wait for a connection to the Filer. Use 0 to wait indefinitely
+    - If not set, the value of the environment variable C(CTERA_CONNECT_TIMEOUT) is used
+    type: float
+    default: 10.0
+  ctera_read_timeout:
+    description:
+    - Number of seconds to wait for the Filer to respond to a request. Use 0 to wait indefinitely
+    - A request that timed out is retried if I(ctera_retries) is set
+    - If not set, the value of the environment variable C(CTERA_READ_TIMEOUT) is used
+    type: float
+    default: 60.0
+  ctera_pool_size:
+    description:
+    - Maximum number of connections to the Filer that are kept open for reuse
+    - If not set, the value of the environment variable C(CTERA_POOL_SIZE) is used
+    type: int
+    default: 10
+  ctera_keep_alive:
+    description:
+    - Reuse the connection to the Filer, and the TLS session established over it, for the following requests
+    - If disabled, every request opens a new connection and negotiates a new TLS session
+    - If not set, the value of the environment variable C(CTERA_KEEP_ALIVE) is used
+    type: bool
+    default: True
+  ctera_rate_limit:
+    description:
+    - Maximum number of requests per second to send to the Filer. Use 0 to leave the rate unlimited
+    - Can also be set for a host or a group with the ctera_rate_limit variable
+    - The number of requests that waited, and the total number of seconds they waited, are returned in C(ctera_throttle)
+    type: float
+    default: 0.0
+  ctera_rate_burst:
+    description:
+    - Number of requests that may be sent at once, before I(ctera_rate_limit) applies
+    - Can also be set for a host or a group with the ctera_rate_burst variable
+    type: int
+    default: 1
+  ctera_max_in_flight:
+    description:
+    - Maximum number of requests to the Filer that are in flight at the same time. Use 0 to leave the number unlimited
+    - Can also be set for a host or a group with the ctera_max_in_flight variable
+    type: int
+    default: 0
 
 requirements:
   - A physical or virtual CTERA-Networks Gateway
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: ctera_filers
+short_description: CTERA-Networks Edge Filers inventory source
+description:
+    - Adds the CTERA Edge Filers listed in a YAML configuration file whose name ends with C(ctera_filers.yml) or C(ctera_filers.yaml).
+    - Enriches each filer with its firmware version, its license and whether it is connected to CTERA Portal.
+    - Filers are queried concurrently. Filers that cannot be queried are added with C(ctera_reachable) set to False.
+    - With C(cache) enabled, the facts of each filer are reused until the cache expires,
+      and only the filers that are not in the cache, or could not be queried, are queried again.
+version_added: "2.10"
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+extends_documentation_fragment:
+    - inventory_cache
+    - constructed
+options:
+  plugin:
+    description: The name of this plugin, it should always be set to C(ctera.ctera.ctera_filers) for this plugin to recognize it as its own.
+    required: True
+    choices: ['ctera.ctera.ctera_filers']
+  filers:
+    description:
+    - The filers to add to the inventory
+    - Each filer is either its host name, or a dictionary with C(filer_host) and optionally C(name), the inventory host name,
+      and C(filer_user), C(filer_password) and C(filer_port) to override the options of the configuration file
+    type: list
+    elements: raw
+    required: True
+  filer_user:
+    description: User Name for communicating with the CTERA Networks Filers
+    type: str
+    env:
+      - name: CTERA_FILER_USER
+  filer_password:
+    description: Password of the user
+    type: str
+    env:
+      - name: CTERA_FILER_PASSWORD
+  filer_port:
+    description: The HTTP port of the CTERA Networks Filers. Defaults to 80
+    type: int
+  gather_facts:
+    description: Query each filer for its firmware version, license and Portal connection
+    type: bool
+    default: True
+  concurrency:
+    description: The maximum number of filers queried at any time
+    type: int
+    default: 20
+  connect_timeout:
+    description: Seconds to wait for a connection to a filer. C(0) waits indefinitely
+    type: float
+    default: 10
+    env:
+      - name: CTERA_CONNECT_TIMEOUT
+  read_timeout:
+    description: Seconds to wait for a filer to answer a request. C(0) waits indefinitely
+    type: float
+    default: 60
+    env:
+      - name: CTERA_READ_TIMEOUT
+  group:
+    description: The group to add all the filers to
+    type: str
+    default: ctera_filers
+requirements:
+    - cterasdk
+'''
+
+EXAMPLES = '''
+# filers.ctera_filers.yml
+plugin: ctera.ctera.ctera_filers
+filer_user: admin
+filers:
+  - 192.168.1.10
+  - name: tlv-filer
+    filer_host: 192.168.1.11
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.ansible/ctera/inventory
+cache_timeout: 3600
+keyed_groups:
+  - key: ctera_license
+    prefix: license
+groups:
+  disconnected: not ctera_cloud_connected
+'''
+
+import concurrent.futures
+import functools
+
+from ansible.errors import AnsibleParserError
+from ansible.module_utils.common.text.converters import to_text
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_http as ctera_http
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    """
+    Add CTERA Edge Filers to the inventory, enriched with facts that are cheap to query
+    """
+
+    NAME = 'ctera.ctera.ctera_filers'
+
+    filer_keys = ('filer_host', 'name', 'filer_user', 'filer_password', 'filer_port')
+
+    def verify_file(self, path):
+        return super().verify_file(path) and path.endswith(('ctera_filers.yml', 'ctera_filers.yaml'))
+
+    def parse(self, inventory, loader, path, cache=True):
+        super().parse(inventory, loader, path, cache=cache)
+        self._read_config_data(path)
+        if ctera_sdk.import_error() is not None:
+            raise AnsibleParserError('The ctera.ctera.ctera_filers inventory plugin requires cterasdk')
+        filers = [self._filer(filer) for filer in self.get_option('filers')]
+
+        facts = {}
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+        if use_cache:
+            try:
+                facts = dict(self._cache[cache_key])
+            except KeyError:
+                update_cache = True
+
+        if self.get_option('gather_facts'):
+            missing = [filer for filer in filers if not facts.get(self._address(filer), {}).get('ctera_reachable')]
+            if missing:
+                facts.update(zip([self._address(filer) for filer in missing], self._gather_all(missing)))
+                update_cache = update_cache or self.get_option('cache')
+        if update_cache:
+            self._cache[cache_key] = facts
+
+        for filer in filers:
+            self._add_filer(filer, facts.get(self._address(filer), {}))
+
+    def _filer(self, filer):
+        if isinstance(filer, dict):
+            unknown = set(filer) - set(InventoryModule.filer_keys)
+            if unknown or 'filer_host' not in filer:
+                raise AnsibleParserError('Each filer must be a host name or a dictionary with filer_host and optionally %s. Got: %s' % (
+                    ', '.join(InventoryModule.filer_keys[1:]), ', '.join(sorted(filer))
+                ))
+            filer = dict(filer)
+        else:
+            filer = dict(filer_host=to_text(filer))
+        for key in ('filer_user', 'filer_password', 'filer_port'):
+            filer.setdefault(key, self.get_option(key))
+        return filer
+
+    @staticmethod
+    def _address(filer):
+        if filer['filer_port'] is None:
+            return filer['filer_host']
+        return '%s:%s' % (filer['filer_host'], filer['filer_port'])
+
+    def _gather_all(self, filers):
+        ctera_sdk.config.Logging.get().disable()  # The SDK logs to stdout, which belongs to Ansible on the controller
+        gather = functools.partial(
+            self._gather,
+            connect_timeout=self.get_option('connect_timeout') or None,
+            read_timeout=self.get_option('read_timeout') or None
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(self.get_option('concurrency'), len(filers)))) as executor:
+            return list(executor.map(gather, filers))
+
+    @staticmethod
+    def _gather(filer, connect_timeout=None, read_timeout=None):
+        if filer['filer_port'] is None:
+            gateway = ctera_sdk.Gateway(filer['filer_host'])
+        else:
+            gateway = ctera_sdk.Gateway(filer['filer_host'], filer['filer_port'])
+        # The facts of a filer are queried one after the other, on a single connection
+        ctera_http.configure(
+            gateway._ctera_client.http_client,  # pylint: disable=protected-access
+            pool_size=1,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout
+        )
+        try:
+            gateway.login(filer['filer_user'], filer['filer_password'])
+            try:
+                return dict(
+                    ctera_reachable=True,
+                    ctera_firmware=gateway.get('/status/device/runningFirmware'),
+                    ctera_license=gateway.licenses.get(),
+                    ctera_cloud_connected=gateway.services.connected()
+                )
+            finally:
+                gateway.logout()
+        except ctera_sdk.CTERAException as error:
+            return dict(ctera_reachable=False, ctera_error=ctera_sdk.tojsonstr(error, False))
+
+    def _add_filer(self, filer, facts):
+        name = filer.get('name') or filer['filer_host']
+        group = self.inventory.add_group(self.get_option('group'))
+        self.inventory.add_host(name, group=group)
+        self.inventory.set_variable(name, 'ansible_host', filer['filer_host'])
+        self.inventory.set_variable(name, 'filer_host', filer['filer_host'])
+        if filer['filer_port'] is not None:
+            self.inventory.set_variable(name, 'filer_port', filer['filer_port'])
+        for key, value in facts.items():
+            self.inventory.set_variable(name, key, value)
+
+        strict = self.get_option('strict')
+        hostvars = self.inventory.get_host(name).get_vars()
+        self._set_composite_vars(self.get_option('compose'), hostvars, name, strict=strict)
+        self._add_host_to_composed_groups(self.get_option('groups'), hostvars, name, strict=strict)
+        self._add_host_to_keyed_groups(self.get_option('keyed_groups'), hostvars, name, strict=strict)
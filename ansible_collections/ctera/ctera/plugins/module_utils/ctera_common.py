@@ -20,15 +20,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import traceback
+import hashlib
+import json
 
-try:
-    from cterasdk import CTERAException
-    CTERASDK_IMP_ERR = None
-    HAS_CTERASDK = True
-except ImportError:  # pragma: no cover
-    CTERASDK_IMP_ERR = traceback.format_exc()
-    HAS_CTERASDK = False
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
 
 
 class Object:
@@ -70,6 +65,16 @@ class AnsibleReturnValue:  # pylint: disable=attribute-defined-outside-init
             self.param.warnings.append(warning)
         return self
 
+    def diff(self, before, after, header=None):
+        diff = dict(before=before, after=after)
+        if header is not None:
+            diff['before_header'] = diff['after_header'] = header
+        if not hasattr(self.param, 'diff'):
+            self.param.diff = [diff]
+        else:
+            self.param.diff.append(diff)
+        return self
+
     def put(self, **kwargs):
         for key, value in kwargs.items():
             setattr(self.param, key, value)
@@ -83,7 +88,7 @@ def object_exists(ctera_host, path):
     try:
         ctera_object = ctera_host.get(path)
         return (True, ctera_object)
-    except CTERAException:
+    except ctera_sdk.CTERAException:
         return (False, None)
 
 
@@ -99,6 +104,20 @@ def filter_parameters(parameters, filter_list):
     return {k: v for k, v in parameters.items() if k in filter_list}
 
 
+def object_to_dict(ctera_object):
+    ''' converts an object returned by the CTERA host into plain dicts and lists
+        :param: ctera_object: object, list or value returned by the CTERA host
+        :return: the object with its public attributes as a dict
+    '''
+    if isinstance(ctera_object, dict):
+        return {k: object_to_dict(v) for k, v in ctera_object.items() if not k.startswith("_")}
+    if isinstance(ctera_object, (list, tuple)):
+        return [object_to_dict(item) for item in ctera_object]
+    if hasattr(ctera_object, '__dict__'):
+        return object_to_dict(ctera_object.__dict__)
+    return ctera_object
+
+
 def cmp(a, b):
     """
     Python 3 does not have a cmp function, this will do the cmp.
@@ -124,6 +143,55 @@ def cmp(a, b):
     return (a > b) - (a < b)
 
 
+def freeze(item):
+    ''' returns a hashable representation of an item, that is equal for items that are equal
+        :param: item: a value, dict, list or set
+        :return: hashable representation of the item
+    '''
+    if isinstance(item, dict):
+        return frozenset((key, freeze(value)) for key, value in item.items())
+    if isinstance(item, (list, tuple)):
+        return tuple(freeze(value) for value in item)
+    if isinstance(item, (set, frozenset)):
+        return frozenset(freeze(value) for value in item)
+    return item
+
+
+def canonical(item):
+    ''' returns a representation of an item that is equal for items that get_modified_attributes considers equal.
+        The elements of lists are sorted. Strings are in lower case only where cmp compares them, that is the item
+        itself or the values of its attributes. Nested dicts and the elements of lists are compared as they are
+        :param: item: a value, or a dict of attributes
+        :return: canonical representation of the item
+    '''
+    if isinstance(item, dict):
+        return {key: _canonical_attribute(value) for key, value in item.items()}
+    return _canonical_attribute(item)
+
+
+def _canonical_attribute(value):
+    if isinstance(value, str):
+        return value.lower()
+    return _canonical_value(value)
+
+
+def _canonical_value(value):
+    if isinstance(value, dict):
+        return {key: _canonical_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return sorted((_canonical_value(item) for item in value), key=lambda item: json.dumps(item, sort_keys=True))
+    return value
+
+
+def fingerprint(item):
+    ''' returns a stable hash of the canonical representation of an item
+        :param: item: a value, dict or list
+        :return: hex digest of the SHA256 of the item
+        :rtype: str
+    '''
+    return hashlib.sha256(json.dumps(canonical(item), sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
 def compare_lists(current, desired, get_list_diff):
     ''' compares two lists and return a list of elements that are either the desired elements or elements that are
         modified from the current state depending on the get_list_diff flag
@@ -133,15 +201,34 @@ def compare_lists(current, desired, get_list_diff):
         :return: list of attributes to be modified
         :rtype: list
     '''
-    desired_diff_list = [item for item in desired if item not in current]  # get what in desired and not in current
-    current_diff_list = [item for item in current if item not in desired]  # get what in current but not in desired
-
-    if desired_diff_list or current_diff_list:
-        # there are changes
-        if get_list_diff:
-            return desired_diff_list
-        return desired
-    return []
+    current_set = {freeze(item) for item in current}
+    desired_set = {freeze(item) for item in desired}
+    if current_set == desired_set:
+        return []
+    # there are changes
+    if get_list_diff:
+        return [item for item in desired if freeze(item) not in current_set]  # get what in desired and not in current
+    return desired
+
+
+def get_list_delta(current, desired, key):
+    ''' compares two lists of dicts that are identified by the values of the key attributes
+        :param: current: current list
+        :param: desired: list from playbook
+        :param: key: tuple of the attribute names that identify an element
+        :return: dict of the elements that were added, removed or changed in desired w.r.t current
+        :rtype: dict
+    '''
+    current_index = {tuple(item[attribute] for attribute in key): item for item in current}
+    desired_index = {tuple(item[attribute] for attribute in key): item for item in desired}
+    return dict(
+        added=[item for item_key, item in desired_index.items() if item_key not in current_index],
+        removed=[item for item_key, item in current_index.items() if item_key not in desired_index],
+        changed=[
+            item for item_key, item in desired_index.items()
+            if item_key in current_index and freeze(item) != freeze(current_index[item_key])
+        ]
+    )
 
 
 def get_modified_attributes(current, desired, get_list_diff=False):
@@ -194,3 +281,19 @@ def set_result(ansible_module, messages):
 
     if message:
         ansible_module.ctera_return_value().msg(message)
+
+
+def set_diff(ansible_module, current, modified_attributes, header=None):
+    ''' adds the before and after values of the modified attributes to the diff of the result
+        :param: ansible_module: the ansible module
+        :param: current: current attributes, or None if the item is created
+        :param: modified_attributes: the modified attributes, or None if the item is deleted
+        :param: header: name of the item in the diff
+    '''
+    if current is None:
+        before, after = {}, modified_attributes
+    elif modified_attributes is None:
+        before, after = current, {}
+    else:
+        before, after = {k: current.get(k) for k in modified_attributes}, modified_attributes
+    ansible_module.ctera_return_value().diff(before, after, header)
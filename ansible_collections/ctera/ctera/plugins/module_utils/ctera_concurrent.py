@@ -0,0 +1,43 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+def fetch(calls, max_workers=1):
+    ''' runs independent reads from the filer concurrently
+        :param: calls: list of functions that take no arguments, each making its own requests
+        :param: max_workers: maximum number of functions that run at the same time. Should not exceed the size of the connection pool
+        :return: the results of the functions, in the order of the functions
+        :rtype: list
+        :raises: the exception raised by the first function that failed, in the order of the functions
+    '''
+    if max_workers < 2 or len(calls) < 2:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        futures = [executor.submit(call) for call in calls]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
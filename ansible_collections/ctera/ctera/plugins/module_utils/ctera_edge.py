@@ -20,13 +20,18 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ansible.module_utils.basic import AnsibleModule, missing_required_lib
-import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import copy
 
-try:
-    from cterasdk import Gateway, CTERAException, tojsonstr
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+from ansible.module_utils.basic import AnsibleModule, env_fallback, missing_required_lib
+from ansible.module_utils.connection import Connection, ConnectionError  # pylint: disable=redefined-builtin
+from ansible.module_utils._text import to_text
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_http as ctera_http
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_in_process as ctera_in_process
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_gateway_proxy import GatewayProxy, CheckModeInterceptor, ReadCacheInterceptor, \
+    RetryInterceptor, TimingInterceptor, RateLimitInterceptor
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_session_cache import SessionCache
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
 
 
 class GatewayAnsibleModule(AnsibleModule):
@@ -34,7 +39,25 @@ class GatewayAnsibleModule(AnsibleModule):
     default_argument_spec = {
         'filer_host': dict(type='str', required=True),
         'filer_user': dict(type='str', required=True),
-        'filer_password': dict(type='str', required=True, no_log=True)
+        'filer_password': dict(type='str', required=True, no_log=True),
+        'filer_port': dict(type='int'),
+        'session_cache': dict(type='bool', default=False),
+        'session_cache_ttl': dict(type='int', default=600),
+        'session_cache_dir': dict(type='path'),
+        'ctera_timings': dict(type='bool', default=False),
+        'ctera_retries': dict(type='int', default=0),
+        'ctera_retry_backoff': dict(type='float', default=1.0),
+        'ctera_retry_max_backoff': dict(type='float', default=30.0),
+        'ctera_retry_jitter': dict(type='float', default=0.5),
+        'ctera_retry_status_codes': dict(type='list', elements='int', default=[500, 502, 503, 504]),
+        'ctera_retry_mutations': dict(type='bool', default=False),
+        'ctera_connect_timeout': dict(type='float', default=10.0, fallback=(env_fallback, ['CTERA_CONNECT_TIMEOUT'])),
+        'ctera_read_timeout': dict(type='float', default=60.0, fallback=(env_fallback, ['CTERA_READ_TIMEOUT'])),
+        'ctera_pool_size': dict(type='int', default=10, fallback=(env_fallback, ['CTERA_POOL_SIZE'])),
+        'ctera_keep_alive': dict(type='bool', default=True, fallback=(env_fallback, ['CTERA_KEEP_ALIVE'])),
+        'ctera_rate_limit': dict(type='float', default=0.0),
+        'ctera_rate_burst': dict(type='int', default=1),
+        'ctera_max_in_flight': dict(type='int', default=0)
     }
 
     def __init__(
@@ -46,38 +69,191 @@ class GatewayAnsibleModule(AnsibleModule):
             required_together=None,
             required_one_of=None,
             add_file_common_args=False,
-            supports_check_mode=False,
+            supports_check_mode=True,
             required_if=None,
             required_by=None):  # pylint: disable=too-many-arguments
         argument_spec.update(GatewayAnsibleModule.default_argument_spec)
         super().__init__(argument_spec, bypass_checks=bypass_checks, no_log=no_log, mutually_exclusive=mutually_exclusive, required_together=required_together,
                          required_one_of=required_one_of, add_file_common_args=add_file_common_args, supports_check_mode=supports_check_mode,
                          required_if=required_if, required_by=required_by or {})
-        if not ctera_common.HAS_CTERASDK:
-            self.fail_json(msg=missing_required_lib('CTERASDK'), exception=ctera_common.CTERASDK_IMP_ERR)
-        self._ctera_filer = Gateway(self.params['filer_host'])
+        # The SDK is imported only now, after the arguments were validated
+        cterasdk_import_error = ctera_sdk.import_error()
+        if cterasdk_import_error is not None:
+            self.fail_json(msg=missing_required_lib('CTERASDK'), exception=cterasdk_import_error)
+        if self.params['ctera_pool_size'] < 1:
+            self.fail_json(msg='ctera_pool_size must be at least 1')
+        if not 0 <= self.params['ctera_retry_jitter'] <= 1:
+            self.fail_json(msg='ctera_retry_jitter must be between 0 and 1')
+        if self.params['ctera_retry_backoff'] < 0:
+            self.fail_json(msg='ctera_retry_backoff must not be negative')
+        if self.params['ctera_rate_burst'] < 1:
+            self.fail_json(msg='ctera_rate_burst must be at least 1')
+        if self.params['filer_port'] is None:
+            self._ctera_filer = ctera_sdk.Gateway(self.params['filer_host'])
+        else:
+            self._ctera_filer = ctera_sdk.Gateway(self.params['filer_host'], self.params['filer_port'])
+        ctera_http.configure(
+            self._ctera_http_client(),
+            pool_size=self.params['ctera_pool_size'],
+            connect_timeout=self.params['ctera_connect_timeout'] or None,
+            read_timeout=self.params['ctera_read_timeout'] or None,
+            keep_alive=self.params['ctera_keep_alive']
+        )
         self._ctera_return_value = ctera_common.AnsibleReturnValue()
+        self._ctera_keep_session = False
+        self._ctera_read_cache = ReadCacheInterceptor()
+        self._ctera_interceptors = [CheckModeInterceptor()] if self.check_mode else []
+        self._ctera_interceptors.append(self._ctera_read_cache)
+        self._ctera_retry = None
+        if self.params['ctera_retries'] > 0:
+            self._ctera_retry = RetryInterceptor(
+                self.params['ctera_retries'],
+                backoff=self.params['ctera_retry_backoff'],
+                max_backoff=self.params['ctera_retry_max_backoff'],
+                jitter=self.params['ctera_retry_jitter'],
+                status_codes=self.params['ctera_retry_status_codes'],
+                retry_mutations=self.params['ctera_retry_mutations']
+            )
+            self._ctera_interceptors.append(self._ctera_retry)
+        self._ctera_rate_limit = None
+        if self.params['ctera_rate_limit'] > 0 or self.params['ctera_max_in_flight'] > 0:
+            # After the read cache and the retries, so that cached reads are not limited, and every attempt of a retried call is
+            self._ctera_rate_limit = RateLimitInterceptor(
+                rate=max(self.params['ctera_rate_limit'], 0),
+                burst=self.params['ctera_rate_burst'],
+                max_in_flight=max(self.params['ctera_max_in_flight'], 0)
+            )
+            self._ctera_interceptors.append(self._ctera_rate_limit)
+        self._ctera_timings = TimingInterceptor() if self.params['ctera_timings'] else None
+        if self._ctera_timings is not None:
+            self._ctera_interceptors.append(self._ctera_timings)
+        self._ctera_gateway_proxy = GatewayProxy(self._ctera_filer, self._ctera_interceptors)
+
+    def _load_params(self):
+        invocation = ctera_in_process.current()
+        if invocation is None:
+            super()._load_params()
+        else:
+            self.params = copy.deepcopy(invocation.args)
+
+    def _record_module_result(self, o):
+        invocation = ctera_in_process.current()
+        if invocation is None:
+            super()._record_module_result(o)
+        else:
+            invocation.result = o
 
     def ctera_filer(self, login=True):
         if login:
             self.ctera_login()
-        return self._ctera_filer
+        return self._ctera_gateway_proxy
 
     def ctera_login(self):
+        if self._socket_path:
+            self._ctera_login_persistent()
+            return
+        session_cache = self._ctera_session_cache()
+        if session_cache is not None and self._ctera_login_cached(session_cache):
+            return
+        try:
+            self._ctera_gateway_proxy.login(self.params['filer_user'], self.params['filer_password'])
+        except ctera_sdk.CTERAException as error:
+            self._ctera_return_value.failed().msg('Login failed. Exception: %s' % ctera_sdk.tojsonstr(error, False))
+            self.ctera_exit()
+        else:
+            if session_cache is not None:
+                session_cache.store(self._ctera_filer_address(), self.params['filer_user'], self.params['filer_password'], self._ctera_session_cookies())
+                self._ctera_keep_session = True
+
+    def _ctera_session_cache(self):
+        if not self.params['session_cache']:
+            return None
+        return SessionCache(self.params['session_cache_dir'], self.params['session_cache_ttl'])
+
+    def _ctera_login_cached(self, session_cache):
+        cookies = session_cache.load(self._ctera_filer_address(), self.params['filer_user'], self.params['filer_password'])
+        if not cookies:
+            return False
+        self._ctera_adopt_session(cookies)
+        if not self._ctera_session_valid():
+            session_cache.invalidate(self._ctera_filer_address(), self.params['filer_user'])
+            self._ctera_session_cookies_jar().clear()
+            return False
+        self._ctera_keep_session = True
+        return True
+
+    def _ctera_login_persistent(self):
+        connection = Connection(self._socket_path)
+        if not self._ctera_borrow_session(connection):
+            return
+        if not self._ctera_session_valid():
+            # The filer ended the session, for example when it restarted or the session expired, so the connection logs in again
+            self._ctera_session_cookies_jar().clear()
+            if not self._ctera_borrow_session(connection, invalidate=True):
+                return
+        self._ctera_keep_session = True
+
+    def _ctera_borrow_session(self, connection, invalidate=False):
         try:
-            self._ctera_filer.login(self.params['filer_user'], self.params['filer_password'])
-        except CTERAException as error:
-            self._ctera_return_value.failed().msg('Login failed. Exception: %s' % tojsonstr(error, False))
+            if invalidate:
+                connection.invalidate_session(self._ctera_filer_address(), self.params['filer_user'])
+            cookies = connection.get_session(self._ctera_filer_address(), self.params['filer_user'], self.params['filer_password'])
+        except ConnectionError as error:
+            self._ctera_return_value.failed().msg('Login failed. Exception: %s' % to_text(error))
             self.ctera_exit()
+            return False
+        self._ctera_adopt_session(cookies)
+        return True
+
+    def _ctera_session_valid(self):
+        try:
+            self._ctera_gateway_proxy.get('/config/device/hostname')
+        except ctera_sdk.CTERAException:
+            return False
+        return True
+
+    def _ctera_filer_address(self):
+        if self.params['filer_port'] is None:
+            return self.params['filer_host']
+        return '%s:%d' % (self.params['filer_host'], self.params['filer_port'])
+
+    def _ctera_adopt_session(self, cookies):
+        self._ctera_session_cookies_jar().update(cookies)
+        ctera_sdk.gateway_session.start_local_session(self._ctera_filer, self.params['filer_host'], self.params['filer_user'])
+
+    def _ctera_http_client(self):
+        return self._ctera_filer._ctera_client.http_client  # pylint: disable=protected-access
+
+    def _ctera_session_cookies_jar(self):
+        return self._ctera_http_client().session.cookies
+
+    def _ctera_session_cookies(self):
+        return ctera_sdk.dict_from_cookiejar(self._ctera_session_cookies_jar())
+
+    def ctera_invalidate_read_cache(self):
+        self._ctera_read_cache.invalidate()
 
     def ctera_logout(self):
-        self._ctera_filer.logout()
+        if self._ctera_keep_session:
+            return
+        self._ctera_gateway_proxy.logout()
 
     def ctera_return_value(self):
         return self._ctera_return_value
 
     def ctera_exit(self):
+        result = dict(self._ctera_return_value.as_dict())
+        if not self._diff:
+            result.pop('diff', None)
+        if self._ctera_read_cache.saved_calls:
+            result['ctera_api_calls_saved'] = self._ctera_read_cache.saved_calls
+        if self._ctera_retry is not None and self._ctera_retry.retried_calls:
+            result['ctera_retries'] = self._ctera_retry.summary()
+        if self._ctera_rate_limit is not None:
+            result['ctera_throttle'] = self._ctera_rate_limit.summary()
+        if self._ctera_timings is not None:
+            result['ctera_timings'] = self._ctera_timings.summary()
         if self._ctera_return_value.has_failed():
-            self.fail_json(**self._ctera_return_value.as_dict())
+            self.fail_json(**result)
         else:
-            self.exit_json(**self._ctera_return_value.as_dict())
+            self.exit_json(**result)
@@ -22,16 +22,12 @@ __metaclass__ = type
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge import GatewayAnsibleModule
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
-
-try:
-    from cterasdk import CTERAException, tojsonstr
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
 
 
 class CteraFilerBase(object):
 
-    def __init__(self, ansible_module_args, supports_check_mode=False, required_if=None, login=True, required_by=None):
+    def __init__(self, ansible_module_args, supports_check_mode=True, required_if=None, login=True, required_by=None):
         required_if = required_if or []
         self.ansible_module = GatewayAnsibleModule(
             ansible_module_args,
@@ -42,14 +38,16 @@ class CteraFilerBase(object):
         self.parameters = ctera_common.get_parameters(self.ansible_module.params)
         self._ctera_filer = None
         self._login = login
+        self._logout = True
 
     def run(self):
         self._ctera_filer = self.ansible_module.ctera_filer(login=self._login)
         try:
             self._execute()
-        except CTERAException as error:
-            self.ansible_module.ctera_return_value().failed().msg(self._generic_failure_message + (' Exception: %s' % tojsonstr(error, False)))
-        self.ansible_module.ctera_logout()
+        except ctera_sdk.CTERAException as error:
+            self.ansible_module.ctera_return_value().failed().msg(self._generic_failure_message + (' Exception: %s' % ctera_sdk.tojsonstr(error, False)))
+        if self._logout:
+            self.ansible_module.ctera_logout()
         self.ansible_module.ctera_exit()
 
     @property
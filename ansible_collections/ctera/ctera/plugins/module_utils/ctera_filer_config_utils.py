@@ -0,0 +1,645 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_utils as ctera_filer_share_utils
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+def to_network_dict(config):
+    return dict(
+        mode='dynamic' if config.DHCPMode == ctera_sdk.gateway_enum.Mode.Enabled else 'static',
+        address=config.address,
+        subnet=config.netmask,
+        gateway=config.gateway,
+        primary_dns_server=config.DNSServer1,
+        secondary_dns_server=config.DNSServer2
+    )
+
+
+def to_domain_dict(config):
+    return {k: v for k, v in config.__dict__.items() if not k.startswith("_")}
+
+
+def to_volume_dict(volume):
+    return {k: v for k, v in volume.__dict__.items() if not k.startswith("_")}
+
+
+def to_syslog_dict(config):
+    config_dict = {k: v for k, v in config.__dict__.items() if not k.startswith("_")}
+    config_dict['min_severity'] = config_dict.pop('minSeverity', None)
+    return config_dict
+
+
+def to_smb_dict(config):
+    return {k: v for k, v in config.__dict__.items() if not k.startswith("_")}
+
+
+def to_nfs_dict(config):
+    return dict(
+        mode=config.mode,
+        async_write=(getattr(config, 'async') == ctera_sdk.gateway_enum.Mode.Enabled),
+        aggregate_writes=(config.aggregateWrites == ctera_sdk.gateway_enum.Mode.Enabled),
+    )
+
+
+def to_ftp_dict(config):
+    return dict(
+        mode=config.mode,
+        allow_anonymous_ftp=config.AllowAnonymousFTP,
+        anonymous_download_limit=config.AnonymousDownloadLimit,
+        anonymous_ftp_folder=config.AnonymousFTPFolder,
+        banner_message=config.BannerMessage,
+        max_connections_per_ip=config.MaxConnectionsPerIP,
+        require_ssl=config.RequireSSL
+    )
+
+
+def to_rsync_dict(config):
+    return dict(
+        server=config.server,
+        port=config.port,
+        max_connections=config.maxConnections,
+    )
+
+
+static_ip_params = ['address', 'subnet', 'gateway', 'primary_dns_server', 'secondary_dns_server']
+syslog_enable_params = ['server', 'port', 'proto', 'min_severity']
+
+
+def is_enabled(config, mode_field='mode'):
+    ''' whether a service, such as SMB or Syslog, is enabled, given its configuration '''
+    return config[mode_field] == ctera_sdk.gateway_enum.Mode.Enabled
+
+
+def static_ip_modified_attributes(current, desired):
+    ''' returns the attributes that setting the desired static IP configuration modifies, or None if the filer already has it
+        :param: current: the current network configuration, as returned by to_network_dict
+        :param: desired: the desired static IP configuration
+    '''
+    modified_attributes = ctera_common.get_modified_attributes(current, desired)
+    if current['mode'] == 'static' and not modified_attributes:
+        return None
+    return modified_attributes
+
+
+def modified_dns_servers(current, desired):
+    ''' returns the DNS servers to set, or None if the desired configuration sets none or the filer already has them
+        :param: current: the current network configuration, as returned by to_network_dict
+        :param: desired: the desired network configuration
+    '''
+    dns_servers = dict(primary_dns_server=desired.get('primary_dns_server'), secondary_dns_server=desired.get('secondary_dns_server'))
+    if not dns_servers['primary_dns_server'] or all(current[key] == value for key, value in dns_servers.items()):
+        return None
+    return dns_servers
+
+
+class Change(object):
+    """
+    A change that a section of the configuration makes to the filer
+
+    :param str description: What the change does, such as 'Enable DHCP'
+    :param callable apply: Makes the change, given the filer
+    :param dict current: The current attributes, or None if the change creates an item
+    :param dict modified: The modified attributes, or None if the change deletes an item
+    :param str,optional header: The name of the item in the diff, defaults to the name of the section
+    :param tuple,optional setting: The path in the configuration database and the value of a setting that can be written together with
+                                   the settings next to it, instead of by apply
+    """
+
+    def __init__(self, description, apply, current, modified, header=None, setting=None):  # pylint: disable=too-many-arguments
+        self.description = description
+        self.apply = apply
+        self.current = current
+        self.modified = modified
+        self.header = header
+        self.setting = setting
+
+
+class Section(object):
+    """
+    A part of the configuration of the filer, such as its network or its shares, managed by the option of the same name
+    """
+
+    required_if = None
+    required_by = None
+    path = None
+
+    def __init__(self, name):
+        self.name = name
+
+    def options(self):  # pragma: no cover
+        raise NotImplementedError("Implementing classes must implement options")
+
+    def argument_spec(self):
+        spec = dict(type='dict', required=False, options=self.options())
+        if self.required_if:
+            spec['required_if'] = self.required_if
+        if self.required_by:
+            spec['required_by'] = self.required_by
+        return {self.name: spec}
+
+    def read(self, ctera_filer):  # pragma: no cover
+        raise NotImplementedError("Implementing classes must implement read")
+
+    def plan(self, current, parameters):  # pragma: no cover
+        """
+        Return the changes that bring the section from its current state to the state in the parameters of the module
+        """
+        raise NotImplementedError("Implementing classes must implement plan")
+
+
+class SettingSection(Section):
+    """
+    A single setting of the filer, such as its hostname
+
+    :param str,optional path: The path of the setting in the configuration database, for settings that are read and written with ConfigSettings
+    """
+
+    def __init__(self, name, getter, setter, path=None, **spec):
+        super().__init__(name)
+        self._getter = getter
+        self._setter = setter
+        self.path = path
+        self._spec = spec
+
+    def argument_spec(self):
+        return {self.name: dict(type='str', required=False, **self._spec)}
+
+    def read(self, ctera_filer):
+        return self._getter(ctera_filer)
+
+    def plan(self, current, parameters):
+        desired = parameters[self.name]
+        if desired == current:
+            return []
+        return [Change(
+            'Set %s to %s' % (self.name, desired), lambda ctera_filer: self._setter(ctera_filer, desired), {self.name: current}, {self.name: desired},
+            setting=(self.path, desired) if self.path else None
+        )]
+
+
+class ConfigSettings(object):
+    """
+    Scalar settings of the configuration database, such as device/hostname, read and written in as few requests as possible
+
+    The subtrees of /config that hold the settings are read in a single request. Settings are modified locally,
+    and each modified subtree is written back in a single request when the settings are committed.
+
+    :param list(str) paths: The paths of the settings, relative to /config
+    """
+
+    def __init__(self, ctera_filer, paths):
+        self._ctera_filer = ctera_filer
+        self._subtrees = {}
+        self._modified = []
+        subtrees = sorted({path.split('/')[0] for path in paths})
+        if subtrees:
+            config = self._ctera_filer.get_multi('/config', ['/' + subtree for subtree in subtrees])
+            self._subtrees = {subtree: getattr(config, subtree) for subtree in subtrees}
+
+    def get(self, path):
+        subtree, _, attribute = path.partition('/')
+        return getattr(self._subtrees[subtree], attribute)
+
+    def set(self, path, value):
+        subtree, _, attribute = path.partition('/')
+        setattr(self._subtrees[subtree], attribute, value)
+        if subtree not in self._modified:
+            self._modified.append(subtree)
+
+    def pending(self, path):
+        """
+        Whether the setting was modified and not written to the filer yet
+        """
+        return path.split('/')[0] in self._modified
+
+    def commit(self):
+        """
+        Write the modified subtrees to the filer
+        """
+        while self._modified:
+            subtree = self._modified[0]
+            self._ctera_filer.put('/config/' + subtree, self._subtrees[subtree])
+            self._modified.pop(0)
+
+
+class NetworkSection(Section):
+
+    required_if = [
+        ('mode', 'static', ['address', 'subnet', 'gateway', 'primary_dns_server'])
+    ]
+    required_by = dict(
+        secondary_dns_server=['primary_dns_server']
+    )
+
+    def options(self):
+        return dict(
+            mode=dict(required=False, type='str', choices=['dynamic', 'static'], default='dynamic'),
+            address=dict(type='str', required=False),
+            subnet=dict(type='str', required=False),
+            gateway=dict(type='str', required=False),
+            primary_dns_server=dict(type='str', required=False),
+            secondary_dns_server=dict(type='str', required=False)
+        )
+
+    def read(self, ctera_filer):
+        return to_network_dict(ctera_filer.network.ifconfig().ip)
+
+    def plan(self, current, parameters):
+        desired = ctera_common.get_parameters(parameters[self.name])
+        if desired.pop('mode') == 'static':
+            modified_attributes = static_ip_modified_attributes(current, desired)
+            if modified_attributes is None:
+                return []
+            static_params = ctera_common.filter_parameters(desired, static_ip_params)
+            return [Change('Set the IP configuration', lambda ctera_filer: ctera_filer.network.set_static_ipaddr(**static_params),
+                           current, dict(mode='static', **modified_attributes))]
+        changes = []
+        if current['mode'] != 'dynamic':
+            changes.append(Change('Enable DHCP', lambda ctera_filer: ctera_filer.network.enable_dhcp(), current, dict(mode='dynamic')))
+        dns_servers = modified_dns_servers(current, desired)
+        if dns_servers is not None:
+            changes.append(Change(
+                'Set the DNS servers',
+                lambda ctera_filer: ctera_filer.network.set_static_nameserver(
+                    dns_servers['primary_dns_server'], secondary_dns_server=dns_servers['secondary_dns_server']
+                ),
+                current, dns_servers
+            ))
+        return changes
+
+
+class DirectoryServicesSection(Section):
+
+    _connect_params = ['domain', 'username', 'password', 'ou']
+    required_if = [
+        ('state', 'connected', ['domain', 'username', 'password'])
+    ]
+
+    def options(self):
+        return dict(
+            state=dict(required=False, choices=['connected', 'disconnected'], default='connected'),
+            domain=dict(type='str', required=False),
+            username=dict(type='str', required=False),
+            password=dict(type='str', required=False, no_log=True),
+            ou=dict(type='str', required=False),
+            force_reconnect=dict(type='bool', required=False, default=False),
+        )
+
+    def read(self, ctera_filer):
+        return to_domain_dict(ctera_filer.directoryservice.get_connected_domain())
+
+    def plan(self, current, parameters):
+        desired = ctera_common.get_parameters(parameters[self.name])
+        connected_domain = current['domain']
+        changes = []
+        if connected_domain and (desired['state'] == 'disconnected' or connected_domain != desired['domain'] or desired['force_reconnect']):
+            changes.append(Change('Disconnect from %s' % connected_domain, lambda ctera_filer: ctera_filer.directoryservice.disconnect(),
+                                  dict(domain=connected_domain), dict(domain=None)))
+        if desired['state'] == 'connected' and (changes or not connected_domain):
+            connect_params = ctera_common.filter_parameters(desired, DirectoryServicesSection._connect_params)
+            changes.append(Change('Connect to %s' % desired['domain'], lambda ctera_filer: ctera_filer.directoryservice.connect(**connect_params),
+                                  dict(domain=connected_domain), dict(domain=desired['domain'])))
+        return changes
+
+
+class CloudServicesSection(Section):
+
+    _connect_params = ['server', 'user', 'password', 'ctera_license']
+
+    def options(self):
+        return dict(
+            state=dict(required=False, choices=['connected', 'disconnected'], default='connected'),
+            server=dict(type='str', required=True),
+            user=dict(type='str', required=True),
+            password=dict(type='str', required=True, no_log=True),
+            ctera_license=dict(type='str', required=False, default='EV16', choices=['EV8', 'EV16', 'EV32', 'EV64', 'EV128']),
+            force_reconnect=dict(type='bool', required=False, default=False),
+            sso=dict(type='bool', required=False, default=False),
+            trust_certificate=dict(type='bool', required=False, default=False)
+        )
+
+    def read(self, ctera_filer):
+        status = ctera_filer.services.get_status()
+        if not status.connected:
+            return dict(server=None, sso=False)
+        return dict(server=status.server_address, sso=ctera_filer.services.sso_enabled())
+
+    def plan(self, current, parameters):
+        desired = parameters[self.name]
+        changes = []
+        if desired['state'] == 'disconnected':
+            if current['server']:
+                changes.append(Change('Disconnect from %s' % current['server'], lambda ctera_filer: ctera_filer.services.disconnect(),
+                                      dict(server=current['server']), dict(server=None)))
+            return changes
+        if current['server'] != desired['server']:
+            connect_params = ctera_common.filter_parameters(desired, CloudServicesSection._connect_params)
+            changes.append(Change('Connect to %s' % desired['server'],
+                                  lambda ctera_filer: self._connect(ctera_filer, current['server'], connect_params, desired['trust_certificate']),
+                                  dict(server=current['server']), dict(server=desired['server'])))
+        elif desired['force_reconnect']:
+            changes.append(Change('Reconnect to %s' % desired['server'], lambda ctera_filer: ctera_filer.services.reconnect(),
+                                  dict(server=current['server']), dict(server=desired['server'])))
+        if current['sso'] != desired['sso']:
+            changes.append(Change('%s SSO' % ('Enable' if desired['sso'] else 'Disable'),
+                                  lambda ctera_filer: ctera_filer.services.enable_sso() if desired['sso'] else ctera_filer.services.disable_sso(),
+                                  dict(sso=current['sso']), dict(sso=desired['sso'])))
+        return changes
+
+    @staticmethod
+    def _connect(ctera_filer, connected_server, connect_params, trust_certificate):
+        if trust_certificate:
+            ctera_sdk.config.connect['ssl'] = 'Trust'
+        if connected_server:
+            ctera_filer.services.disconnect()
+        ctera_filer.services.connect(**connect_params)
+
+
+class VolumesSection(Section):
+
+    _create_params = ['name', 'size', 'filesystem', 'device', 'passphrase']
+
+    def options(self):
+        return dict(
+            state=dict(required=False, choices=['present', 'absent'], default='present'),
+            name=dict(type='str', required=True),
+            size=dict(type='int', required=False),
+            filesystem=dict(type='str', required=False),
+            device=dict(type='str', required=False),
+            passphrase=dict(type='str', required=False, no_log=True)
+        )
+
+    def argument_spec(self):
+        return {self.name: dict(type='list', required=False, elements='dict', options=self.options())}
+
+    def read(self, ctera_filer):
+        return {volume.name: to_volume_dict(volume) for volume in ctera_filer.volumes.get()}
+
+    def plan(self, current, parameters):
+        changes = []
+        for desired in _unique_items(parameters[self.name], 'name', 'Volumes'):
+            volume = current.get(desired['name'])
+            if desired.pop('state') == 'absent':
+                if volume:
+                    changes.append(self._delete(volume))
+            elif not volume:
+                changes.append(self._add(ctera_common.filter_parameters(desired, VolumesSection._create_params)))
+            elif ctera_common.get_modified_attributes(volume, desired).get('size') is not None:
+                changes.append(self._resize(volume, desired['size']))
+        return changes
+
+    @staticmethod
+    def _add(create_params):
+        return Change('Create volume %s' % create_params['name'], lambda ctera_filer: ctera_filer.volumes.add(**create_params),
+                      None, create_params, create_params['name'])
+
+    @staticmethod
+    def _resize(volume, size):
+        return Change('Resize volume %s' % volume['name'], lambda ctera_filer: ctera_filer.volumes.modify(volume['name'], size=size),
+                      volume, dict(size=size), volume['name'])
+
+    @staticmethod
+    def _delete(volume):
+        return Change('Delete volume %s' % volume['name'], lambda ctera_filer: ctera_filer.volumes.delete(volume['name']), volume, None, volume['name'])
+
+
+class SharesSection(Section):
+
+    def options(self):
+        return dict(
+            state=dict(required=False, choices=['present', 'absent'], default='present'),
+            **ctera_filer_share_utils.share_argument_spec()
+        )
+
+    def argument_spec(self):
+        return {
+            self.name: dict(type='list', required=False, elements='dict', options=self.options()),
+            'purge_shares': dict(type='bool', required=False, default=False)
+        }
+
+    def read(self, ctera_filer):
+        return {share.name: ctera_filer_share_utils.to_share_dict(share) for share in ctera_filer.shares.get()}
+
+    def plan(self, current, parameters):
+        changes = []
+        desired_shares = _unique_items(parameters[self.name], 'name', 'Shares')
+        for desired in desired_shares:
+            share = current.get(desired['name'])
+            if desired.pop('state') == 'absent':
+                if share:
+                    changes.append(self._delete(share))
+            elif not share:
+                changes.append(self._add(desired))
+            else:
+                modified_attributes = ctera_filer_share_utils.get_modified_share_attributes(share, desired)
+                if modified_attributes:
+                    changes.append(self._modify(share, modified_attributes))
+        if parameters.get('purge_shares'):
+            names = {desired['name'] for desired in desired_shares}
+            changes.extend(self._delete(current[name]) for name in sorted(set(current) - names))
+        return changes
+
+    @staticmethod
+    def _add(desired):
+        return Change('Create share %s' % desired['name'], lambda ctera_filer: ctera_filer_share_utils.add_share(ctera_filer, desired),
+                      None, ctera_common.filter_parameters(desired, ctera_filer_share_utils.add_params), desired['name'])
+
+    @staticmethod
+    def _modify(share, modified_attributes):
+        return Change('Modify share %s' % share['name'],
+                      lambda ctera_filer: ctera_filer_share_utils.modify_share(ctera_filer, share['name'], modified_attributes),
+                      share, modified_attributes, share['name'])
+
+    @staticmethod
+    def _delete(share):
+        return Change('Delete share %s' % share['name'], lambda ctera_filer: ctera_filer.shares.delete(share['name']), share, None, share['name'])
+
+
+class FileServiceSection(Section):
+    """
+    A file service that can be enabled, disabled and configured, such as SMB or NFS
+    """
+
+    def __init__(self, name, label, options, converter, mode_field='mode'):  # pylint: disable=too-many-arguments
+        super().__init__(name)
+        self.label = label
+        self._options = options
+        self._converter = converter
+        self._mode_field = mode_field
+
+    def options(self):
+        return dict(enabled=dict(type='bool', required=False, default=True), **self._options())
+
+    def manager(self, ctera_filer):
+        return getattr(ctera_filer, self.name)
+
+    def read(self, ctera_filer):
+        return self._converter(self.manager(ctera_filer).get_configuration())
+
+    def plan(self, current, parameters):
+        desired = ctera_common.get_parameters(parameters[self.name])
+        enabled = is_enabled(current, self._mode_field)
+        if not desired.pop('enabled'):
+            if not enabled:
+                return []
+            return [Change('Disable %s' % self.label, lambda ctera_filer: self.manager(ctera_filer).disable(),
+                           current, {self._mode_field: ctera_sdk.gateway_enum.Mode.Disabled})]
+        changes = []
+        if not enabled:
+            changes.append(Change('Enable %s' % self.label, lambda ctera_filer: self.manager(ctera_filer).enable(),
+                                  current, {self._mode_field: ctera_sdk.gateway_enum.Mode.Enabled}))
+        modified_attributes = ctera_common.get_modified_attributes(current, desired)
+        if modified_attributes:
+            changes.append(Change('Configure %s' % self.label, lambda ctera_filer: self._configure(ctera_filer, desired, modified_attributes, enabled),
+                                  current, modified_attributes))
+        return changes
+
+    def _configure(self, ctera_filer, desired, modified_attributes, enabled):
+        if not enabled:
+            # Enabling the service may change its configuration, so it is compared again, as the single-purpose modules do
+            modified_attributes = ctera_common.get_modified_attributes(self.read(ctera_filer), desired)
+        if modified_attributes:
+            self.manager(ctera_filer).modify(**modified_attributes)
+
+
+class SyslogSection(Section):
+
+    required_if = [('enabled', True, ['server'])]
+
+    def options(self):
+        return dict(
+            enabled=dict(type='bool', required=False, default=True),
+            server=dict(type='str', required=False),
+            port=dict(type='int', required=False, default=514),
+            proto=dict(type='str', required=False, default='UDP', choices=['TCP', 'UDP']),
+            min_severity=dict(
+                type='str',
+                required=False,
+                default='info',
+                choices=['emergency', 'alert', 'critical', 'error', 'warning', 'notice', 'info', 'debug']
+            )
+        )
+
+    def read(self, ctera_filer):
+        return to_syslog_dict(ctera_filer.syslog.get_configuration())
+
+    def plan(self, current, parameters):
+        desired = ctera_common.get_parameters(parameters[self.name])
+        enabled = is_enabled(current)
+        if not desired.pop('enabled'):
+            if not enabled:
+                return []
+            return [Change('Disable Syslog', lambda ctera_filer: ctera_filer.syslog.disable(), current, dict(mode=ctera_sdk.gateway_enum.Mode.Disabled))]
+        if not enabled:
+            enable_params = ctera_common.filter_parameters(desired, syslog_enable_params)
+            return [Change('Enable Syslog', lambda ctera_filer: ctera_filer.syslog.enable(**enable_params),
+                           current, dict(mode=ctera_sdk.gateway_enum.Mode.Enabled, **enable_params))]
+        modified_attributes = ctera_common.get_modified_attributes(current, desired)
+        if not modified_attributes:
+            return []
+        return [Change('Configure Syslog', lambda ctera_filer: ctera_filer.syslog.modify(**modified_attributes), current, modified_attributes)]
+
+
+def _unique_items(items, key, kind):
+    items = [ctera_common.get_parameters(item) for item in items]
+    names = [item[key] for item in items]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ctera_sdk.CTERAException(message="%s listed more than once: %s" % (kind, ', '.join(duplicates)))
+    return items
+
+
+def smb_options():
+    return dict(
+        packet_signing=dict(
+            type='str',
+            required=False,
+            default='Disabled',
+            choices=['Disabled', 'If client agrees', 'Required']
+        ),
+        idle_disconnect_time=dict(type='int', required=False, default=10),
+        compatibility_mode=dict(type='bool', required=False, default=False),
+        unix_extensions=dict(type='bool', required=False, default=True),
+        abe_enabled=dict(type='bool', required=False, default=False),
+    )
+
+
+def nfs_options():
+    return dict(
+        async_write=dict(type='bool', required=False, default=True),
+        aggregate_writes=dict(type='bool', required=False, default=True),
+    )
+
+
+def ftp_options():
+    return dict(
+        require_ssl=dict(type='bool', required=False, default=False),
+        max_connections_per_ip=dict(type='int', required=False, default=5),
+        banner_message=dict(type='str', required=False, default='Welcome to CTERA FTP.'),
+        allow_anonymous_ftp=dict(type='bool', required=False, default=False),
+        anonymous_ftp_folder=dict(type='str', required=False),
+        anonymous_download_limit=dict(type='int', required=False, default=0),
+    )
+
+
+def rsync_options():
+    return dict(
+        port=dict(type='int', required=False, default=873),
+        max_connections=dict(type='int', required=False, default=25),
+    )
+
+
+network = NetworkSection('network')
+directory_services = DirectoryServicesSection('directory_services')
+cloud_services = CloudServicesSection('cloud_services')
+volumes = VolumesSection('volumes')
+shares = SharesSection('shares')
+smb = FileServiceSection('smb', 'SMB', smb_options, to_smb_dict)
+nfs = FileServiceSection('nfs', 'NFS', nfs_options, to_nfs_dict)
+ftp = FileServiceSection('ftp', 'FTP', ftp_options, to_ftp_dict)
+rsync = FileServiceSection('rsync', 'RSync', rsync_options, to_rsync_dict, mode_field='server')
+syslog = SyslogSection('syslog')
+
+# In the order they are applied: each section may depend on the sections before it
+sections = [
+    SettingSection('hostname', lambda ctera_filer: ctera_filer.config.get_hostname(), lambda ctera_filer, value: ctera_filer.config.set_hostname(value),
+                   path='device/hostname'),
+    SettingSection('location', lambda ctera_filer: ctera_filer.config.get_location(), lambda ctera_filer, value: ctera_filer.config.set_location(value),
+                   path='device/location'),
+    SettingSection('timezone', lambda ctera_filer: ctera_filer.timezone.get_timezone(),
+                   lambda ctera_filer, value: ctera_filer.timezone.set_timezone(value), path='time/TimeZone'),
+    network,
+    directory_services,
+    cloud_services,
+    # After the Cloud Services, because connecting to them applies the license of the connection
+    SettingSection('license', lambda ctera_filer: ctera_filer.licenses.get(), lambda ctera_filer, value: ctera_filer.licenses.apply(value),
+                   choices=['EV8', 'EV16', 'EV32', 'EV64', 'EV128']),
+    volumes,
+    shares,
+    smb,
+    nfs,
+    ftp,
+    rsync,
+    syslog,
+]
@@ -0,0 +1,100 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_concurrent as ctera_concurrent
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_utils as ctera_filer_share_utils
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_user_utils as ctera_filer_user_utils
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+def _get_users(ctera_filer):
+    users = []
+    for user in ctera_filer.users.get():
+        user_dict = ctera_filer_user_utils.to_user_dict(user)
+        user_dict.pop('password', None)
+        users.append(user_dict)
+    return users
+
+
+gatherers = {
+    'hostname': lambda ctera_filer: ctera_filer.config.get_hostname(),
+    'location': lambda ctera_filer: ctera_filer.config.get_location(),
+    'timezone': lambda ctera_filer: ctera_filer.timezone.get_timezone(),
+    'license': lambda ctera_filer: ctera_filer.licenses.get(),
+    'network': lambda ctera_filer: ctera_common.object_to_dict(ctera_filer.network.ifconfig()),
+    'syslog': lambda ctera_filer: ctera_common.object_to_dict(ctera_filer.syslog.get_configuration()),
+    'smb': lambda ctera_filer: ctera_common.object_to_dict(ctera_filer.smb.get_configuration()),
+    'nfs': lambda ctera_filer: ctera_common.object_to_dict(ctera_filer.nfs.get_configuration()),
+    'ftp': lambda ctera_filer: ctera_common.object_to_dict(ctera_filer.ftp.get_configuration()),
+    'rsync': lambda ctera_filer: ctera_common.object_to_dict(ctera_filer.rsync.get_configuration()),
+    'shares': lambda ctera_filer: [ctera_filer_share_utils.to_share_dict(share) for share in ctera_filer.shares.get()],
+    'users': _get_users,
+    'volumes': lambda ctera_filer: ctera_common.object_to_dict(ctera_filer.volumes.get()),
+    'cloud_services': lambda ctera_filer: ctera_common.object_to_dict(ctera_filer.services.get_status()),
+    'cache': lambda ctera_filer: dict(enabled=ctera_filer.cache.is_enabled()),
+    'sync': lambda ctera_filer: dict(enabled=ctera_filer.sync.is_enabled(), status=ctera_common.object_to_dict(ctera_filer.sync.get_status())),
+}
+
+# The subsets that hold the state of the filer rather than its configuration, such as connection times, change on their own
+fingerprinted = sorted(set(gatherers) - {'cloud_services', 'sync'})
+
+
+def resolve_subset(gather_subset, subsets=None):
+    ''' resolves the gather_subset option into the names of the subsets to gather
+        :param: gather_subset: list of subset names, 'all', or subset names prefixed with '!' to exclude them
+        :param: subsets: the names of the subsets that can be gathered, defaults to all the subsets
+        :return: sorted list of subset names
+        :rtype: list
+    '''
+    subsets = set(subsets if subsets is not None else gatherers)
+    included = set()
+    excluded = set()
+    for subset in gather_subset:
+        exclude = subset.startswith('!')
+        name = subset[1:] if exclude else subset
+        if name != 'all' and name not in subsets:
+            raise ctera_sdk.CTERAException(message='Unknown subset: %s. Valid subsets are: %s' % (name, ', '.join(['all'] + sorted(subsets))))
+        names = set(subsets) if name == 'all' else {name}
+        if exclude:
+            excluded.update(names)
+        else:
+            included.update(names)
+    if not included and excluded:
+        included = set(subsets)
+    return sorted(included - excluded)
+
+
+def gather_facts(ctera_filer, subsets, max_workers=1):
+    ''' gathers the subsets, reading up to max_workers of them from the filer at the same time
+        :param: ctera_filer: the filer
+        :param: subsets: the names of the subsets to gather
+        :param: max_workers: maximum number of subsets that are read concurrently
+        :return: the facts of each subset, by the name of the subset
+        :rtype: dict
+    '''
+    facts = ctera_concurrent.fetch([lambda subset=subset: gatherers[subset](ctera_filer) for subset in subsets], max_workers=max_workers)
+    return dict(zip(subsets, facts))
+
+
+def gather_fingerprints(ctera_filer, subsets, max_workers=1):
+    return {subset: ctera_common.fingerprint(facts) for subset, facts in gather_facts(ctera_filer, subsets, max_workers=max_workers).items()}
@@ -0,0 +1,119 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+import uuid
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+RESTART = 'restart'
+CLOUD_SYNC = 'cloud_sync'
+
+# Seconds a filer may keep answering after a reboot or a reset was requested, before it stops to restart
+restart_grace = 60
+
+# Seconds the Cloud Sync service may remain idle after file eviction or the refresh of cloud folders was requested, before it starts the work
+sync_grace = 30
+
+
+def create_job(job_type, filer, port=None, **attributes):
+    ''' creates the handle of an operation that continues on the filer after the task returns
+        :param: job_type: the type of the job, which determines how its status is polled
+        :param: filer: the address of the filer that runs the job
+        :param: port: the port of the filer that runs the job, if not the default one
+        :return: the job handle, to be passed to the ctera_filer_job_status module
+        :rtype: dict
+    '''
+    return dict(id=uuid.uuid4().hex, type=job_type, filer=filer, port=port, started=round(time.time(), 3), **attributes)
+
+
+class RestartTracker(object):
+    """
+    Tracks a reboot or a reset. The job completes when the filer answers again after it stopped answering,
+    and fails if the filer did not stop answering within the grace period it had to stop.
+    Whether the filer stopped answering is recorded in the job, so that it is known to the next poll of the returned job.
+    """
+
+    needs_session = False
+
+    def __init__(self, job):
+        self._job = job
+
+    def poll(self, ctera_filer):
+        try:
+            ctera_filer.test()
+        except ctera_sdk.CTERAException:
+            self._job['stopped'] = True
+            return RUNNING, 'The filer is restarting'
+        if self._job.get('stopped'):
+            return COMPLETED, 'The filer is up and running'
+        grace = self._job.get('grace', restart_grace)
+        if time.time() - self._job['started'] >= grace:
+            return FAILED, 'The filer did not stop answering within %s seconds of the restart request' % grace
+        return RUNNING, 'Waiting for the filer to restart'
+
+
+class CloudSyncTracker(object):
+    """
+    Tracks file eviction and the refresh of cloud folders. The job completes when the Cloud Sync service is idle after it was busy,
+    or when it is still idle after the grace period it had to start the work has passed, and fails if the service reports an error.
+    Whether the service was busy is recorded in the job, so that it is known to the next poll of the returned job.
+    """
+
+    needs_session = True
+
+    busy = ('NotInitialized', 'InitializingConnection', 'ConnectingFolders', 'Syncing', 'Scanning', 'UpgradingDataBase', 'TakingSnapshot')
+    idle = ('Off', 'Connected', 'Synced')
+
+    def __init__(self, job):
+        self._job = job
+
+    def poll(self, ctera_filer):
+        status = ctera_filer.sync.get_status()
+        if status.id in self.busy:
+            self._job['busy'] = True
+            return RUNNING, 'Cloud Sync status: %s' % status.id
+        if status.id in self.idle:
+            if self._job.get('busy') or time.time() - self._job['started'] >= self._job.get('grace', sync_grace):
+                return COMPLETED, 'Cloud Sync status: %s' % status.id
+            return RUNNING, 'Waiting for Cloud Sync to start. Cloud Sync status: %s' % status.id
+        return FAILED, 'Cloud Sync status: %s%s' % (status.id, '. %s' % status.message if getattr(status, 'message', None) else '')
+
+
+trackers = {
+    RESTART: RestartTracker,
+    CLOUD_SYNC: CloudSyncTracker,
+}
+
+
+def get_tracker(job):
+    ''' returns the tracker that polls the status of a job
+        :param: job: a job handle, as returned by create_job
+    '''
+    tracker = trackers.get(job.get('type'))
+    if tracker is None:
+        raise ctera_sdk.CTERAException(message='Unknown job type: %s. Valid types are: %s' % (job.get('type'), ', '.join(sorted(trackers))))
+    return tracker(job)
@@ -22,11 +22,8 @@ __metaclass__ = type
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
-
-try:
-    from cterasdk import gateway_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
 
 
 class CteraFilerShareConfigBase(CteraFilerBase):
@@ -69,16 +66,19 @@ class CteraFilerShareConfigBase(CteraFilerBase):
             'changed': [],
             'skipped': []
         }
-        if current_config[self._mode_field] == gateway_enum.Mode.Enabled:
+        if ctera_filer_config_utils.is_enabled(current_config, self._mode_field):
             messages['skipped'].append('%s already enabled' % self._share_type)
         else:
             self._manager.enable()
+            ctera_common.set_diff(self.ansible_module, current_config, {self._mode_field: ctera_sdk.gateway_enum.Mode.Enabled})
             messages['changed'].append('%s enabled' % self._share_type)
 
+        # Served by the read cache of the module unless the server was just enabled
         current_config = self._get_current_config()
         modified_attributes = ctera_common.get_modified_attributes(current_config, self.parameters)
         if modified_attributes:
             self._manager.modify(**modified_attributes)
+            ctera_common.set_diff(self.ansible_module, current_config, modified_attributes)
             messages['changed'].append('%s configuration updated' % self._share_type)
         else:
             messages['skipped'].append('%s configuration already up to date' % self._share_type)
@@ -86,8 +86,9 @@ class CteraFilerShareConfigBase(CteraFilerBase):
         ctera_common.set_result(self.ansible_module, messages)
 
     def _ensure_disabled(self, current_config):
-        if current_config[self._mode_field] == gateway_enum.Mode.Enabled:
+        if ctera_filer_config_utils.is_enabled(current_config, self._mode_field):
             self._manager.disable()
+            ctera_common.set_diff(self.ansible_module, current_config, {self._mode_field: ctera_sdk.gateway_enum.Mode.Disabled})
             self.ansible_module.ctera_return_value().changed().msg('%s server disabled' % self._share_type)
         else:
             self.ansible_module.ctera_return_value().msg('%s server already disabled' % self._share_type)
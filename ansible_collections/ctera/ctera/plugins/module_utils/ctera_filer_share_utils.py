@@ -0,0 +1,166 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+acl_key = ('principal_type', 'name')
+
+add_params = [
+    'name',
+    'directory',
+    'acl',
+    'access',
+    'csc',
+    'dir_permissions',
+    'comment',
+    'export_to_afp',
+    'export_to_ftp',
+    'export_to_nfs',
+    'export_to_pc_agent',
+    'export_to_rsync',
+    'indexed'
+]
+
+
+def share_argument_spec():
+    return dict(
+        name=dict(type='str', required=True),
+        directory=dict(type='str', required=False),
+        acl=dict(
+            type='list',
+            required=False,
+            elements='dict',
+            options=dict(
+                principal_type=dict(required=True, choices=['LocalUser', 'LocalGroup', 'DomainUser', 'DomainGroup']),
+                name=dict(required=True),
+                perm=dict(required=True, choices=['ReadWrite', 'ReadOnly', 'None']),
+            )
+        ),
+        access=dict(required=False, choices=['winAclMode', 'authenticated'], default='winAclMode'),
+        csc=dict(required=False, choices=['manual', 'documents', 'disabled'], default='manual'),
+        dir_permissions=dict(required=False, type='int', default=777),
+        comment=dict(type='str', required=False),
+        export_to_afp=dict(type='bool', required=False, default=False),
+        export_to_ftp=dict(type='bool', required=False, default=False),
+        export_to_nfs=dict(type='bool', required=False, default=False),
+        export_to_pc_agent=dict(type='bool', required=False, default=False),
+        export_to_rsync=dict(type='bool', required=False, default=False),
+        indexed=dict(type='bool', required=False, default=False),
+        acl_mode=dict(required=False, choices=['append', 'remove', 'replace'], default='replace')
+    )
+
+
+def add_share(ctera_filer, parameters):
+    share_add_params = {k: v for k, v in parameters.items() if k in add_params}
+    if share_add_params.get('directory') is None:
+        raise ctera_sdk.CTERAException(message="Cannot create new share without a directory")
+    if parameters.get('acl_mode') == 'remove':
+        share_add_params.pop('acl', None)
+    if share_add_params.get('acl') is not None:
+        share_add_params['acl'] = [make_share_access_control_entry(acl_entry) for acl_entry in share_add_params['acl']]
+    ctera_filer.shares.add(**share_add_params)
+
+
+def get_modified_share_attributes(share, parameters):
+    desired = dict(parameters)
+    acl_mode = desired.pop('acl_mode', 'replace')
+    desired_acl = desired.pop('acl', None)
+    modified_attributes = ctera_common.get_modified_attributes(share, desired)
+    if desired_acl is not None:
+        acl = merge_acl(share['acl'], desired_acl, acl_mode)
+        if acl is not None:
+            modified_attributes['acl'] = acl
+    return modified_attributes
+
+
+def merge_acl(current_acl, desired_acl, acl_mode):
+    """
+    Return the access control entries the share should have, or None if they do not change
+    """
+    delta = get_acl_delta(current_acl, desired_acl)
+    if acl_mode == 'replace':
+        return desired_acl if any(delta.values()) else None
+    if acl_mode == 'append':
+        if not delta['added'] and not delta['changed']:
+            return None
+        acl = {_acl_entry_key(acl_entry): acl_entry for acl_entry in current_acl}
+        acl.update({_acl_entry_key(acl_entry): acl_entry for acl_entry in desired_acl})
+        return list(acl.values())
+    removed_keys = {_acl_entry_key(acl_entry) for acl_entry in desired_acl}
+    acl = [acl_entry for acl_entry in current_acl if _acl_entry_key(acl_entry) not in removed_keys]
+    return acl if len(acl) != len(current_acl) else None
+
+
+def modify_share(ctera_filer, name, modified_attributes):
+    modified_attributes = dict(modified_attributes)
+    acl = modified_attributes.pop('acl', None)
+    if modified_attributes:
+        ctera_filer.shares.modify(name, **modified_attributes)
+    if acl is not None:
+        ctera_filer.shares.set_acl(name, [make_share_access_control_entry(acl_entry) for acl_entry in acl])
+
+
+def get_acl_delta(current_acl, desired_acl):
+    return ctera_common.get_list_delta(current_acl, desired_acl, acl_key)
+
+
+def _acl_entry_key(acl_entry):
+    return tuple(acl_entry[attribute] for attribute in acl_key)
+
+
+def make_share_access_control_entry(acl_dict):
+    return ctera_sdk.gateway_types.ShareAccessControlEntry(principal_type=acl_dict['principal_type'], name=acl_dict['name'], perm=acl_dict['perm'])
+
+
+def to_share_dict(share_obj):
+    share_dict = {}
+    share_dict['name'] = share_obj.name
+    share_dict['directory'] = os.path.join(share_obj.volume, share_obj.directory[1:])
+    share_dict['acl'] = [to_acl_dict(acl_entry) for acl_entry in share_obj.acl]
+    share_dict['access'] = share_obj.access
+    share_dict['csc'] = share_obj.clientSideCaching
+    share_dict['dir_permissions'] = share_obj.dirPermissions
+    share_dict['comment'] = share_obj.comment
+    share_dict['export_to_afp'] = share_obj.exportToAFP
+    share_dict['export_to_ftp'] = share_obj.exportToFTP
+    share_dict['export_to_nfs'] = share_obj.exportToNFS
+    share_dict['export_to_pc_agent'] = share_obj.exportToPCAgent
+    share_dict['export_to_rsync'] = share_obj.exportToRSync
+    share_dict['indexed'] = share_obj.indexed
+    return share_dict
+
+
+def to_acl_dict(acl_obj):
+    acl_dict = {}
+    acl_dict['perm'] = acl_obj.permissions.allowedFileAccess
+    acl_dict['principal_type'] = acl_obj.principal2._classname  # pylint: disable=protected-access
+    if acl_dict['principal_type'] in [ctera_sdk.gateway_enum.PrincipalType.LU, ctera_sdk.gateway_enum.PrincipalType.LG]:
+        name = acl_obj.principal2.ref
+        name = name[name.rfind('#') + 1:]
+    else:
+        name = acl_obj.principal2.name
+    acl_dict['name'] = name
+    return acl_dict
@@ -0,0 +1,51 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+user_create_params = ['username', 'password', 'full_name', 'email', 'uid']
+
+
+def user_argument_spec():
+    return dict(
+        username=dict(type='str', required=True),
+        password=dict(type='str', required=False, no_log=True),
+        full_name=dict(type='str', required=False),
+        email=dict(type='str', required=False),
+        uid=dict(type='str', required=False)
+    )
+
+
+def add_user(ctera_filer, parameters):
+    create_params = {k: v for k, v in parameters.items() if k in user_create_params}
+    if create_params.get('password') is None:
+        raise ctera_sdk.CTERAException(message="Cannot create new user without a password")
+    ctera_filer.users.add(**create_params)
+    return create_params
+
+
+def to_user_dict(user):
+    user_dict = {k: v for k, v in user.__dict__.items() if not k.startswith("_")}
+    full_name = user_dict.pop('fullName', None)
+    if full_name is not None:
+        user_dict['full_name'] = full_name
+    return user_dict
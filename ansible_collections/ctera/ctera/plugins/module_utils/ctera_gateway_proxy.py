@@ -0,0 +1,296 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+import math
+import random
+import threading
+import time
+import timeit
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+read_prefixes = ('get', 'is_', 'ifconfig', 'ipconfig', 'connected', 'sso_enabled', 'infer', 'test', 'openfile', 'tcp_connect', 'session')
+session_methods = ('login', 'logout')
+streaming_methods = ('openfile',)
+
+
+class GatewayCall(object):
+    """
+    A call made through the gateway proxy, such as shares.modify('demo', comment='comment')
+    """
+
+    def __init__(self, path, args, kwargs):
+        self.path = path
+        self.args = args
+        self.kwargs = kwargs
+
+    @property
+    def name(self):
+        return '.'.join(self.path)
+
+    @property
+    def endpoint(self):
+        if len(self.path) == 1 and self.args and isinstance(self.args[0], str) and self.args[0].startswith('/'):
+            return self.args[0]
+        return None
+
+    @property
+    def is_read(self):
+        return self.path[-1].startswith(read_prefixes)
+
+    @property
+    def is_session(self):
+        return self.path[-1] in session_methods
+
+    @property
+    def is_streaming(self):
+        return self.path[-1] in streaming_methods
+
+
+class GatewayProxy(object):
+    """
+    Wraps a Gateway and its APIs, passing every call through a chain of interceptors before it reaches the Gateway.
+    An interceptor implements intercept(call, proceed), and must call proceed() to execute the call.
+    """
+
+    def __init__(self, target, interceptors, path=None):
+        self._target = target
+        self._interceptors = interceptors
+        self._path = path or ()
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name.startswith('_'):
+            return attr
+        if isinstance(attr, ctera_sdk.BaseCommand):
+            return GatewayProxy(attr, self._interceptors, self._path + (name,))
+        if callable(attr):
+            return self._method(self._path + (name,), attr)
+        return attr
+
+    def _method(self, path, method):
+        def invoke(*args, **kwargs):
+            return self._invoke(GatewayCall(path, args, kwargs), method, 0)
+        return invoke
+
+    def _invoke(self, call, method, index):
+        if index == len(self._interceptors):
+            return method(*call.args, **call.kwargs)
+        return self._interceptors[index].intercept(call, lambda: self._invoke(call, method, index + 1))
+
+
+class CheckModeInterceptor(object):
+    """
+    Executes the calls that read from the Gateway, and records the calls that would change it without executing them
+    """
+
+    def __init__(self):
+        self.skipped_calls = []
+
+    def intercept(self, call, proceed):
+        if call.is_read or call.is_session:
+            return proceed()
+        self.skipped_calls.append(call.name)
+        return None
+
+
+class ReadCacheInterceptor(object):
+    """
+    Returns the result of a read that was already made with the same arguments, instead of reading it again from the Gateway.
+    Any call that changes the Gateway invalidates all the cached reads.
+    Streamed responses are never cached, since copying them would read them into memory.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.saved_calls = 0
+
+    def invalidate(self):
+        self._cache.clear()
+
+    def intercept(self, call, proceed):
+        if not call.is_read:
+            self._cache.clear()
+            return proceed()
+        if call.is_streaming:
+            return proceed()
+        try:
+            key = (call.name, ctera_common.freeze(call.args), ctera_common.freeze(call.kwargs))
+            cached = key in self._cache
+        except TypeError:
+            return proceed()
+        if cached:
+            with self._lock:
+                self.saved_calls += 1
+            return copy.deepcopy(self._cache[key])
+        result = proceed()
+        self._cache[key] = copy.deepcopy(result)
+        return result
+
+
+class RetryInterceptor(object):
+    """
+    Retries the calls that fail with a transient error, waiting an exponentially growing and randomized delay between the attempts.
+    A transient error is a response with one of the retryable status codes, a connection error or a timeout.
+    Only the calls that read from the Gateway, login and logout are retried, unless retry_mutations is set.
+    """
+
+    def __init__(self, retries, backoff=1.0, max_backoff=30.0, jitter=0.5, status_codes=None, retry_mutations=False,
+                 sleep=time.sleep, uniform=random.uniform):  # pylint: disable=too-many-arguments
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = status_codes if status_codes is not None else [500, 502, 503, 504]
+        self.retry_mutations = retry_mutations
+        self.retried_calls = {}
+        self._lock = threading.Lock()
+        self._sleep = sleep
+        self._uniform = uniform
+
+    def intercept(self, call, proceed):
+        attempt = 0
+        while True:
+            try:
+                return proceed()
+            except ctera_sdk.CTERAException as error:
+                if attempt == self.retries or not self._is_retryable(call, error):
+                    raise
+            self._sleep(self.delay(attempt))
+            attempt += 1
+            with self._lock:
+                self.retried_calls[call.name] = self.retried_calls.get(call.name, 0) + 1
+
+    def delay(self, attempt):
+        delay = max(min(self.backoff * 2 ** attempt, self.max_backoff), 0)
+        return max(delay - self._uniform(0, delay * self.jitter), 0)
+
+    def _is_retryable(self, call, error):
+        if not (call.is_read or call.is_session or self.retry_mutations):
+            return False
+        if isinstance(error, (ctera_sdk.HostUnreachable, ctera_sdk.ConnectionTimeout)):
+            return True
+        return getattr(getattr(error, 'response', None), 'code', None) in self.status_codes
+
+    def summary(self):
+        return dict(count=sum(self.retried_calls.values()), calls=dict(self.retried_calls))
+
+
+class TimingInterceptor(object):
+    """
+    Records the duration and outcome of every call that reaches the Gateway
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def intercept(self, call, proceed):
+        start = timeit.default_timer()
+        success = False
+        try:
+            result = proceed()
+            success = True
+            return result
+        finally:
+            record = dict(name=call.name, duration=round(timeit.default_timer() - start, 4), success=success)
+            if call.endpoint is not None:
+                record['endpoint'] = call.endpoint
+            self.calls.append(record)
+
+    def summary(self):
+        durations = sorted(record['duration'] for record in self.calls)
+        return dict(
+            count=len(durations),
+            total=round(sum(durations), 4),
+            p50=self._percentile(durations, 50),
+            p95=self._percentile(durations, 95),
+            slowest=max(self.calls, key=lambda record: record['duration']) if self.calls else None,
+            calls=self.calls
+        )
+
+    @staticmethod
+    def _percentile(durations, percentile):
+        if not durations:
+            return 0
+        return durations[max(int(math.ceil(percentile / 100.0 * len(durations))) - 1, 0)]
+
+
+class RateLimitInterceptor(object):
+    """
+    Limits the rate of the calls that reach the Gateway with a token bucket, and the number of calls that are in flight at the same time.
+    The bucket holds up to burst tokens and is refilled at rate tokens per second. Every call takes a token, and waits for one if the bucket is empty.
+    A rate of 0 and a max_in_flight of 0 leave the rate and the number of calls in flight unlimited.
+    """
+
+    def __init__(self, rate=0, burst=1, max_in_flight=0, clock=timeit.default_timer, sleep=time.sleep):  # pylint: disable=too-many-arguments
+        self.rate = rate
+        self.burst = burst
+        self.throttled_calls = 0
+        self.wait = 0.0
+        self._tokens = burst
+        self._updated = None
+        self._lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight > 0 else None
+        self._clock = clock
+        self._sleep = sleep
+
+    def intercept(self, call, proceed):
+        wait = self._acquire()
+        try:
+            wait += self._take()
+            if wait > 0:
+                with self._lock:
+                    self.throttled_calls += 1
+                    self.wait += wait
+            return proceed()
+        finally:
+            if self._in_flight is not None:
+                self._in_flight.release()
+
+    def _acquire(self):
+        if self._in_flight is None or self._in_flight.acquire(blocking=False):
+            return 0
+        start = self._clock()
+        self._in_flight.acquire()
+        return self._clock() - start
+
+    def _take(self):
+        if not self.rate:
+            return 0
+        with self._lock:
+            now = self._clock()
+            if self._updated is not None:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # The token is reserved before waiting for it, so that calls waiting together are spaced out rather than released together
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        if delay:
+            self._sleep(delay)
+        return delay
+
+    def summary(self):
+        return dict(count=self.throttled_calls, wait=round(self.wait, 4))
@@ -0,0 +1,52 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+def configure(http_client, pool_size=10, connect_timeout=None, read_timeout=None, keep_alive=True):
+    ''' configures the connections of the HTTP client of the SDK
+        :param: http_client: the HTTP client of the SDK, which sends its requests with a requests session
+        :param: pool_size: the number of connections to the filer that are kept open for reuse
+        :param: connect_timeout: seconds to wait for a connection to the filer, or None to wait indefinitely
+        :param: read_timeout: seconds to wait for the filer to send data, or None to wait indefinitely
+        :param: keep_alive: whether to reuse connections to the filer, and the TLS sessions established over them, for the following requests
+    '''
+    # A request that timed out fails at once, instead of being sent again by the SDK. It is retried with ctera_retries
+    http_client.retries = 1
+    adapter = ctera_sdk.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+    session = http_client.session
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    if connect_timeout is not None or read_timeout is not None:
+        session.request = _with_timeout(session.request, (connect_timeout, read_timeout))
+
+
+def _with_timeout(request, timeout):
+    def request_with_timeout(method, url, **kwargs):
+        # The SDK does not set a timeout on its requests
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = timeout
+        return request(method, url, **kwargs)
+    return request_with_timeout
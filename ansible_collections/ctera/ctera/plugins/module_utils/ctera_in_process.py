@@ -0,0 +1,57 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import contextlib
+import threading
+
+_local = threading.local()
+
+
+class Invocation(object):
+    """
+    Arguments and result of a module that runs in-process on the controller instead of in its own interpreter
+    """
+
+    def __init__(self, args):
+        self.args = args
+        self.result = None
+
+
+def current():
+    """
+    The invocation of the module running in the current thread, or None when the module runs in its own interpreter
+    """
+    return getattr(_local, 'invocation', None)
+
+
+@contextlib.contextmanager
+def invocation(args):
+    """
+    Load the arguments of the modules created in the current thread from args, and capture their result instead of writing it to stdout
+
+    :param dict args: The module arguments, including internal arguments such as _ansible_check_mode
+    """
+    _local.invocation = Invocation(args)
+    try:
+        yield _local.invocation
+    finally:
+        _local.invocation = None
@@ -0,0 +1,70 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import sys
+import traceback
+import types
+
+# Importing any part of cterasdk imports all of its Portal, Gateway and Agent APIs, which takes longer than loading
+# the rest of a module. The SDK is therefore imported on first access to an attribute of this module, for example
+# ctera_sdk.CTERAException, so that invalid arguments are reported before paying for it.
+# A module level __getattr__ requires Python 3.7, so the class of this module is replaced with one that implements it.
+
+_attributes = {
+    'gateway_session': ('cterasdk.edge.session', None),
+    'BaseCommand': ('cterasdk.edge.base_command', 'BaseCommand'),
+    'dict_from_cookiejar': ('requests.utils', 'dict_from_cookiejar'),
+    'ParseException': ('cterasdk.convert', 'ParseException'),
+    'RequestException': ('requests.exceptions', 'RequestException'),
+    'HTTPAdapter': ('requests.adapters', 'HTTPAdapter'),
+    'HostUnreachable': ('cterasdk.exception', 'HostUnreachable'),
+    'ConnectionTimeout': ('cterasdk.exception', 'ConnectionTimeout'),
+}
+
+_import_error = []
+
+
+def import_error():
+    """
+    Import the SDK and return the traceback of the failure, or None if the SDK is available
+    """
+    if not _import_error:
+        try:
+            importlib.import_module('cterasdk')
+            _import_error.append(None)
+        except ImportError:
+            _import_error.append(traceback.format_exc())
+    return _import_error[0]
+
+
+class _LazyModule(types.ModuleType):
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        module_name, attribute = _attributes.get(name, ('cterasdk', name))
+        module = importlib.import_module(module_name)
+        return module if attribute is None else getattr(module, attribute)
+
+
+sys.modules[__name__].__class__ = _LazyModule
@@ -0,0 +1,76 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import binascii
+import hashlib
+import json
+import os
+import time
+
+
+class SessionCache(object):
+    """
+    Session cookies of authenticated filer sessions, stored in files readable only by the current user.
+    Entries are keyed by filer host and user, and are only returned for the same password they were stored with.
+    """
+    default_directory = '~/.ansible/ctera/sessions'
+
+    def __init__(self, directory=None, ttl=600):
+        self._directory = os.path.expanduser(directory or SessionCache.default_directory)
+        self._ttl = ttl
+
+    def load(self, host, user, password):
+        path = self._path(host, user)
+        try:
+            with open(path, 'r') as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if entry.get('expires', 0) < time.time() or entry.get('digest') != self._digest(entry.get('salt', ''), password):
+            self.invalidate(host, user)
+            return None
+        return entry.get('cookies')
+
+    def store(self, host, user, password, cookies):
+        if not os.path.isdir(self._directory):
+            os.makedirs(self._directory, 0o700)
+        salt = binascii.hexlify(os.urandom(16)).decode()
+        entry = dict(cookies=cookies, expires=time.time() + self._ttl, salt=salt, digest=self._digest(salt, password))
+        path = self._path(host, user)
+        temp_path = '%s.%d.tmp' % (path, os.getpid())
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as cache_file:
+            json.dump(entry, cache_file)
+        os.rename(temp_path, path)
+
+    def invalidate(self, host, user):
+        try:
+            os.remove(self._path(host, user))
+        except OSError:
+            pass
+
+    def _path(self, host, user):
+        return os.path.join(self._directory, hashlib.sha256(('%s\n%s' % (host, user)).encode('utf-8')).hexdigest())
+
+    @staticmethod
+    def _digest(salt, password):
+        return hashlib.sha256(('%s%s' % (salt, password)).encode('utf-8')).hexdigest()
@@ -49,41 +49,75 @@ options:
     - Whether to execute refresh folders
     type: bool
     default: False
+
+notes:
+    - File eviction and the refresh of cloud folders continue on the Filer after the module returns.
+      Pass the returned C(job) to M(ctera.ctera.ctera_filer_job_status) to wait for them to complete.
 '''
 
 EXAMPLES = '''
 - name: Enable Caching Gateway and start sync w/o refresh
-  ctera_filer_cloud_sync:
+  ctera_filer_cloud_cache:
     filer_host: "{{ ctera_filer_hostname }}"
     filer_user: "{{ ctera_filer_user }}"
     filer_password: "{{ ctera_filer_password }}"
 
 - name: Enable Caching Gateway and start sync with refresh
-  ctera_filer_cloud_sync:
+  ctera_filer_cloud_cache:
+    refresh_folders: True
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+
+- name: Enable Caching Gateway, refresh the cloud folders and wait for the refresh to complete
+  ctera_filer_cloud_cache:
     refresh_folders: True
     filer_host: "{{ ctera_filer_hostname }}"
     filer_user: "{{ ctera_filer_user }}"
     filer_password: "{{ ctera_filer_password }}"
+  register: cloud_cache
+
+- name: Wait for the refresh of the cloud folders
+  ctera_filer_job_status:
+    job: "{{ cloud_cache.job }}"
+    wait: True
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+  when: cloud_cache.job is defined
 
 - name: Enable Caching Gateway w/o sync
-  ctera_filer_cloud_sync:
+  ctera_filer_cloud_cache:
     sync_enabled: False
     filer_host: "{{ ctera_filer_hostname }}"
     filer_user: "{{ ctera_filer_user }}"
     filer_password: "{{ ctera_filer_password }}"
 
 - name: Disable Caching Gateway
-  ctera_filer_cloud_sync:
+  ctera_filer_cloud_cache:
     enabled: False
     filer_host: "{{ ctera_filer_hostname }}"
     filer_user: "{{ ctera_filer_user }}"
     filer_password: "{{ ctera_filer_password }}"
 '''
 
-RETURN = r''' # '''
+RETURN = '''
+job:
+  description: Handle of the file eviction and refresh of cloud folders that were started, to pass to M(ctera.ctera.ctera_filer_job_status)
+  returned: When I(force_eviction) or I(refresh_folders) started an operation
+  type: dict
+  sample:
+    id: 0f8fad5bd9cb469fa16570867728950e
+    type: cloud_sync
+    filer: 192.168.1.10
+    port: null
+    started: 1603024472.218
+    operations: ['force_eviction', 'refresh_folders']
+'''
 
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_job_utils as ctera_filer_job_utils
 
 
 class CteraFilerCloudSync(CteraFilerBase):
@@ -94,6 +128,7 @@ class CteraFilerCloudSync(CteraFilerBase):
             force_eviction=dict(type='bool', required=False, default=False),
             refresh_folders=dict(type='bool', required=False, default=False),
         ))
+        self._operations = []
 
     @property
     def _generic_failure_message(self):  # pragma: no cover
@@ -124,6 +159,7 @@ class CteraFilerCloudSync(CteraFilerBase):
         if self.parameters['force_eviction']:
             self._ctera_filer.cache.force_eviction()
             messages['changed'].append('Started force file eviction')
+            self._operations.append('force_eviction')
 
         is_sync_enabled = self._ctera_filer.sync.is_enabled()
         if self.parameters['sync_enabled']:
@@ -132,6 +168,12 @@ class CteraFilerCloudSync(CteraFilerBase):
             self._ensure_sync_disabled(is_sync_enabled, messages)
 
         ctera_common.set_result(self.ansible_module, messages)
+        if self._operations:
+            self.ansible_module.ctera_return_value().put(
+                job=ctera_filer_job_utils.create_job(
+                    ctera_filer_job_utils.CLOUD_SYNC, self.parameters['filer_host'], port=self.parameters.get('filer_port'), operations=self._operations
+                )
+            )
 
     def _ensure_cache_disabled(self, is_cache_enabled):
         if is_cache_enabled:
@@ -153,6 +195,7 @@ class CteraFilerCloudSync(CteraFilerBase):
         if self.parameters['refresh_folders']:
             self._ctera_filer.sync.refresh()
             messages['changed'].append('Started refreshing cloud folders')
+            self._operations.append('refresh_folders')
 
     def _ensure_sync_disabled(self, is_sync_enabled, messages):
         if is_sync_enabled:
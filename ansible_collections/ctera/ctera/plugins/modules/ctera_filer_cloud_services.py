@@ -107,27 +107,15 @@ ctera_license:
 
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
-
-try:
-    from cterasdk import CTERAException, tojsonstr, config
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
 
 
 class CteraFilerCloudServices(CteraFilerBase):
     _connect_params = ['server', 'user', 'password', 'ctera_license']
 
     def __init__(self):
-        super().__init__(dict(
-            state=dict(required=False, choices=['connected', 'disconnected'], default='connected'),
-            server=dict(type='str', required=True),
-            user=dict(type='str', required=True),
-            password=dict(type='str', required=True, no_log=True),
-            ctera_license=dict(type='str', required=False, default='EV16', choices=['EV8', 'EV16', 'EV32', 'EV64', 'EV128']),
-            force_reconnect=dict(type='bool', required=False, default=False),
-            sso=dict(type='bool', required=False, default=False),
-            trust_certificate=dict(type='bool', required=False, default=False)
-        ))
+        super().__init__(ctera_filer_config_utils.cloud_services.options())
 
     @property
     def _generic_failure_message(self):  # pragma: no cover
@@ -135,7 +123,7 @@ class CteraFilerCloudServices(CteraFilerBase):
 
     def _execute(self):
         if self.parameters['trust_certificate']:
-            config.connect['ssl'] = 'Trust'
+            ctera_sdk.config.connect['ssl'] = 'Trust'
 
         state = self.parameters.pop('state')
         status = self._ctera_filer.services.get_status()
@@ -187,9 +175,9 @@ class CteraFilerCloudServices(CteraFilerBase):
                 self._do_connect()
                 messages['changed'].append('Successfully modified the Filer connection to the Cloud Services')
                 self.ansible_module.ctera_return_value().put(previous_server=status.server_address)
-            except CTERAException as error:
+            except ctera_sdk.CTERAException as error:
                 self.ansible_module.ctera_return_value().failed().msg(
-                    'Failed to connect to new Cloud Services. Filer is now disconnected Exception: %s' % tojsonstr(error, False)).put(
+                    'Failed to connect to new Cloud Services. Filer is now disconnected Exception: %s' % ctera_sdk.tojsonstr(error, False)).put(
                         server=self.parameters['server'])
                 return False
         else:
@@ -0,0 +1,547 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_config
+short_description: Declarative configuration of a CTERA-Networks filer in a single session
+description:
+    - Bring the configuration of a CTERA-Networks filer to the desired state in a single task and a single session.
+    - The current state of every section in the task is read first, concurrently over up to I(ctera_pool_size) connections to the Filer,
+      and a plan is made of the changes that differ from the desired state.
+    - The plan is applied in dependency order, device settings, network, Active Directory, Cloud Services, license, volumes, shares,
+      file services and Syslog, so that each section can rely on the sections before it.
+    - Sections that are omitted are left as they are. The options of each section behave like the options of the module of the same name.
+    - In check mode, the plan is returned without applying it.
+version_added: "2.10"
+extends_documentation_fragment:
+    - ctera.ctera.filer
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  hostname:
+    description: The hostname of the filer
+    type: str
+  location:
+    description: The location of the filer
+    type: str
+  timezone:
+    description: The timezone of the filer
+    type: str
+  network:
+    description: The IP configuration, see M(ctera.ctera.ctera_filer_network)
+    type: dict
+    suboptions:
+      mode:
+        description: IP addressing mode
+        type: str
+        choices:
+          - dynamic
+          - static
+        default: dynamic
+      address:
+        description: IP Address. Required if I(mode=static)
+        type: str
+      subnet:
+        description: IP Subnet. Required if I(mode=static)
+        type: str
+      gateway:
+        description: Default gateway. Required if I(mode=static)
+        type: str
+      primary_dns_server:
+        description: Primary DNS Server. Required if I(mode=static)
+        type: str
+      secondary_dns_server:
+        description: Secondary DNS Server
+        type: str
+  directory_services:
+    description: The Active Directory connection, see M(ctera.ctera.ctera_filer_directory_services)
+    type: dict
+    suboptions:
+      state:
+        description: Whether the filer is connected to the Active Directory
+        type: str
+        choices:
+          - connected
+          - disconnected
+        default: connected
+      domain:
+        description: Active Directory Domain to connect to. Required if C(state) is connected
+        type: str
+      username:
+        description: User Name to for communicating with the Active Directory Service. Required if C(state) is connected
+        type: str
+      password:
+        description: Password of the user for communicating with the Active Directory Service. Required if C(state) is connected
+        type: str
+      ou:
+        description: The OU path to use when connecting to the active directory services
+        type: str
+      force_reconnect:
+        description: Disconnect and connect even if connected to the domain
+        type: bool
+        default: False
+  license:
+    description: The license of the filer
+    type: str
+    choices:
+      - EV8
+      - EV16
+      - EV32
+      - EV64
+      - EV128
+  cloud_services:
+    description: The connection to CTERA Portal, see M(ctera.ctera.ctera_filer_cloud_services)
+    type: dict
+    suboptions:
+      state:
+        description: Whether the filer is connected to the Cloud Services
+        type: str
+        choices:
+          - connected
+          - disconnected
+        default: connected
+      server:
+        description: IP Address or FQDN of CTERA Portal
+        required: True
+        type: str
+      user:
+        description: CTERA Portal user account name
+        required: True
+        type: str
+      password:
+        description: CTERA Portal user account password
+        required: True
+        type: str
+      ctera_license:
+        description: Filer license type
+        type: str
+        choices:
+          - EV8
+          - EV16
+          - EV32
+          - EV64
+          - EV128
+        default: EV16
+      force_reconnect:
+        description: Execute reconnect if connection details have not changed
+        type: bool
+        default: False
+      sso:
+        description: Enable/Disable remote SSO for Portal administrators
+        type: bool
+        default: False
+      trust_certificate:
+        description: Trust unverified certificates
+        type: bool
+        default: False
+  volumes:
+    description: Volumes to create, resize or delete, see M(ctera.ctera.ctera_filer_volume). Only the size of an existing volume can be modified
+    type: list
+    elements: dict
+    suboptions:
+      state:
+        description: Whether the volume should exist or not
+        type: str
+        choices: ['present', 'absent']
+        default: 'present'
+      name:
+        description: The name of the volume
+        required: True
+        type: str
+      filesystem:
+        description: Filesystem to use, defaults to xfs
+        type: str
+      size:
+        description: Size of the volume in MBs, if not set the entire disk will be used
+        type: int
+      device:
+        description: Name of the device to use for the volume, can be left as None if there the gateway has only one
+        type: str
+      passphrase:
+        description: Passphrase for the volume
+        type: str
+  shares:
+    description: Shares to create, modify or delete, see M(ctera.ctera.ctera_filer_shares)
+    type: list
+    elements: dict
+    suboptions:
+      state:
+        description: Whether the share should exist or not
+        type: str
+        choices: ['present', 'absent']
+        default: 'present'
+      name:
+        description: The name of the share
+        required: True
+        type: str
+      directory:
+        description:
+        - The directory to share
+        - Required when C(state=present) and the share does not exist
+        type: str
+      acl:
+        description: List of Access Control Entries
+        type: list
+        elements: dict
+        suboptions:
+          principal_type:
+            description: The principal type
+            type: str
+            choices:
+            - LocalUser
+            - LocalGroup
+            - DomainUser
+            - DomainGroup
+            required: True
+          name:
+            description: The name of the user or group
+            type: str
+            required: True
+          perm:
+            description: The file access permission
+            type: str
+            choices:
+            - ReadWrite
+            - ReadOnly
+            - None
+            required: True
+      acl_mode:
+        description: How C(acl) is applied to an existing share, see M(ctera.ctera.ctera_filer_shares)
+        type: str
+        choices: ['append', 'remove', 'replace']
+        default: replace
+      access:
+        description: The Windows File Sharing authentication mode
+        type: str
+        choices:
+        - winAclMode
+        - authenticated
+        default: winAclMode
+      csc:
+        description: The client side caching (offline files) configuration
+        type: str
+        choices:
+        - manual
+        - documents
+        - disabled
+        default: manual
+      dir_permissions:
+        description: Directory Permission
+        type: int
+        default: 777
+      export_to_afp:
+        description: Export the share to AFP
+        type: bool
+        default: False
+      export_to_ftp:
+        description: Export the share to FTP
+        type: bool
+        default: False
+      export_to_nfs:
+        description: Export the share to NFS
+        type: bool
+        default: False
+      export_to_pc_agent:
+        description: Export the share to PC Agent
+        type: bool
+        default: False
+      export_to_rsync:
+        description: Export the share to RSync
+        type: bool
+        default: False
+      indexed:
+        description: Enabled indexing
+        type: bool
+        default: False
+      comment:
+        description: Comment
+        type: str
+  purge_shares:
+    description: Delete all the existing shares that are not in C(shares)
+    type: bool
+    default: False
+  smb:
+    description: The SMB configuration, see M(ctera.ctera.ctera_filer_smb)
+    type: dict
+    suboptions:
+      enabled:
+        description: Enable SMB
+        type: bool
+        default: True
+      packet_signing:
+        description: Packet signing type
+        type: str
+        choices:
+          - Disabled
+          - If client agrees
+          - Required
+        default: Disabled
+      idle_disconnect_time:
+        description: Client Idle Disconnect Time (minutes)
+        type: int
+        default: 10
+      compatibility_mode:
+        description: Use compatibility mode
+        type: bool
+        default: False
+      unix_extensions:
+        description: Unix Extensions Mode
+        type: bool
+        default: True
+      abe_enabled:
+        description: Hide unreadable files and folders
+        type: bool
+        default: False
+  nfs:
+    description: The NFS configuration, see M(ctera.ctera.ctera_filer_nfs)
+    type: dict
+    suboptions:
+      enabled:
+        description: Enable NFS
+        type: bool
+        default: True
+      async_write:
+        description: Use asynchronous writes
+        type: bool
+        default: True
+      aggregate_writes:
+        description: Aggregate write requests
+        type: bool
+        default: True
+  ftp:
+    description: The FTP configuration, see M(ctera.ctera.ctera_filer_ftp)
+    type: dict
+    suboptions:
+      enabled:
+        description: Enable FTP
+        type: bool
+        default: True
+      require_ssl:
+        description: Allow only SSL/TLS connections
+        type: bool
+        default: False
+      max_connections_per_ip:
+        description: Maximum Connections per Client
+        type: int
+        default: 5
+      banner_message:
+        description: FTP Banner Message
+        type: str
+        default: Welcome to CTERA FTP.
+      allow_anonymous_ftp:
+        description: Allow anonymous FTP downloads
+        type: bool
+        default: False
+      anonymous_ftp_folder:
+        description: Anonymous FTP Directory
+        type: str
+      anonymous_download_limit:
+        description: Limit download bandwidth of anonymous connection in KB/sec per connection. 0 for unlimited
+        type: int
+        default: 0
+  rsync:
+    description: The RSync configuration, see M(ctera.ctera.ctera_filer_rsync)
+    type: dict
+    suboptions:
+      enabled:
+        description: Enable RSync
+        type: bool
+        default: True
+      port:
+        description: RSync Port
+        type: int
+        default: 873
+      max_connections:
+        description: Maximum Connections
+        type: int
+        default: 25
+  syslog:
+    description: The Syslog configuration, see M(ctera.ctera.ctera_filer_syslog)
+    type: dict
+    suboptions:
+      enabled:
+        description: Enable Syslog
+        type: bool
+        default: True
+      server:
+        description: Syslog server address. Required if C(enabled=True)
+        type: str
+      port:
+        description: Syslog server port
+        type: int
+        default: 514
+      proto:
+        description: Syslog server communication protocol
+        type: str
+        choices:
+          - TCP
+          - UDP
+        default: UDP
+      min_severity:
+        description: Minimal log severity to report to syslog
+        type: str
+        choices:
+          - emergency
+          - alert
+          - critical
+          - error
+          - warning
+          - notice
+          - info
+          - debug
+        default: info
+
+requirements:
+    - cterasdk
+'''
+
+EXAMPLES = '''
+- name: provision a filer
+  ctera_filer_config:
+    hostname: branch-01
+    timezone: "(GMT-05:00) Eastern Time (US , Canada)"
+    network:
+      mode: static
+      address: 192.168.1.10
+      subnet: 255.255.255.0
+      gateway: 192.168.1.1
+      primary_dns_server: 192.168.1.2
+    directory_services:
+      domain: ctera.local
+      username: admin
+      password: "{{ ad_password }}"
+    license: EV16
+    cloud_services:
+      server: portal.example.com
+      user: admin
+      password: "{{ portal_password }}"
+    shares:
+    - name: public
+      directory: main/public
+    smb:
+      idle_disconnect_time: 15
+    nfs:
+      enabled: False
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+'''
+
+RETURN = '''
+changes:
+  description: The changes that were applied, or that would be applied in check mode, in the order they were applied
+  returned: Always
+  type: list
+  sample: ['hostname: Set hostname to branch-01', 'shares: Create share public']
+pending:
+  description: The changes that were not applied because an earlier change failed
+  returned: failure
+  type: list
+  sample: ['smb: Configure SMB']
+'''
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_concurrent as ctera_concurrent
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+class CteraFilerConfig(CteraFilerBase):
+
+    def __init__(self):
+        argument_spec = {}
+        for section in ctera_filer_config_utils.sections:
+            argument_spec.update(section.argument_spec())
+        super().__init__(argument_spec)
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Filer configuration failed'
+
+    def _execute(self):
+        sections = [section for section in ctera_filer_config_utils.sections if self.parameters.get(section.name) is not None]
+        # The settings stored in the configuration database, such as the hostname, are read together and written together
+        settings = ctera_filer_config_utils.ConfigSettings(self._ctera_filer, [section.path for section in sections if section.path])
+        # The other sections are read each with its own requests, which do not depend on each other
+        read = [section for section in sections if not section.path]
+        current = dict(zip([section.name for section in read], ctera_concurrent.fetch(
+            [lambda section=section: section.read(self._ctera_filer) for section in read], max_workers=self.ansible_module.params['ctera_pool_size']
+        )))
+        current.update({section.name: settings.get(section.path) for section in sections if section.path})
+        plan = [(section, change) for section in sections for change in section.plan(current[section.name], self.parameters)]
+
+        changes = []
+        steps = self._steps(plan)
+        for index, step in enumerate(steps):
+            try:
+                self._apply(step, settings)
+            except ctera_sdk.CTERAException as error:
+                # A step of settings may fail after some of the subtrees that hold them were written
+                applied = [(section, change) for section, change in step if change.setting is not None and not settings.pending(change.setting[0])]
+                self._record(applied, changes)
+                failed = ', '.join(self._describe(section, change) for section, change in step if (section, change) not in applied)
+                self.ansible_module.ctera_return_value().failed().msg('Failed to apply %s. Exception: %s' % (
+                    failed, ctera_sdk.tojsonstr(error, False)
+                )).put(changes=changes, pending=[self._describe(section, change) for step in steps[index + 1:] for section, change in step])
+                return
+            self._record(step, changes)
+
+        if changes:
+            self.ansible_module.ctera_return_value().changed().msg('Applied %d changes' % len(changes)).put(changes=changes)
+        else:
+            self.ansible_module.ctera_return_value().msg('The configuration is up to date').put(changes=changes)
+
+    @staticmethod
+    def _steps(plan):
+        """
+        Group the changes that are applied together: consecutive changes of settings are written in one step, any other change in a step of its own
+        """
+        steps = []
+        for section, change in plan:
+            if change.setting is not None and steps and steps[-1][-1][1].setting is not None:
+                steps[-1].append((section, change))
+            else:
+                steps.append([(section, change)])
+        return steps
+
+    def _apply(self, step, settings):
+        if step[0][1].setting is None:
+            step[0][1].apply(self._ctera_filer)
+            return
+        for dummy, change in step:
+            settings.set(*change.setting)
+        settings.commit()
+
+    def _record(self, step, changes):
+        for section, change in step:
+            ctera_common.set_diff(self.ansible_module, change.current, change.modified, change.header or section.name)
+            changes.append(self._describe(section, change))
+
+    @staticmethod
+    def _describe(section, change):
+        return '%s: %s' % (section.name, change.description)
+
+
+def main():  # pragma: no cover
+    CteraFilerConfig().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
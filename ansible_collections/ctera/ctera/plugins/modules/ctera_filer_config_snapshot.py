@@ -0,0 +1,223 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_config_snapshot
+short_description: Export the configuration of a CTERA-Networks filer to a file, or import it from a file
+description:
+    - Export the configuration database of a CTERA-Networks filer to a file on the host that runs the module, or import it from such a file.
+    - The configuration is streamed to the file as it is downloaded, without holding all of it in memory, and can be compressed with gzip.
+    - The file is replaced only if the exported configuration is different from its current content.
+    - The configuration is imported only if it is different from the current configuration of the filer.
+version_added: "2.10"
+extends_documentation_fragment:
+    - ctera.ctera.filer
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  state:
+    description: Whether to export the configuration to the file, or import it from the file
+    type: str
+    choices:
+      - exported
+      - imported
+    default: exported
+  path:
+    description: Path of the configuration file
+    required: True
+    type: path
+  compress:
+    description:
+      - Compress the exported configuration with gzip.
+      - Ignored when importing, since compressed files are detected automatically.
+    type: bool
+    default: False
+  exclude:
+    description:
+      - Parts of the configuration that are not imported, and are kept as they are on the filer.
+      - Each part is a path in the configuration database, such as C(network) or C(device/hostname).
+    type: list
+    elements: str
+
+requirements:
+    - cterasdk
+'''
+
+EXAMPLES = '''
+- name: Back up the configuration of the filer
+  ctera_filer_config_snapshot:
+    path: "/backup/filers/{{ inventory_hostname }}.xml.gz"
+    compress: True
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+  delegate_to: localhost
+
+- name: Restore the configuration of the filer, except for its network and hostname
+  ctera_filer_config_snapshot:
+    state: imported
+    path: "/backup/filers/{{ inventory_hostname }}.xml.gz"
+    exclude:
+      - network
+      - device/hostname
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+  delegate_to: localhost
+'''
+
+RETURN = '''
+path:
+  description: Path of the configuration file
+  returned: success
+  type: str
+  sample: /backup/filers/branch-01.xml.gz
+checksum:
+  description: SHA1 checksum of the exported file
+  returned: When I(state=exported)
+  type: str
+  sample: 6e642bb8dd5c2e027bf21dd923337cbb4214f827
+size:
+  description: Size of the exported file in bytes
+  returned: When I(state=exported)
+  type: int
+  sample: 24576
+'''
+
+import gzip
+import json
+import os
+import tempfile
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+class CteraFilerConfigSnapshot(CteraFilerBase):
+
+    _chunk_size = 64 * 1024
+    _gzip_magic = b'\x1f\x8b'
+
+    def __init__(self):
+        super().__init__(dict(
+            state=dict(type='str', choices=['exported', 'imported'], default='exported'),
+            path=dict(type='path', required=True),
+            compress=dict(type='bool', default=False),
+            exclude=dict(type='list', elements='str')
+        ))
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Failed to %s the configuration' % ('export' if self.parameters['state'] == 'exported' else 'import')
+
+    def _execute(self):
+        if self.parameters['state'] == 'exported':
+            self._export()
+        else:
+            self._import()
+
+    def _export(self):
+        path = self.parameters['path']
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(prefix='.ctera-config-', dir=os.path.dirname(os.path.abspath(path)))
+            with os.fdopen(fd, 'wb') as temp_file:
+                self._download(temp_file)
+            checksum = self.ansible_module.sha1(temp_path)
+            size = os.path.getsize(temp_path)
+            if self.ansible_module.sha1(path) == checksum:
+                self.ansible_module.ctera_return_value().msg('The exported configuration is up to date').put(path=path, checksum=checksum, size=size)
+                return
+            if not self.ansible_module.check_mode:
+                self.ansible_module.atomic_move(temp_path, path)
+            self.ansible_module.ctera_return_value().changed().msg('Exported the configuration').put(path=path, checksum=checksum, size=size)
+        except ctera_sdk.RequestException as error:
+            self.ansible_module.ctera_return_value().failed().msg('Failed to download the configuration. Exception: %s' % error)
+        except (IOError, OSError) as error:
+            self.ansible_module.ctera_return_value().failed().msg('Failed to write %s. Exception: %s' % (path, error))
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _download(self, file):
+        response = self._ctera_filer.openfile('/export')
+        try:
+            if self.parameters['compress']:
+                # A zero modification time keeps the compressed file identical for an identical configuration
+                with gzip.GzipFile(fileobj=file, mode='wb', mtime=0) as compressed_file:
+                    self._write(response, compressed_file)
+            else:
+                self._write(response, file)
+        finally:
+            response.close()
+
+    def _write(self, response, file):
+        for chunk in response.iter_content(chunk_size=self._chunk_size):
+            file.write(chunk)
+
+    def _import(self):
+        path = self.parameters['path']
+        try:
+            database = self._load(path)
+        except (IOError, OSError) as error:
+            self.ansible_module.ctera_return_value().failed().msg('Failed to read %s. Exception: %s' % (path, error))
+            return
+        except ctera_sdk.ParseException:
+            self.ansible_module.ctera_return_value().failed().msg('Failed to parse %s' % path)
+            return
+        current = self._ctera_filer.get('/config')
+        for excluded in self.parameters.get('exclude', []):
+            self._keep_current(database, current, excluded)
+        if self._as_dict(database) == self._as_dict(current):
+            self.ansible_module.ctera_return_value().msg('The configuration is up to date').put(path=path)
+            return
+        self._ctera_filer.put('/config', database)
+        self.ansible_module.ctera_return_value().changed().msg('Imported the configuration').put(path=path)
+
+    def _load(self, path):
+        with open(path, 'rb') as file:
+            compressed = file.read(len(self._gzip_magic)) == self._gzip_magic
+        with (gzip.open(path, 'rb') if compressed else open(path, 'rb')) as file:
+            return ctera_sdk.fromxmlstr(file.read())
+
+    @staticmethod
+    def _as_dict(database):
+        # The order of the attributes is not preserved by the filer, so the configurations are compared as dictionaries
+        return json.loads(ctera_sdk.tojsonstr(database, False))
+
+    @staticmethod
+    def _keep_current(database, current, path):
+        segments = [segment for segment in path.split('/') if segment]
+        for segment in segments[:-1]:
+            database = getattr(database, segment, None)
+            current = getattr(current, segment, None)
+        if database is None or not segments:
+            return
+        if hasattr(current, segments[-1]):
+            setattr(database, segments[-1], getattr(current, segments[-1]))
+        elif hasattr(database, segments[-1]):
+            delattr(database, segments[-1])
+
+
+def main():  # pragma: no cover
+    CteraFilerConfigSnapshot().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
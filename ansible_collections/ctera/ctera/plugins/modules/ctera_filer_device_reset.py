@@ -31,6 +31,7 @@ options:
   wait:
     description:
     - Wait until the operation completes
+    - If not set, the module returns immediately with a C(job) that can be passed to M(ctera.ctera.ctera_filer_job_status)
     type: bool
     default: False
 
@@ -46,9 +47,21 @@ EXAMPLES = '''
     filer_password: "{{ ctera_filer_password }}"
 '''
 
-RETURN = r''' # '''
+RETURN = '''
+job:
+  description: The handle of the reset, to be passed to M(ctera.ctera.ctera_filer_job_status)
+  type: dict
+  returned: When I(wait=False), and not in check mode
+  sample:
+    id: 0b1f7c9c4a7d4b5a9a2c6f0f3e8d1a2b
+    type: restart
+    filer: 192.168.1.10
+    port: null
+    started: 1600000000.0
+'''
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_job_utils as ctera_filer_job_utils
 
 
 class CteraFilerDeviceReset(CteraFilerBase):
@@ -66,8 +79,19 @@ class CteraFilerDeviceReset(CteraFilerBase):
 
     def _execute(self):
         wait = self.parameters['wait']
+        if self.ansible_module.check_mode:
+            # The request is not sent, so the filer does not restart and the session remains to be logged out of
+            self.ansible_module.ctera_return_value().changed().msg('Resetting device')
+            return
         self._ctera_filer.power.reset(wait)
-        self.ansible_module.ctera_return_value().changed().msg('Filer is up and running' if wait else 'Resetting device')
+        # The session ends when the filer restarts, and a restarting filer may not answer the logout
+        self._logout = False
+        if wait:
+            self.ansible_module.ctera_return_value().changed().msg('Filer is up and running')
+        else:
+            self.ansible_module.ctera_return_value().changed().msg('Resetting device').put(
+                job=ctera_filer_job_utils.create_job(ctera_filer_job_utils.RESTART, self.parameters['filer_host'], port=self.parameters.get('filer_port'))
+            )
 
 
 def main():  # pragma: no cover
@@ -95,6 +95,7 @@ ou:
 
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
 
 
 class CteraFilerDirectoryServices(CteraFilerBase):
@@ -102,17 +103,8 @@ class CteraFilerDirectoryServices(CteraFilerBase):
 
     def __init__(self):
         super().__init__(
-            dict(
-                state=dict(required=False, choices=['connected', 'disconnected'], default='connected'),
-                domain=dict(type='str', required=False),
-                username=dict(type='str', required=False),
-                password=dict(type='str', required=False, no_log=True),
-                ou=dict(type='str', required=False),
-                force_reconnect=dict(type='bool', required=False, default=False),
-            ),
-            required_if=[
-                ('state', 'connected', ['domain', 'username', 'password'])
-            ]
+            ctera_filer_config_utils.directory_services.options(),
+            required_if=ctera_filer_config_utils.directory_services.required_if
         )
 
     @property
@@ -158,7 +150,7 @@ class CteraFilerDirectoryServices(CteraFilerBase):
 
     @staticmethod
     def _to_domain_dict(config):
-        return {k: v for k, v in config.__dict__.items() if not k.startswith("_")}
+        return ctera_filer_config_utils.to_domain_dict(config)
 
 
 def main():  # pragma: no cover
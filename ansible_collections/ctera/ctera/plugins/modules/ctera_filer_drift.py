@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_drift
+short_description: Detect the configuration sections of a CTERA-Networks Filer that drifted from a baseline
+description:
+    - Compute a fingerprint of each configuration section of the Filer, and compare it with the fingerprint of the same section in a baseline.
+    - A fingerprint is a hash of the section, in which the order of lists, and the letter case of the string attributes of the section, are ignored,
+      as they are when the modules compare the current configuration with the desired one.
+    - Use the fingerprints of a filer that holds the golden configuration as the baseline of the other filers.
+    - The sections are read concurrently, over up to I(ctera_pool_size) connections to the Filer.
+    - The module only reads the configuration of the Filer and never changes it.
+version_added: "2.10"
+extends_documentation_fragment:
+    - ctera.ctera.filer
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  sections:
+    description:
+    - The sections to fingerprint
+    - Use C(all) to fingerprint all the sections, and prefix a section with C(!) to exclude it
+    - If only exclusions are listed, all the other sections are fingerprinted
+    - 'The sections are: hostname, location, timezone, license, network, syslog, smb, nfs, ftp, rsync, shares, users, volumes, cache'
+    type: list
+    elements: str
+    default: ['all']
+  baseline:
+    description:
+    - The fingerprints to compare with, by section name, as returned in C(fingerprints)
+    - Sections that are not in the baseline are not compared
+    type: dict
+'''
+
+EXAMPLES = '''
+- name: fingerprint the golden filer
+  ctera_filer_drift:
+    sections: ['!hostname', '!location', '!network']
+    filer_host: "{{ golden_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+  register: golden
+
+- name: find the sections that drifted from the golden filer
+  ctera_filer_drift:
+    baseline: "{{ golden.fingerprints }}"
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+  register: drift
+  failed_when: drift.drifted | length > 0
+'''
+
+RETURN = '''
+fingerprints:
+  description: The fingerprint of each section
+  returned: success
+  type: dict
+  sample:
+    smb: 2d711642b726b04401627ca9fbac32f5c8530fb1903cc4db02258717921a4881
+    shares: 8a5edab282632443219e051e4ade2d1d5bbc671c781051bf1437897cbdfea0f1
+drifted:
+  description: The sections whose fingerprint is different from their fingerprint in the baseline
+  returned: When I(baseline) is set
+  type: list
+  sample: ['shares']
+'''
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_facts_utils as ctera_filer_facts_utils
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerDrift(CteraFilerBase):
+
+    def __init__(self):
+        super().__init__(
+            dict(
+                sections=dict(type='list', elements='str', required=False, default=['all']),
+                baseline=dict(type='dict')
+            ),
+            supports_check_mode=True
+        )
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Failed to fingerprint the configuration'
+
+    def _execute(self):
+        sections = ctera_filer_facts_utils.resolve_subset(self.parameters['sections'], ctera_filer_facts_utils.fingerprinted)
+        fingerprints = ctera_filer_facts_utils.gather_fingerprints(self._ctera_filer, sections, max_workers=self.ansible_module.params['ctera_pool_size'])
+        baseline = self.parameters.get('baseline')
+        if baseline is None:
+            self.ansible_module.ctera_return_value().msg('Fingerprinted %d sections' % len(fingerprints)).put(fingerprints=fingerprints)
+            return
+        drifted = [section for section in sections if section in baseline and baseline[section] != fingerprints[section]]
+        if drifted:
+            msg = 'Drifted from the baseline: %s' % ', '.join(drifted)
+        else:
+            msg = 'No drift from the baseline'
+        self.ansible_module.ctera_return_value().msg(msg).put(fingerprints=fingerprints, drifted=drifted)
+
+
+def main():  # pragma: no cover
+    CteraFilerDrift().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
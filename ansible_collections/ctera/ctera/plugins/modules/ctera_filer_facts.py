@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_facts
+short_description: Gather facts about a CTERA-Networks Filer
+description:
+    - Gather the configuration and state of the Filer in a single session.
+    - The facts are returned under C(ansible_facts.ctera_filer), so they are stored in the fact cache when fact caching is enabled.
+    - The subsets are read concurrently, over up to I(ctera_pool_size) connections to the Filer.
+version_added: "2.10"
+extends_documentation_fragment:
+    - ctera.ctera.filer
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  gather_subset:
+    description:
+    - The subsets of facts to gather
+    - Use C(all) to gather all the subsets, and prefix a subset with C(!) to exclude it
+    - If only exclusions are listed, all the other subsets are gathered
+    - 'The subsets are: hostname, location, timezone, license, network, syslog, smb, nfs, ftp, rsync, shares, users, volumes, cloud_services, cache, sync'
+    type: list
+    elements: str
+    default: ['all']
+'''
+
+EXAMPLES = '''
+- name: gather all the facts of the filer
+  ctera_filer_facts:
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+
+- name: gather the file services facts of the filer
+  ctera_filer_facts:
+    gather_subset:
+    - smb
+    - nfs
+    - shares
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+
+- name: print the shares of the filer
+  debug:
+    var: ansible_facts.ctera_filer.shares
+'''
+
+RETURN = '''
+ansible_facts:
+  description: The facts of the filer
+  returned: Always
+  type: complex
+  contains:
+    ctera_filer:
+      description: The gathered subsets, each under its own key
+      type: dict
+      sample:
+        hostname: vGateway-01ba
+        location: Tel Aviv
+        cache:
+          enabled: True
+'''
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_facts_utils as ctera_filer_facts_utils
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerFacts(CteraFilerBase):
+
+    def __init__(self):
+        super().__init__(
+            dict(
+                gather_subset=dict(type='list', elements='str', required=False, default=['all'])
+            ),
+            supports_check_mode=True
+        )
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Failed to gather facts'
+
+    def _execute(self):
+        subsets = ctera_filer_facts_utils.resolve_subset(self.parameters['gather_subset'])
+        facts = ctera_filer_facts_utils.gather_facts(self._ctera_filer, subsets, max_workers=self.ansible_module.params['ctera_pool_size'])
+        self.ansible_module.ctera_return_value().msg('Gathered facts').put(ansible_facts=dict(ctera_filer=facts))
+
+
+def main():  # pragma: no cover
+    CteraFilerFacts().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
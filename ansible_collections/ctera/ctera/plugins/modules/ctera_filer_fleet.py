@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_fleet
+short_description: Run a CTERA-Networks Filer module on many filers concurrently
+description:
+    - Run one of the Filer modules of the ctera.ctera collection on a list of filers, from a single task.
+    - The module runs in a bounded pool of threads inside the controller process, instead of in a new process with its own login per filer and task.
+    - Supports check mode and diff mode, which are passed on to the module.
+    - The logs of the CTERA SDK are not displayed.
+    - Requires ansible-core 2.19 or later, which can run modules inside the controller process.
+version_added: "2.10"
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  filers:
+    description:
+    - The filers to run the module on
+    - Each filer is either its host name, or a dictionary with C(filer_host) and optionally C(filer_user), C(filer_password) and C(filer_port)
+      to override the connection options of the task
+    type: list
+    elements: raw
+    required: True
+  module:
+    description: The short or fully qualified name of a Filer module of the ctera.ctera collection, such as C(ctera_filer_hostname)
+    type: str
+    required: True
+  module_args:
+    description: The arguments of the module, except for the connection options
+    type: dict
+    default: {}
+  concurrency:
+    description: The maximum number of filers the module runs on at any time
+    type: int
+    default: 20
+  filer_user:
+    description: User Name for communicating with the CTERA Networks Filers
+    type: str
+  filer_password:
+    description: Password of the user
+    type: str
+  filer_port:
+    description: The HTTP port of the CTERA Networks Filers. Defaults to 80
+    type: int
+
+notes:
+    - Runs on the controller. Use it in a play on C(localhost), or with C(run_once).
+
+requirements:
+    - cterasdk
+'''
+
+EXAMPLES = '''
+- name: Set the timezone of all the filers
+  ctera_filer_fleet:
+    module: ctera_filer_timezone
+    module_args:
+      timezone: "(GMT-05:00) Eastern Time (US , Canada)"
+    filers: "{{ groups['filers'] | map('extract', hostvars, 'ansible_host') | list }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+    concurrency: 50
+
+- name: Gather the facts of filers with different credentials
+  ctera_filer_fleet:
+    module: ctera.ctera.ctera_filer_facts
+    filers:
+    - filer_host: 192.168.1.10
+      filer_user: admin
+      filer_password: "{{ first_filer_password }}"
+    - filer_host: 192.168.1.11
+      filer_user: admin
+      filer_password: "{{ second_filer_password }}"
+'''
+
+RETURN = '''
+results:
+  description: The result of the module on each filer, in the order of C(filers), with the C(filer_host) it ran on
+  type: list
+  elements: dict
+  returned: always
+  sample: [{"changed": true, "msg": "Changed hostname", "filer_host": "192.168.1.10"}]
+failed_hosts:
+  description: The filers on which the module failed, with their port if one was set
+  type: list
+  elements: str
+  returned: always
+  sample: ["192.168.1.11"]
+ctera_timings:
+  description: The timings of the requests to all the filers, when C(ctera_timings=True) is set in C(module_args)
+  type: dict
+  returned: when C(ctera_timings=True)
+  sample: {"count": 6, "total": 0.1813, "p50": 0.0274, "p95": 0.0412, "slowest": {"name": "login", "duration": 0.0412, "success": true}, "calls": []}
+ctera_retries:
+  description: The number of requests to all the filers that were retried, by request
+  type: dict
+  returned: when requests were retried
+  sample: {"count": 2, "calls": {"get": 2}}
+'''
@@ -70,20 +70,12 @@ EXAMPLES = '''
 RETURN = r''' # '''
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_config_base import CteraFilerShareConfigBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
 
 
 class CteraFilerFtp(CteraFilerShareConfigBase):
     def __init__(self):
-        super().__init__(
-            dict(
-                require_ssl=dict(type='bool', required=False, default=False),
-                max_connections_per_ip=dict(type='int', required=False, default=5),
-                banner_message=dict(type='str', required=False, default='Welcome to CTERA FTP.'),
-                allow_anonymous_ftp=dict(type='bool', required=False, default=False),
-                anonymous_ftp_folder=dict(type='str', required=False),
-                anonymous_download_limit=dict(type='int', required=False, default=0),
-            )
-        )
+        super().__init__(ctera_filer_config_utils.ftp.options())
 
     @property
     def _share_type(self):
@@ -94,15 +86,7 @@ class CteraFilerFtp(CteraFilerShareConfigBase):
         return self._ctera_filer.ftp
 
     def _to_config_dict(self, config):
-        return dict(
-            mode=config.mode,
-            allow_anonymous_ftp=config.AllowAnonymousFTP,
-            anonymous_download_limit=config.AnonymousDownloadLimit,
-            anonymous_ftp_folder=config.AnonymousFTPFolder,
-            banner_message=config.BannerMessage,
-            max_connections_per_ip=config.MaxConnectionsPerIP,
-            require_ssl=config.RequireSSL
-        )
+        return ctera_filer_config_utils.to_ftp_dict(config)
 
 
 def main():  # pragma: no cover
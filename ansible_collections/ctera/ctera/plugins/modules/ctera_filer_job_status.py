@@ -0,0 +1,190 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_job_status
+short_description: Poll the status of an operation that continues on a CTERA-Networks Filer after the task that started it returned
+description:
+    - Poll the status of a job returned by a module that started a long-running operation on the Filer,
+      such as M(ctera.ctera.ctera_filer_device_reboot), M(ctera.ctera.ctera_filer_device_reset) and M(ctera.ctera.ctera_filer_cloud_cache).
+    - A reboot or a reset completes when the Filer answers again after it stopped answering,
+      and fails if the Filer did not stop answering within 60 seconds of the request.
+    - File eviction and the refresh of cloud folders complete when the Cloud Sync service is idle after it was busy,
+      or when it is still idle 30 seconds after the request, in which case the work may have completed between two polls.
+    - Whether the Filer stopped answering, and whether the Cloud Sync service was busy, is recorded in the returned I(job).
+      When the status is polled without I(wait), pass the I(job) returned by the previous poll to the next one.
+    - The module only reads the status of the Filer and never changes it.
+version_added: "2.10"
+extends_documentation_fragment:
+    - ctera.ctera.filer
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  job:
+    description: The job, as returned by the module that started the operation
+    required: True
+    type: dict
+  wait:
+    description:
+    - Wait until the job completes, fails, or the timeout expires
+    - If not set, the status is polled once
+    type: bool
+    default: False
+  timeout:
+    description: Seconds to wait for the job to complete
+    type: int
+    default: 600
+  poll_interval:
+    description:
+    - Seconds between two polls of the status
+    - The interval grows by half after every poll that returns the same status, up to I(max_poll_interval)
+    type: float
+    default: 1
+  max_poll_interval:
+    description: Maximum number of seconds between two polls of the status
+    type: float
+    default: 30
+
+requirements:
+    - cterasdk
+'''
+
+EXAMPLES = '''
+- name: Refresh the cloud folders
+  ctera_filer_cloud_cache:
+    refresh_folders: True
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+  register: cloud_cache
+
+- name: Wait for the refresh to complete
+  ctera_filer_job_status:
+    job: "{{ cloud_cache.job }}"
+    wait: True
+    timeout: 3600
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+  when: cloud_cache.job is defined
+'''
+
+RETURN = '''
+status:
+  description: The status of the job
+  returned: success
+  type: str
+  sample: completed
+finished:
+  description: Whether the job completed or failed
+  returned: success
+  type: bool
+  sample: True
+elapsed:
+  description: Seconds since the job started
+  returned: success
+  type: float
+  sample: 73.4
+job:
+  description: The job, updated with the progress seen by this poll
+  returned: success
+  type: dict
+  sample:
+    id: 0f8fad5bd9cb469fa16570867728950e
+    type: restart
+    filer: 192.168.1.10
+    port: null
+    started: 1603024472.218
+    stopped: True
+'''
+
+import time
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_job_utils as ctera_filer_job_utils
+
+
+class CteraFilerJobStatus(CteraFilerBase):
+
+    _backoff = 1.5
+
+    def __init__(self):
+        super().__init__(
+            dict(
+                job=dict(type='dict', required=True),
+                wait=dict(type='bool', required=False, default=False),
+                timeout=dict(type='int', required=False, default=600),
+                poll_interval=dict(type='float', required=False, default=1),
+                max_poll_interval=dict(type='float', required=False, default=30)
+            ),
+            login=False
+        )
+        # A restarting filer is polled without a session, and has no session to log out of
+        self._logout = False
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Failed to poll the status of the job'
+
+    def _execute(self):
+        job = self.parameters['job']
+        # Jobs returned before the port was recorded are matched on the host alone
+        port = self.parameters.get('filer_port')
+        if job.get('filer') != self.parameters['filer_host'] or job.get('port', port) != port:
+            filer = job.get('filer') if job.get('port') is None else '%s:%s' % (job.get('filer'), job.get('port'))
+            self.ansible_module.ctera_return_value().failed().msg('The job was started on %s' % filer).put(job=job)
+            return
+        tracker = ctera_filer_job_utils.get_tracker(job)
+        if tracker.needs_session:
+            self.ansible_module.ctera_login()
+            self._logout = True
+        status, message = self._poll(tracker)
+        finished = status != ctera_filer_job_utils.RUNNING
+        elapsed = round(time.time() - job.get('started', time.time()), 3)
+        self.ansible_module.ctera_return_value().msg(message).put(status=status, finished=finished, elapsed=elapsed, job=job)
+        if status == ctera_filer_job_utils.FAILED:
+            self.ansible_module.ctera_return_value().failed()
+        elif self.parameters['wait'] and not finished:
+            self.ansible_module.ctera_return_value().failed().msg('Timed out waiting for the job. %s' % message)
+
+    def _poll(self, tracker):
+        deadline = time.time() + self.parameters['timeout']
+        interval = self.parameters['poll_interval']
+        previous = None
+        while True:
+            # The status must be read from the filer on every poll, and not from the read cache
+            self.ansible_module.ctera_invalidate_read_cache()
+            status, message = tracker.poll(self._ctera_filer)
+            remaining = deadline - time.time()
+            if status != ctera_filer_job_utils.RUNNING or not self.parameters['wait'] or remaining <= 0:
+                return status, message
+            if message == previous:
+                interval = min(interval * self._backoff, self.parameters['max_poll_interval'])
+            else:
+                interval = self.parameters['poll_interval']
+            previous = message
+            time.sleep(min(interval, remaining))
+
+
+def main():  # pragma: no cover
+    CteraFilerJobStatus().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
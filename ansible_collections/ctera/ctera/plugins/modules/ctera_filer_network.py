@@ -85,32 +85,16 @@ RETURN = r''' # '''
 
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
-
-try:
-    from cterasdk import gateway_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
 
 
 class CteraFilerNetwork(CteraFilerBase):
-    _set_static_params = ['address', 'subnet', 'gateway', 'primary_dns_server', 'secondary_dns_server']
 
     def __init__(self):
         super().__init__(
-            dict(
-                mode=dict(required=False, type='str', choices=['dynamic', 'static'], default='dynamic'),
-                address=dict(type='str', required=False),
-                subnet=dict(type='str', required=False),
-                gateway=dict(type='str', required=False),
-                primary_dns_server=dict(type='str', required=False),
-                secondary_dns_server=dict(type='str', required=False)
-            ),
-            required_if=[
-                ('mode', 'static', ['address', 'subnet', 'gateway', 'primary_dns_server'])
-            ],
-            required_by=dict(
-                secondary_dns_server=['primary_dns_server']
-            )
+            ctera_filer_config_utils.network.options(),
+            required_if=ctera_filer_config_utils.network.required_if,
+            required_by=ctera_filer_config_utils.network.required_by
         )
 
     @property
@@ -134,6 +118,7 @@ class CteraFilerNetwork(CteraFilerBase):
             messages['skipped'].append("IP addressing mode is already set to dynamic")
         else:
             self._ctera_filer.network.enable_dhcp()
+            ctera_common.set_diff(self.ansible_module, config, dict(mode='dynamic'))
             messages['changed'].append("IP addressing mode changed to dynamic")
 
         if self.parameters.get('primary_dns_server'):
@@ -141,34 +126,28 @@ class CteraFilerNetwork(CteraFilerBase):
         ctera_common.set_result(self.ansible_module, messages)
 
     def _ensure_dns_servers(self, config, messages):
-        primary_dns_server = self.parameters['primary_dns_server']
-        secondary_dns_server = self.parameters.get('secondary_dns_server')
-        if primary_dns_server != config['primary_dns_server'] or secondary_dns_server != config['secondary_dns_server']:
-            self._ctera_filer.network.set_static_nameserver(primary_dns_server, secondary_dns_server=secondary_dns_server)
+        dns_servers = ctera_filer_config_utils.modified_dns_servers(config, self.parameters)
+        if dns_servers is not None:
+            self._ctera_filer.network.set_static_nameserver(dns_servers['primary_dns_server'], secondary_dns_server=dns_servers['secondary_dns_server'])
+            ctera_common.set_diff(self.ansible_module, config, dns_servers)
             messages['changed'].append("DNS Servers were set")
         else:
             messages['skipped'].append("DNS Servers did not change")
 
     def _ensure_static(self, config):
-        modified_attributes = ctera_common.get_modified_attributes(config, self.parameters)
-        if config['mode'] == 'static' and not modified_attributes:
+        modified_attributes = ctera_filer_config_utils.static_ip_modified_attributes(config, self.parameters)
+        if modified_attributes is None:
             self.ansible_module.ctera_return_value().msg("IP Configuration did not change")
             return
-        self._ctera_filer.network.set_static_ipaddr(**ctera_common.filter_parameters(self.parameters, CteraFilerNetwork._set_static_params))
+        self._ctera_filer.network.set_static_ipaddr(**ctera_common.filter_parameters(self.parameters, ctera_filer_config_utils.static_ip_params))
+        ctera_common.set_diff(self.ansible_module, config, dict(mode='static', **modified_attributes))
         self.ansible_module.ctera_return_value().changed().msg("IP Configuration set")
 
     def _get_current_config(self):
         return self._to_config_dict(self._ctera_filer.network.ifconfig().ip)
 
     def _to_config_dict(self, config):
-        return dict(
-            mode='dynamic' if config.DHCPMode == gateway_enum.Mode.Enabled else 'static',
-            address=config.address,
-            subnet=config.netmask,
-            gateway=config.gateway,
-            primary_dns_server=config.DNSServer1,
-            secondary_dns_server=config.DNSServer2
-        )
+        return ctera_filer_config_utils.to_network_dict(config)
 
 
 def main():  # pragma: no cover
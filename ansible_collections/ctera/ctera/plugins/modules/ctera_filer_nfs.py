@@ -56,21 +56,12 @@ EXAMPLES = '''
 RETURN = r''' # '''
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_config_base import CteraFilerShareConfigBase
-
-try:
-    from cterasdk import gateway_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
 
 
 class CteraFilerNfs(CteraFilerShareConfigBase):
     def __init__(self):
-        super().__init__(
-            dict(
-                async_write=dict(type='bool', required=False, default=True),
-                aggregate_writes=dict(type='bool', required=False, default=True),
-            ),
-        )
+        super().__init__(ctera_filer_config_utils.nfs.options())
 
     @property
     def _share_type(self):
@@ -81,11 +72,7 @@ class CteraFilerNfs(CteraFilerShareConfigBase):
         return self._ctera_filer.nfs
 
     def _to_config_dict(self, config):
-        return dict(
-            mode=config.mode,
-            async_write=(getattr(config, 'async') == gateway_enum.Mode.Enabled),
-            aggregate_writes=(config.aggregateWrites == gateway_enum.Mode.Enabled),
-        )
+        return ctera_filer_config_utils.to_nfs_dict(config)
 
 
 def main():  # pragma: no cover
@@ -55,16 +55,12 @@ EXAMPLES = '''
 RETURN = r''' # '''
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_config_base import CteraFilerShareConfigBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
 
 
 class CteraFilerRSync(CteraFilerShareConfigBase):
     def __init__(self):
-        super().__init__(
-            dict(
-                port=dict(type='int', required=False, default=873),
-                max_connections=dict(type='int', required=False, default=25),
-            )
-        )
+        super().__init__(ctera_filer_config_utils.rsync.options())
 
     @property
     def _share_type(self):
@@ -79,11 +75,7 @@ class CteraFilerRSync(CteraFilerShareConfigBase):
         return 'server'
 
     def _to_config_dict(self, config):
-        return dict(
-            server=config.server,
-            port=config.port,
-            max_connections=config.maxConnections,
-        )
+        return ctera_filer_config_utils.to_rsync_dict(config)
 
 
 def main():  # pragma: no cover
@@ -69,6 +69,16 @@ options:
         - ReadOnly
         - None
         required: True
+  acl_mode:
+    description:
+    - How C(acl) is applied to an existing share
+    - C(replace) sets the Access Control Entries of the share to C(acl)
+    - C(append) adds the entries of C(acl) and updates the permission of entries that already exist, leaving the other entries as they are
+    - C(remove) removes the entries of C(acl), matched by principal type and name, leaving the other entries as they are
+    - Only the Access Control Entries of the share are updated when they are the only change
+    type: str
+    choices: ['append', 'remove', 'replace']
+    default: replace
   access:
     description: The Windows File Sharing authentication mode
     type: str
@@ -130,6 +140,18 @@ EXAMPLES = '''
     filer_host: "{{ ctera_filer_hostname }}"
     filer_user: "{{ ctera_filer_user }}"
     filer_password: "{{ ctera_filer_password }}"
+
+- name: grant a group read only access to a share
+  ctera_filer_share:
+    name: demo
+    acl:
+    - name: Auditors
+      principal_type: DomainGroup
+      perm: ReadOnly
+    acl_mode: append
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
 '''
 
 RETURN = '''
@@ -141,59 +163,18 @@ name:
 '''
 
 
-import os
-
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_utils as ctera_filer_share_utils
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
-
-try:
-    from cterasdk import CTERAException, gateway_enum, gateway_types
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
 
 
 class CteraFilerShare(CteraFilerBase):
-    _add_params = [
-        'name',
-        'directory',
-        'acl',
-        'access',
-        'csc',
-        'dir_permissions',
-        'comment',
-        'export_to_afp',
-        'export_to_ftp',
-        'export_to_nfs',
-        'export_to_pc_agent',
-        'export_to_rsync',
-        'indexed'
-    ]
 
     def __init__(self):
         super().__init__(dict(
             state=dict(required=False, choices=['present', 'absent'], default='present'),
-            name=dict(type='str', required=True),
-            directory=dict(type='str', required=False),
-            acl=dict(
-                type='list',
-                required=False,
-                elements='dict',
-                options=dict(
-                    principal_type=dict(required=True, choices=['LocalUser', 'LocalGroup', 'DomainUser', 'DomainGroup']),
-                    name=dict(required=True),
-                    perm=dict(required=True, choices=['ReadWrite', 'ReadOnly', 'None']),
-                )
-            ),
-            access=dict(required=False, choices=['winAclMode', 'authenticated'], default='winAclMode'),
-            csc=dict(required=False, choices=['manual', 'documents', 'disabled'], default='manual'),
-            dir_permissions=dict(required=False, type='int', default=777),
-            comment=dict(type='str', required=False),
-            export_to_afp=dict(type='bool', required=False, default=False),
-            export_to_ftp=dict(type='bool', required=False, default=False),
-            export_to_nfs=dict(type='bool', required=False, default=False),
-            export_to_pc_agent=dict(type='bool', required=False, default=False),
-            export_to_rsync=dict(type='bool', required=False, default=False),
-            indexed=dict(type='bool', required=False, default=False)
+            **ctera_filer_share_utils.share_argument_spec()
         ))
 
     @property
@@ -212,10 +193,10 @@ class CteraFilerShare(CteraFilerBase):
         share = None
         try:
             share = self._ctera_filer.shares.get(name=self.parameters['name'])
-        except CTERAException as error:
+        except ctera_sdk.CTERAException as error:
             if error.response.code != 404:  # pylint: disable=no-member
                 raise
-        return self._to_share_dict(share) if share else None
+        return ctera_filer_share_utils.to_share_dict(share) if share else None
 
     def _ensure_present(self, share):
         if share:
@@ -224,21 +205,15 @@ class CteraFilerShare(CteraFilerBase):
             self._add_share()
 
     def _add_share(self):
-        add_params = {k: v for k, v in self.parameters.items() if k in CteraFilerShare._add_params}
-        if add_params.get('directory') is None:
-            raise CTERAException(message="Cannot create new share without a directory")
-        if add_params.get('acl') is not None:
-            add_params['acl'] = [self._make_ShareAccessControlEntry(acl_entry) for acl_entry in add_params['acl']]
-        self._ctera_filer.shares.add(**add_params)
+        ctera_filer_share_utils.add_share(self._ctera_filer, self.parameters)
+        ctera_common.set_diff(self.ansible_module, None, ctera_common.filter_parameters(self.parameters, ctera_filer_share_utils.add_params))
         self.ansible_module.ctera_return_value().changed().msg('Share created').put(name=self.parameters['name'])
 
     def _handle_modify(self, share):
-        modified_attributes = ctera_common.get_modified_attributes(share, self.parameters)
+        modified_attributes = ctera_filer_share_utils.get_modified_share_attributes(share, self.parameters)
         if modified_attributes:
-            acl_changes = modified_attributes.get('acl')
-            if acl_changes is not None:
-                modified_attributes['acl'] = [self._make_ShareAccessControlEntry(acl_entry) for acl_entry in acl_changes]
-            self._ctera_filer.shares.modify(self.parameters['name'], **modified_attributes)
+            ctera_common.set_diff(self.ansible_module, share, modified_attributes)
+            ctera_filer_share_utils.modify_share(self._ctera_filer, self.parameters['name'], modified_attributes)
             self.ansible_module.ctera_return_value().changed().msg('Share modified').put(name=self.parameters['name'])
         else:
             self.ansible_module.ctera_return_value().skipped().msg('Share details did not change').put(name=self.parameters['name'])
@@ -246,45 +221,11 @@ class CteraFilerShare(CteraFilerBase):
     def _ensure_absent(self, share):
         if share:
             self._ctera_filer.shares.delete(self.parameters['name'])
+            ctera_common.set_diff(self.ansible_module, share, None)
             self.ansible_module.ctera_return_value().changed().msg('Share deleted').put(name=self.parameters['name'])
         else:
             self.ansible_module.ctera_return_value().skipped().msg('Share does not exist').put(name=self.parameters['name'])
 
-    @staticmethod
-    def _make_ShareAccessControlEntry(acl_dict):
-        return gateway_types.ShareAccessControlEntry(principal_type=acl_dict['principal_type'], name=acl_dict['name'], perm=acl_dict['perm'])
-
-    @staticmethod
-    def _to_share_dict(share_obj):
-        share_dict = {}
-        share_dict['name'] = share_obj.name
-        share_dict['directory'] = os.path.join(share_obj.volume, share_obj.directory[1:])
-        share_dict['acl'] = [CteraFilerShare._to_acl_dict(acl_entry) for acl_entry in share_obj.acl]
-        share_dict['access'] = share_obj.access
-        share_dict['csc'] = share_obj.clientSideCaching
-        share_dict['dir_permissions'] = share_obj.dirPermissions
-        share_dict['comment'] = share_obj.comment
-        share_dict['export_to_afp'] = share_obj.exportToAFP
-        share_dict['export_to_ftp'] = share_obj.exportToFTP
-        share_dict['export_to_nfs'] = share_obj.exportToNFS
-        share_dict['export_to_pc_agent'] = share_obj.exportToPCAgent
-        share_dict['export_to_rsync'] = share_obj.exportToRSync
-        share_dict['indexed'] = share_obj.indexed
-        return share_dict
-
-    @staticmethod
-    def _to_acl_dict(acl_obj):
-        acl_dict = {}
-        acl_dict['perm'] = acl_obj.permissions.allowedFileAccess
-        acl_dict['principal_type'] = acl_obj.principal2._classname  # pylint: disable=protected-access
-        if acl_dict['principal_type'] in [gateway_enum.PrincipalType.LU, gateway_enum.PrincipalType.LG]:
-            name = acl_obj.principal2.ref
-            name = name[name.rfind('#') + 1:]
-        else:
-            name = acl_obj.principal2.name
-        acl_dict['name'] = name
-        return acl_dict
-
 
 def main():  # pragma: no cover
     CteraFilerShare().run()
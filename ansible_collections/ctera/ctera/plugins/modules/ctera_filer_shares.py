@@ -0,0 +1,281 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_shares
+short_description: CTERA Filer bulk share configuration and management
+description:
+    - Create, modify and delete a list of shares in a single session.
+    - The current shares are retrieved once, and only the shares that differ from the desired list are added, modified or deleted.
+    - This module does not handle the creation of the directories and share creation will fail if the directory does not exist
+    - If a share fails to be added, modified or deleted, the task fails and returns the shares that were changed before it.
+version_added: "2.10"
+extends_documentation_fragment:
+    - ctera.ctera.filer
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  shares:
+    description: List of shares
+    required: True
+    type: list
+    elements: dict
+    suboptions:
+      state:
+        description:
+        - Whether the specified share should exist or not.
+        type: str
+        choices: ['present', 'absent']
+        default: 'present'
+      name:
+        description: The name of the share
+        required: True
+        type: str
+      directory:
+        description:
+        - The directory to share
+        - Required when C(state=present) and the share does not exist
+        type: str
+      acl:
+        description: List of Access Control Entries
+        type: list
+        suboptions:
+          principal_type:
+            description: The principal type
+            type: str
+            choices:
+            - LocalUser
+            - LocalGroup
+            - DomainUser
+            - DomainGroup
+            required: True
+          name:
+            description: The name of the user or group
+            type: str
+            required: True
+          perm:
+            description: The file access permission
+            type: str
+            choices:
+            - ReadWrite
+            - ReadOnly
+            - None
+            required: True
+      acl_mode:
+        description:
+        - How C(acl) is applied to an existing share
+        - C(replace) sets the Access Control Entries of the share to C(acl)
+        - C(append) adds the entries of C(acl) and updates the permission of entries that already exist, leaving the other entries as they are
+        - C(remove) removes the entries of C(acl), matched by principal type and name, leaving the other entries as they are
+        - Only the Access Control Entries of the share are updated when they are the only change
+        type: str
+        choices: ['append', 'remove', 'replace']
+        default: replace
+      access:
+        description: The Windows File Sharing authentication mode
+        type: str
+        choices:
+        - winAclMode
+        - authenticated
+        default: winAclMode
+      csc:
+        description: The client side caching (offline files) configuration
+        type: str
+        choices:
+        - manual
+        - documents
+        - disabled
+        default: manual
+      dir_permissions:
+        description: Directory Permission
+        type: int
+        default: 777
+      export_to_afp:
+        description: Export the share to AFP
+        type: bool
+        default: False
+      export_to_ftp:
+        description: Export the share to FTP
+        type: bool
+        default: False
+      export_to_nfs:
+        description: Export the share to NFS
+        type: bool
+        default: False
+      export_to_pc_agent:
+        description: Export the share to PC Agent
+        type: bool
+        default: False
+      export_to_rsync:
+        description: Export the share to RSync
+        type: bool
+        default: False
+      indexed:
+        description: Enabled indexing
+        type: bool
+        default: False
+      comment:
+        description: Comment
+        type: str
+  purge:
+    description: Delete all the existing shares that are not in the list
+    type: bool
+    default: False
+'''
+
+EXAMPLES = '''
+- name: manage the shares of the filer
+  ctera_filer_shares:
+    shares:
+    - name: demo
+      directory: /main/public/demo
+      acl:
+      - name: Everyone
+        principal_type: LocalGroup
+        perm: ReadWrite
+      access: authenticated
+    - name: legacy
+      state: absent
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+
+- name: make sure the filer has only the listed shares
+  ctera_filer_shares:
+    shares: "{{ filer_shares }}"
+    purge: True
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+'''
+
+RETURN = '''
+added:
+  description: The names of the shares that were created
+  returned: Always
+  type: list
+  sample: ['demo']
+modified:
+  description: The names of the shares that were modified
+  returned: Always
+  type: list
+  sample: ['public']
+deleted:
+  description: The names of the shares that were deleted
+  returned: Always
+  type: list
+  sample: ['legacy']
+'''
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_utils as ctera_filer_share_utils
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+class CteraFilerShares(CteraFilerBase):
+
+    def __init__(self):
+        super().__init__(dict(
+            shares=dict(
+                type='list',
+                required=True,
+                elements='dict',
+                options=dict(
+                    state=dict(required=False, choices=['present', 'absent'], default='present'),
+                    **ctera_filer_share_utils.share_argument_spec()
+                )
+            ),
+            purge=dict(type='bool', required=False, default=False)
+        ))
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Share management failed'
+
+    def _execute(self):
+        desired_shares = [ctera_common.get_parameters(share) for share in self.parameters['shares']]
+        names = [share['name'] for share in desired_shares]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ctera_sdk.CTERAException(message="Shares listed more than once: %s" % ', '.join(duplicates))
+
+        current_shares = self._get_shares()
+        result = dict(added=[], modified=[], deleted=[])
+        messages = {'changed': [], 'skipped': []}
+        name = None
+        try:
+            for desired_share in desired_shares:
+                name = desired_share['name']
+                state = desired_share.pop('state')
+                if state == 'present':
+                    self._ensure_present(current_shares.get(name), desired_share, result, messages)
+                else:
+                    self._ensure_absent(current_shares.get(name), name, result, messages)
+            if self.parameters['purge']:
+                for name in sorted(set(current_shares) - set(names)):
+                    self._ensure_absent(current_shares[name], name, result, messages)
+        except ctera_sdk.CTERAException as error:
+            # The shares before the one that failed were already added, modified or deleted
+            if messages['changed']:
+                self.ansible_module.ctera_return_value().changed()
+            self.ansible_module.ctera_return_value().failed().msg('Failed to manage share %s. Exception: %s' % (
+                name, ctera_sdk.tojsonstr(error, False)
+            )).put(**result)
+            return
+
+        ctera_common.set_result(self.ansible_module, messages)
+        self.ansible_module.ctera_return_value().put(**result)
+
+    def _get_shares(self):
+        return {share.name: ctera_filer_share_utils.to_share_dict(share) for share in self._ctera_filer.shares.get()}
+
+    def _ensure_present(self, current_share, desired_share, result, messages):
+        name = desired_share['name']
+        if current_share is None:
+            ctera_filer_share_utils.add_share(self._ctera_filer, desired_share)
+            ctera_common.set_diff(self.ansible_module, None, ctera_common.filter_parameters(desired_share, ctera_filer_share_utils.add_params), name)
+            result['added'].append(name)
+            messages['changed'].append('Share %s created.' % name)
+            return
+        modified_attributes = ctera_filer_share_utils.get_modified_share_attributes(current_share, desired_share)
+        if modified_attributes:
+            ctera_common.set_diff(self.ansible_module, current_share, modified_attributes, name)
+            ctera_filer_share_utils.modify_share(self._ctera_filer, name, modified_attributes)
+            result['modified'].append(name)
+            messages['changed'].append('Share %s modified.' % name)
+        else:
+            messages['skipped'].append('Share %s did not change.' % name)
+
+    def _ensure_absent(self, current_share, name, result, messages):
+        if current_share is None:
+            messages['skipped'].append('Share %s does not exist.' % name)
+            return
+        self._ctera_filer.shares.delete(name)
+        ctera_common.set_diff(self.ansible_module, current_share, None, name)
+        result['deleted'].append(name)
+        messages['changed'].append('Share %s deleted.' % name)
+
+
+def main():  # pragma: no cover
+    CteraFilerShares().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
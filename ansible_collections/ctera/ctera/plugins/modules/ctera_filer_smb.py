@@ -72,24 +72,12 @@ EXAMPLES = '''
 RETURN = r''' # '''
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_config_base import CteraFilerShareConfigBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
 
 
 class CteraFilerSmb(CteraFilerShareConfigBase):
     def __init__(self):
-        super().__init__(
-            dict(
-                packet_signing=dict(
-                    type='str',
-                    required=False,
-                    default='Disabled',
-                    choices=['Disabled', 'If client agrees', 'Required']
-                ),
-                idle_disconnect_time=dict(type='int', required=False, default=10),
-                compatibility_mode=dict(type='bool', required=False, default=False),
-                unix_extensions=dict(type='bool', required=False, default=True),
-                abe_enabled=dict(type='bool', required=False, default=False),
-            ),
-        )
+        super().__init__(ctera_filer_config_utils.smb.options())
 
     @property
     def _share_type(self):
@@ -100,7 +88,7 @@ class CteraFilerSmb(CteraFilerShareConfigBase):
         return self._ctera_filer.smb
 
     def _to_config_dict(self, config):
-        return {k: v for k, v in config.__dict__.items() if not k.startswith("_")}
+        return ctera_filer_config_utils.to_smb_dict(config)
 
 
 def main():  # pragma: no cover
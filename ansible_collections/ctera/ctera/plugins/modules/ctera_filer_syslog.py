@@ -84,31 +84,16 @@ server:
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
-
-try:
-    from cterasdk import gateway_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
 
 
 class CteraFilerSyslog(CteraFilerBase):
-    _enable_params = ['server', 'port', 'proto', 'min_severity']
 
     def __init__(self):
         super().__init__(
-            dict(
-                enabled=dict(type='bool', required=False, default=True),
-                server=dict(type='str', required=False),
-                port=dict(type='int', required=False, default=514),
-                proto=dict(type='str', required=False, default='UDP', choices=['TCP', 'UDP']),
-                min_severity=dict(
-                    type='str',
-                    required=False,
-                    default='info',
-                    choices=['emergency', 'alert', 'critical', 'error', 'warning', 'notice', 'info', 'debug']
-                )
-            ),
-            required_if=[('enabled', True, ['server'])]
+            ctera_filer_config_utils.syslog.options(),
+            required_if=ctera_filer_config_utils.syslog.required_if
         )
 
     @property
@@ -124,21 +109,24 @@ class CteraFilerSyslog(CteraFilerBase):
             self._ensure_disabled(current_config)
 
     def _ensure_enabled(self, current_config):
-        if current_config['mode'] == gateway_enum.Mode.Enabled:
+        if ctera_filer_config_utils.is_enabled(current_config):
             modified_attributes = ctera_common.get_modified_attributes(current_config, self.parameters)
             if modified_attributes:
                 self._ctera_filer.syslog.modify(**modified_attributes)
+                ctera_common.set_diff(self.ansible_module, current_config, modified_attributes)
                 self.ansible_module.ctera_return_value().changed().msg('Updated Syslog server configuration').put(server=self.parameters['server'])
             else:
                 self.ansible_module.ctera_return_value().msg('Syslog server details did not change').put(server=self.parameters['server'])
         else:
-            enable_params = {k: v for k, v in self.parameters.items() if k in CteraFilerSyslog._enable_params}
+            enable_params = ctera_common.filter_parameters(self.parameters, ctera_filer_config_utils.syslog_enable_params)
             self._ctera_filer.syslog.enable(**enable_params)
+            ctera_common.set_diff(self.ansible_module, current_config, dict(mode=ctera_sdk.gateway_enum.Mode.Enabled, **enable_params))
             self.ansible_module.ctera_return_value().changed().msg('Syslog server enabled')
 
     def _ensure_disabled(self, current_config):
-        if current_config['mode'] == gateway_enum.Mode.Enabled:
+        if ctera_filer_config_utils.is_enabled(current_config):
             self._ctera_filer.syslog.disable()
+            ctera_common.set_diff(self.ansible_module, current_config, dict(mode=ctera_sdk.gateway_enum.Mode.Disabled))
             self.ansible_module.ctera_return_value().changed().msg('Syslog server disabled')
         else:
             self.ansible_module.ctera_return_value().msg('Syslog server already disabled')
@@ -148,9 +136,7 @@ class CteraFilerSyslog(CteraFilerBase):
 
     @staticmethod
     def _to_config_dict(config):
-        config_dict = {k: v for k, v in config.__dict__.items() if not k.startswith("_")}
-        config_dict['min_severity'] = config_dict.pop('minSeverity', None)
-        return config_dict
+        return ctera_filer_config_utils.to_syslog_dict(config)
 
 
 def main():  # pragma: no cover
@@ -91,25 +91,17 @@ uid:
 '''
 
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_user_utils as ctera_filer_user_utils
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
-
-try:
-    from cterasdk import CTERAException
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
 
 
 class CteraFilerUser(CteraFilerBase):
-    _create_params = ['username', 'password', 'full_name', 'email', 'uid']
 
     def __init__(self):
         super().__init__(dict(
             state=dict(required=False, choices=['present', 'absent'], default='present'),
-            username=dict(type='str', required=True),
-            password=dict(type='str', required=False, no_log=True),
-            full_name=dict(type='str', required=False),
-            email=dict(type='str', required=False),
-            uid=dict(type='str', required=False)
+            **ctera_filer_user_utils.user_argument_spec()
         ))
 
     @property
@@ -128,41 +120,33 @@ class CteraFilerUser(CteraFilerBase):
         user = None
         try:
             user = self._ctera_filer.users.get(name=self.parameters['username'])
-        except CTERAException as error:
+        except ctera_sdk.CTERAException as error:
             if error.response.code != 404:  # pylint: disable=no-member
                 raise
-        return self._to_user_dict(user) if user else None
+        return ctera_filer_user_utils.to_user_dict(user) if user else None
 
     def _ensure_present(self, user):
         if user:
             modified_attributes = ctera_common.get_modified_attributes(user, self.parameters)
             if modified_attributes:
                 self._ctera_filer.users.modify(self.parameters['username'], **modified_attributes)
+                ctera_common.set_diff(self.ansible_module, user, modified_attributes)
                 self.ansible_module.ctera_return_value().changed().msg('User modified').put(username=self.parameters['username'], **modified_attributes)
             else:
                 self.ansible_module.ctera_return_value().skipped().msg('User details did not change').put(username=self.parameters['username'])
         else:
-            create_params = {k: v for k, v in self.parameters.items() if k in CteraFilerUser._create_params}
-            if create_params.get('password') is None:
-                raise CTERAException(message="Cannot create new user without a password")
-            self._ctera_filer.users.add(**create_params)
+            create_params = ctera_filer_user_utils.add_user(self._ctera_filer, self.parameters)
+            ctera_common.set_diff(self.ansible_module, None, create_params)
             self.ansible_module.ctera_return_value().changed().msg('User created').put(**create_params)
 
     def _ensure_absent(self, user):
         if user:
             self._ctera_filer.users.delete(self.parameters['username'])
+            ctera_common.set_diff(self.ansible_module, user, None)
             self.ansible_module.ctera_return_value().changed().msg('User deleted').put(username=self.parameters['username'])
         else:
             self.ansible_module.ctera_return_value().skipped().msg('User already does not exist').put(username=self.parameters['username'])
 
-    @staticmethod
-    def _to_user_dict(user):
-        user_dict = {k: v for k, v in user.__dict__.items() if not k.startswith("_")}
-        full_name = user_dict.pop('fullName', None)
-        if full_name is not None:
-            user_dict['full_name'] = full_name
-        return user_dict
-
 
 def main():  # pragma: no cover
     CteraFilerUser().run()
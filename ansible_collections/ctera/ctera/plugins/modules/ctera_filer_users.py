@@ -0,0 +1,195 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_users
+short_description: CTERA-Networks Filer bulk user configuration and management
+description:
+    - Create, modify and delete a list of local users in a single session.
+    - The current users are retrieved once, and only the users that differ from the desired list are added, modified or deleted.
+    - If a user fails to be added, modified or deleted, the task fails and returns the outcome for the users listed before it.
+version_added: "2.10"
+extends_documentation_fragment:
+    - ctera.ctera.filer
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  users:
+    description: List of users
+    required: True
+    type: list
+    elements: dict
+    suboptions:
+      state:
+        description:
+        - Whether the specified user should exist or not.
+        type: str
+        choices: ['present', 'absent']
+        default: 'present'
+      username:
+        description: The name of the user
+        required: True
+        type: str
+      email:
+        description: The e-mail address of the user
+        type: str
+      full_name:
+        description: The full name of the user
+        type: str
+      password:
+        description:
+        - The password of the user
+        - Required when C(state=present) and the user does not exist
+        type: str
+      uid:
+        description: ID for the user
+        type: str
+'''
+
+EXAMPLES = '''
+- name: onboard local users
+  ctera_filer_users:
+    users:
+    - username: 'alice'
+      email: 'walice@wonderland.com'
+      full_name: 'Alice Wonderland'
+      password: 'su@p3rsecret!!'
+    - username: 'bob'
+      password: 'b0b$ecret'
+    - username: 'eve'
+      state: absent
+    filer_host: "{{ ctera_filer_hostname }}"
+    filer_user: "{{ ctera_filer_user }}"
+    filer_password: "{{ ctera_filer_password }}"
+'''
+
+RETURN = '''
+users:
+  description: The outcome for each of the listed users
+  returned: Always
+  type: list
+  elements: dict
+  contains:
+    username:
+      description: User name of the user
+      type: str
+      sample: alice
+    status:
+      description: What was done for the user
+      type: str
+      sample: created
+      choices: ['created', 'modified', 'deleted', 'unchanged', 'absent']
+    changed:
+      description: Whether the user was changed
+      type: bool
+      sample: True
+    modified_attributes:
+      description: The names of the modified attributes
+      type: list
+      returned: when status is modified
+      sample: ['email']
+'''
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_user_utils as ctera_filer_user_utils
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+
+class CteraFilerUsers(CteraFilerBase):
+
+    def __init__(self):
+        super().__init__(dict(
+            users=dict(
+                type='list',
+                required=True,
+                elements='dict',
+                options=dict(
+                    state=dict(required=False, choices=['present', 'absent'], default='present'),
+                    **ctera_filer_user_utils.user_argument_spec()
+                )
+            )
+        ))
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'User management failed'
+
+    def _execute(self):
+        desired_users = [ctera_common.get_parameters(user) for user in self.parameters['users']]
+        usernames = [user['username'] for user in desired_users]
+        duplicates = sorted({username for username in usernames if usernames.count(username) > 1})
+        if duplicates:
+            raise ctera_sdk.CTERAException(message="Users listed more than once: %s" % ', '.join(duplicates))
+
+        current_users = self._get_users()
+        results = []
+        messages = {'changed': [], 'skipped': []}
+        for desired_user in desired_users:
+            state = desired_user.pop('state')
+            current_user = current_users.get(desired_user['username'])
+            try:
+                if state == 'present':
+                    result = self._ensure_present(current_user, desired_user)
+                else:
+                    result = self._ensure_absent(current_user, desired_user['username'])
+            except ctera_sdk.CTERAException as error:
+                # The users before the one that failed were already created, modified or deleted
+                if messages['changed']:
+                    self.ansible_module.ctera_return_value().changed()
+                self.ansible_module.ctera_return_value().failed().msg('Failed to manage user %s. Exception: %s' % (
+                    desired_user['username'], ctera_sdk.tojsonstr(error, False)
+                )).put(users=results)
+                return
+            messages['changed' if result['changed'] else 'skipped'].append('User %s %s.' % (result['username'], result['status']))
+            results.append(result)
+
+        ctera_common.set_result(self.ansible_module, messages)
+        self.ansible_module.ctera_return_value().put(users=results)
+
+    def _get_users(self):
+        return {user.username: ctera_filer_user_utils.to_user_dict(user) for user in self._ctera_filer.users.get()}
+
+    def _ensure_present(self, current_user, desired_user):
+        username = desired_user['username']
+        if current_user is None:
+            create_params = ctera_filer_user_utils.add_user(self._ctera_filer, desired_user)
+            ctera_common.set_diff(self.ansible_module, None, create_params, username)
+            return dict(username=username, status='created', changed=True)
+        modified_attributes = ctera_common.get_modified_attributes(current_user, desired_user)
+        if modified_attributes:
+            self._ctera_filer.users.modify(username, **modified_attributes)
+            ctera_common.set_diff(self.ansible_module, current_user, modified_attributes, username)
+            return dict(username=username, status='modified', changed=True, modified_attributes=sorted(modified_attributes))
+        return dict(username=username, status='unchanged', changed=False)
+
+    def _ensure_absent(self, current_user, username):
+        if current_user is None:
+            return dict(username=username, status='absent', changed=False)
+        self._ctera_filer.users.delete(username)
+        ctera_common.set_diff(self.ansible_module, current_user, None, username)
+        return dict(username=username, status='deleted', changed=True)
+
+
+def main():  # pragma: no cover
+    CteraFilerUsers().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
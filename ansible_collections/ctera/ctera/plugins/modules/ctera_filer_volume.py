@@ -83,25 +83,15 @@ size:
 
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
-
-try:
-    from cterasdk import CTERAException
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
 
 
 class CteraFilerVolume(CteraFilerBase):
     _create_params = ['name', 'size', 'filesystem', 'device', 'passphrase']
 
     def __init__(self):
-        super().__init__(dict(
-            state=dict(required=False, choices=['present', 'absent'], default='present'),
-            name=dict(type='str', required=True),
-            size=dict(type='int', required=False),
-            filesystem=dict(type='str', required=False),
-            device=dict(type='str', required=False),
-            passphrase=dict(type='str', required=False, no_log=True)
-        ))
+        super().__init__(ctera_filer_config_utils.volumes.options())
 
     @property
     def _generic_failure_message(self):  # pragma: no cover
@@ -122,6 +112,7 @@ class CteraFilerVolume(CteraFilerBase):
                 desired_size = modified_attributes.get('size')
                 if desired_size is not None:
                     self._ctera_filer.volumes.modify(self.parameters['name'], size=desired_size)
+                    ctera_common.set_diff(self.ansible_module, volume, dict(size=desired_size))
                     self.ansible_module.ctera_return_value().changed().msg('Volume  modified').put(
                         name=self.parameters['name'], size=desired_size)
                 else:
@@ -132,11 +123,13 @@ class CteraFilerVolume(CteraFilerBase):
         else:
             create_params = {k: v for k, v in self.parameters.items() if k in CteraFilerVolume._create_params}
             self._ctera_filer.volumes.add(**create_params)
+            ctera_common.set_diff(self.ansible_module, None, create_params)
             self.ansible_module.ctera_return_value().changed().msg('Volume created').put(**create_params)
 
     def _ensure_absent(self, volume):
         if volume:
             self._ctera_filer.volumes.delete(self.parameters['name'])
+            ctera_common.set_diff(self.ansible_module, volume, None)
             self.ansible_module.ctera_return_value().changed().msg('Volume deleted').put(name=self.parameters['name'])
         else:
             self.ansible_module.ctera_return_value().skipped().msg('Volume already does not exist').put(name=self.parameters['name'])
@@ -145,15 +138,14 @@ class CteraFilerVolume(CteraFilerBase):
         volume = None
         try:
             volume = self._ctera_filer.volumes.get(name=self.parameters['name'])
-        except CTERAException as error:
+        except ctera_sdk.CTERAException as error:
             if error.response.code != 404:  # pylint: disable=no-member
                 raise
         return self._to_volume_dict(volume) if volume else {}
 
     @staticmethod
     def _to_volume_dict(volume):
-        volume_dict = {k: v for k, v in volume.__dict__.items() if not k.startswith("_")}
-        return volume_dict
+        return ctera_filer_config_utils.to_volume_dict(volume)
 
 
 def main():  # pragma: no cover
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import shutil
+import sys
+
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible.utils.vars import merge_hash
+
+from ansible_collections.ctera.ctera.plugins.plugin_utils import ctera_module_runner
+
+
+class CteraFilerAction(ActionBase):
+    """
+    Run the Filer module of the task in the controller process, instead of packaging it and running it in a new interpreter.
+
+    The modules only send requests to the filer, so when the ctera_in_process variable is true and they would have run on the controller anyway,
+    that is when the connection is local or ctera.ctera.ctera_filer, they run in-process and return the same result. Otherwise, or when the task
+    is asynchronous, or when ansible-core is too old to run modules in-process, the module runs on the host as usual.
+    The module also runs on the host when the task sets an environment, or when the Python interpreter of the host is not the one
+    of the controller, since the environment and the interpreter, and the packages installed for it, would not apply in-process.
+
+    The options in host_options can also be set for a host or a group as variables of the same name, which apply unless the task sets them.
+    """
+
+    TRANSFERS_FILES = False
+    _supports_check_mode = True
+    _supports_async = True
+
+    in_process_connections = ('local', 'ansible.builtin.local', 'ctera_filer', 'ctera.ctera.ctera_filer')
+    host_options = ('ctera_rate_limit', 'ctera_rate_burst', 'ctera_max_in_flight')
+
+    def run(self, tmp=None, task_vars=None):
+        result = super().run(tmp, task_vars)
+        del tmp
+        task_vars = task_vars or {}
+        args = self._module_args(task_vars)
+
+        if not self._in_process(task_vars):
+            wrap_async = self._task.async_val and not self._connection.has_native_async
+            result = merge_hash(result, self._execute_module(module_args=args, task_vars=task_vars, wrap_async=wrap_async))
+            if not wrap_async:
+                self._remove_tmp_path(self._connection._shell.tmpdir)
+            return result
+
+        socket_path = getattr(self._connection, 'socket_path', None) or task_vars.get('ansible_socket')
+        if socket_path:
+            args['_ansible_socket'] = socket_path  # The session of the ctera.ctera.ctera_filer connection
+        module = ctera_module_runner.load_module(self._task.action)
+        result.update(ctera_module_runner.run_module(
+            module, args, check_mode=self._play_context.check_mode, diff=self._play_context.diff, no_log=self._task.no_log
+        ))
+        return result
+
+    def _module_args(self, task_vars):
+        args = dict(self._task.args)
+        for option in self.host_options:
+            if args.get(option) is None and option in task_vars:
+                args[option] = self._templar.template(task_vars[option])
+        return args
+
+    def _in_process(self, task_vars):
+        if not boolean(task_vars.get('ctera_in_process', False), strict=False) or not ctera_module_runner.supported():
+            return False
+        if self._task.async_val or self._task.environment:
+            return False
+        if getattr(self._connection, 'transport', None) not in self.in_process_connections:
+            return False
+        return self._controller_interpreter(task_vars)
+
+    def _controller_interpreter(self, task_vars):
+        interpreter = task_vars.get('ansible_python_interpreter')
+        if interpreter is None:
+            interpreter = task_vars.get('ansible_facts', {}).get('discovered_interpreter_python')
+        if interpreter is None:
+            return True
+        interpreter = self._templar.template(interpreter)
+        if interpreter.startswith('auto'):
+            return True
+        interpreter = shutil.which(interpreter) or interpreter
+        return os.path.realpath(interpreter) == os.path.realpath(sys.executable)
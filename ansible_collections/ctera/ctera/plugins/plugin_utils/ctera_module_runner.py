@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import concurrent.futures
+import importlib
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_in_process as ctera_in_process
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+
+collection_name = 'ctera.ctera'
+modules_package = 'ansible_collections.ctera.ctera.plugins.modules'
+
+
+def module_name(name):
+    """
+    The short name of a module of the collection, given its short or fully qualified name
+    """
+    prefix = collection_name + '.'
+    return name[len(prefix):] if name.startswith(prefix) else name
+
+
+def supported():
+    """
+    Whether this version of ansible-core can run modules in-process. The result of a module is then recorded through
+    AnsibleModule._record_module_result, which ansible-core 2.19 introduced, instead of being printed to the stdout of the controller
+    """
+    return hasattr(AnsibleModule, '_record_module_result')
+
+
+def load_module(name):
+    """
+    Import a Filer module of the collection to run it in-process
+
+    :param str name: The short or fully qualified name of the module, such as ctera.ctera.ctera_filer_hostname
+    :raises ValueError: If the module is not a Filer module of the collection
+    """
+    name = module_name(name)
+    if not name.startswith('ctera_filer_'):
+        raise ValueError('%s is not a CTERA Filer module of the %s collection' % (name, collection_name))
+    package = '%s.%s' % (modules_package, name)
+    try:
+        module = importlib.import_module(package)
+    except ModuleNotFoundError as error:
+        if error.name != package:
+            raise
+        raise ValueError('Unknown module %s.%s' % (collection_name, name)) from error
+    if not hasattr(module, 'main'):
+        raise ValueError('%s.%s cannot run in-process' % (collection_name, name))
+    return module
+
+
+def run_module(module, args, check_mode=False, diff=False, no_log=False):
+    """
+    Run a Filer module in the current thread and return its result, the same result the module returns when Ansible runs it
+
+    :param module module: The module, as returned by load_module()
+    :param dict args: The arguments of the module
+    """
+    if ctera_sdk.import_error() is None:  # Otherwise reported by the module
+        ctera_sdk.config.Logging.get().disable()  # The SDK logs to stdout, which belongs to Ansible on the controller
+    args = dict(args, _ansible_check_mode=check_mode, _ansible_diff=diff, _ansible_no_log=no_log,
+                _ansible_module_name='%s.%s' % (collection_name, module.__name__.rpartition('.')[2]))
+    with ctera_in_process.invocation(args) as invocation:
+        try:
+            module.main()
+        except SystemExit:
+            pass
+        except Exception as error:  # pylint: disable=broad-except
+            return dict(failed=True, msg='Module failure: %s' % error, exception=traceback.format_exc())
+    if invocation.result is None:
+        return dict(failed=True, msg='The module did not return a result')
+    return invocation.result
+
+
+def run_module_concurrently(module, args_list, concurrency, check_mode=False, diff=False, no_log=False):  # pylint: disable=too-many-arguments
+    """
+    Run a Filer module once per set of arguments, at most concurrency at a time, and return the results in the order of the arguments
+
+    :param module module: The module, as returned by load_module()
+    :param list(dict) args_list: The arguments of each run
+    :param int concurrency: The maximum number of runs in progress at any time
+    """
+    if not args_list:
+        return []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(concurrency, len(args_list))) as executor:
+        return list(executor.map(lambda args: run_module(module, args, check_mode, diff, no_log), args_list))
@@ -0,0 +1,99 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import logging
+import sys
+
+from tests.benchmarks.harness import baseline_path, cold_start_times, compare, run
+from tests.benchmarks.scenarios import scenarios
+
+
+def print_results(results):
+    print('%-32s %8s %6s %8s %10s %10s %9s' % ('Scenario', 'Payload', 'Run', 'Calls', 'Sent', 'Received', 'Time'))
+    for name, result in sorted(results.items()):
+        for run_type in ('change', 'noop'):
+            if run_type in result:
+                measurement = result[run_type]
+                print('%-32s %8d %6s %8d %10d %10d %8.3fs' % (
+                    name, result['payload_size'], run_type, measurement['api_calls'], measurement['bytes_sent'], measurement['bytes_received'],
+                    measurement['wall_time']
+                ))
+
+
+def print_cold_starts(cold_starts):
+    print('%-32s %10s %12s %10s' % ('Module', 'Import', 'Validation', 'SDK'))
+    for module, times in sorted(cold_starts.items()):
+        print('%-32s %9.3fs %11.3fs %9.3fs%s' % (
+            module, times['import_time'], times['validation_time'], times['sdk_import_time'],
+            '  SDK imported before validation' if times['sdk_before_validation'] else ''
+        ))
+
+
+def cold_start(names):
+    cold_starts = cold_start_times(sorted({scenario.module for name, scenario in scenarios.items() if not names or name in names}))
+    print_cold_starts(cold_starts)
+    return 1 if any(times['sdk_before_validation'] for times in cold_starts.values()) else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m tests.benchmarks', description='Benchmark the modules of the collection against a simulated filer')
+    parser.add_argument('scenarios', nargs='*', help='Names of the scenarios to run (default: all)')
+    parser.add_argument('--latency', type=float, default=0, help='Seconds the simulator waits before handling each request')
+    parser.add_argument('--baseline', default=baseline_path, help='Baseline to compare with (default: %(default)s)')
+    parser.add_argument('--tolerance', type=float, default=0.05, help='Allowed relative growth of the traffic and payload sizes (default: %(default)s)')
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    parser.add_argument('--update-baseline', action='store_true', help='Write the results to the baseline instead of comparing with it')
+    parser.add_argument('--cold-start', action='store_true',
+                        help='Measure the start-up time of the modules, each in a fresh interpreter, instead of running the scenarios')
+    args = parser.parse_args()
+
+    if args.cold_start:
+        return cold_start(args.scenarios)
+
+    logging.disable(logging.CRITICAL)
+    results = run(args.scenarios, args.latency)
+    print_results(results)
+    if args.output:
+        _write(args.output, results)
+    if args.update_baseline:
+        _write(args.baseline, results)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print('REGRESSION: %s' % regression)
+    return 1 if regressions else 0
+
+
+def _write(path, results):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import contextlib
+import importlib
+import io
+import json
+import sys
+import timeit
+
+
+def cold_start(module):
+    """
+    Measure the start-up of a module of the collection in a fresh interpreter
+
+    The module is imported and run without arguments, so that it fails the validation of its arguments,
+    as a task with a typo does. The SDK is imported afterwards, as a valid run would.
+    Run this module in its own interpreter, once per module.
+
+    :return dict: The seconds it took to import the module, to fail the validation of the arguments and to import the SDK,
+                  and whether the SDK was imported before the arguments were validated
+    """
+    start = timeit.default_timer()
+    imported = importlib.import_module('ansible_collections.ctera.ctera.plugins.modules.%s' % module)
+    imported_time = timeit.default_timer()
+    with _module_args({}), contextlib.redirect_stdout(io.StringIO()):
+        try:
+            imported.main()
+        except SystemExit:
+            pass
+    validated_time = timeit.default_timer()
+    sdk_before_validation = 'cterasdk' in sys.modules
+    importlib.import_module('ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk').import_error()
+    return dict(
+        import_time=round(imported_time - start, 4),
+        validation_time=round(validated_time - start, 4),
+        sdk_import_time=round(timeit.default_timer() - validated_time, 4),
+        sdk_before_validation=sdk_before_validation
+    )
+
+
+def _module_args(args):
+    try:
+        from ansible.module_utils.testing import patch_module_args
+    except ImportError:  # ansible-core < 2.19
+        import unittest.mock as mock
+        from ansible.module_utils import basic
+        return mock.patch.object(basic, '_ANSIBLE_ARGS', json.dumps(dict(ANSIBLE_MODULE_ARGS=args)).encode())
+    return patch_module_args(args)
+
+
+if __name__ == '__main__':
+    print(json.dumps(cold_start(sys.argv[1])))
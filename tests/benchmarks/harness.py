@@ -0,0 +1,136 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+from tests.benchmarks.scenarios import scenarios
+from tests.simulator import GatewaySimulator, filer_args, run_module
+
+collection_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+baseline_path = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+compared_metrics = ('api_calls', 'bytes_sent', 'bytes_received')
+
+
+def payload_sizes(modules):
+    """
+    The size in bytes of the AnsiballZ payload of each module, built in a separate interpreter
+    """
+    output = subprocess.check_output([sys.executable, '-m', 'tests.benchmarks.payload'] + list(modules), cwd=collection_root)
+    return json.loads(output)
+
+
+def cold_start_times(modules):
+    """
+    The start-up times of each module, each measured in a fresh interpreter
+    """
+    return {
+        module: json.loads(subprocess.check_output([sys.executable, '-m', 'tests.benchmarks.cold_start', module], cwd=collection_root))
+        for module in modules
+    }
+
+
+def measure(simulator, module, args):
+    """
+    Run a module once against the simulator and measure its round trips, wall time and traffic
+    """
+    simulator.reset_requests()
+    start = timeit.default_timer()
+    result = run_module(module, args)
+    wall_time = timeit.default_timer() - start
+    return dict(
+        api_calls=len(simulator.requests),
+        wall_time=round(wall_time, 4),
+        bytes_sent=simulator.request_bytes,
+        bytes_received=simulator.response_bytes,
+        changed=bool(result.get('changed')),
+        failed=bool(result.get('failed'))
+    )
+
+
+def run_scenario(scenario, latency=0, payload_size=None):
+    """
+    Run a scenario on a fresh simulator: a run that applies the change, followed by a run that finds nothing to change
+
+    :param tests.benchmarks.scenarios.Scenario scenario: The scenario to run
+    :param float,optional latency: Seconds that the simulator waits before handling each request
+    :param int,optional payload_size: The size of the AnsiballZ payload of the module
+    """
+    module = importlib.import_module('ansible_collections.ctera.ctera.plugins.modules.%s' % scenario.module)
+    with GatewaySimulator(latency=latency) as simulator:
+        if scenario.setup is not None:
+            scenario.setup(simulator)
+        args = filer_args(simulator, **scenario.args)
+        result = dict(payload_size=payload_size, change=measure(simulator, module, args))
+        if scenario.idempotent:
+            result['noop'] = measure(simulator, module, args)
+    return result
+
+
+def run(names=None, latency=0):
+    """
+    Run the scenarios, all of them by default, and return their measurements by name
+    """
+    selected = {name: scenario for name, scenario in scenarios.items() if not names or name in names}
+    sizes = payload_sizes(sorted({scenario.module for scenario in selected.values()}))
+    return {name: run_scenario(scenario, latency, sizes[scenario.module]) for name, scenario in sorted(selected.items())}
+
+
+def compare(results, baseline, tolerance=0.05):
+    """
+    Compare measurements with a baseline and return the regressions
+
+    The number of API calls must not grow. The traffic and the payload size may grow up to the tolerance,
+    to absorb differences in HTTP headers and in the installed Ansible. Wall time is reported but never compared.
+
+    :param dict results: The measurements, as returned by run()
+    :param dict baseline: The baseline measurements
+    :param float,optional tolerance: The allowed relative growth of the sizes, defaults to 5%
+    :return list(str): A description of each regression
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        regressions.extend(_regression(name, 'payload_size', result['payload_size'], expected['payload_size'], tolerance))
+        for run_type in ('change', 'noop'):
+            if run_type not in result or run_type not in expected:
+                continue
+            if result[run_type]['failed']:
+                regressions.append('%s %s: the module failed' % (name, run_type))
+            for metric in compared_metrics:
+                allowed = 0 if metric == 'api_calls' else tolerance
+                regressions.extend(_regression('%s %s' % (name, run_type), metric, result[run_type][metric], expected[run_type][metric], allowed))
+    return regressions
+
+
+def _regression(name, metric, value, expected, tolerance):
+    if value > expected * (1 + tolerance):
+        return ['%s: %s grew from %d to %d' % (name, metric, expected, value)]
+    return []
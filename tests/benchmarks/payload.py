@@ -0,0 +1,61 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import sys
+
+from ansible.executor.module_common import modify_module
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+from ansible.utils.collection_loader._collection_finder import _AnsibleCollectionFinder
+
+collection_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+modules_path = os.path.join(collection_root, 'ansible_collections', 'ctera', 'ctera', 'plugins', 'modules')
+
+
+def payload_size(module):
+    """
+    The size in bytes of the AnsiballZ payload that Ansible builds to run a module of the collection on a host
+
+    Building the payload requires the collection loader of Ansible, which must be installed before
+    the collection is first imported. Run this module in its own interpreter.
+    """
+    built = modify_module(
+        module_name='ctera.ctera.%s' % module,
+        module_path=os.path.join(modules_path, '%s.py' % module),
+        module_args={},
+        templar=Templar(loader=DataLoader()),
+        task_vars={'ansible_python_interpreter': sys.executable},
+        module_compression='ZIP_DEFLATED'
+    )
+    return len(built.b_module_data)
+
+
+def main(modules):
+    _AnsibleCollectionFinder(paths=[collection_root])._install()  # pylint: disable=protected-access
+    print(json.dumps({module: payload_size(module) for module in modules}))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
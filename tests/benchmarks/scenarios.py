@@ -0,0 +1,85 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import collections
+import os
+import tempfile
+
+Scenario = collections.namedtuple('Scenario', ['module', 'args', 'idempotent', 'setup'])
+Scenario.__new__.__defaults__ = (True, None)
+
+
+
+def connect_services(simulator):
+    simulator.connect_services('portal.example.com')
+
+
+def remove_config_snapshot(_simulator):
+    if os.path.exists(config_snapshot):
+        os.remove(config_snapshot)
+
+
+def remove_users(simulator):
+    simulator.database.put('/config/auth/users', [])
+
+
+config_snapshot = os.path.join(tempfile.gettempdir(), 'ctera_filer_config_snapshot.xml.gz')
+acl = [dict(principal_type='LocalGroup', name='Everyone', perm='ReadWrite')]
+
+scenarios = {
+    'ctera_filer_async_io': Scenario('ctera_filer_async_io', dict(enabled=False)),
+    'ctera_filer_backup': Scenario('ctera_filer_backup', dict(passphrase='passphrase')),
+    'ctera_filer_cloud_cache': Scenario('ctera_filer_cloud_cache', dict(enabled=True, sync_enabled=False), setup=connect_services),
+    'ctera_filer_cloud_services': Scenario('ctera_filer_cloud_services', dict(server='portal.example.com', user='admin', password='password')),
+    'ctera_filer_config': Scenario('ctera_filer_config', dict(hostname='vGateway-02', location='Tel Aviv', timezone='(GMT+02:00) Jerusalem',
+                                                              shares=[dict(name='demo', directory='main/demo', acl=acl)],
+                                                              smb=dict(idle_disconnect_time=10), syslog=dict(server='192.168.1.1'))),
+    'ctera_filer_config_snapshot': Scenario('ctera_filer_config_snapshot', dict(path=config_snapshot, compress=True), setup=remove_config_snapshot),
+    'ctera_filer_device_reboot': Scenario('ctera_filer_device_reboot', dict(), idempotent=False),
+    'ctera_filer_device_reset': Scenario('ctera_filer_device_reset', dict(), idempotent=False),
+    'ctera_filer_directory_services': Scenario('ctera_filer_directory_services', dict(domain='example.com', username='admin', password='password')),
+    'ctera_filer_drift': Scenario('ctera_filer_drift', dict(baseline=dict(shares='0' * 64)), idempotent=False),
+    'ctera_filer_facts': Scenario('ctera_filer_facts', dict(), idempotent=False),
+    'ctera_filer_first_user': Scenario('ctera_filer_first_user', dict(email='admin@example.com'), setup=remove_users),
+    'ctera_filer_ftp': Scenario('ctera_filer_ftp', dict(banner_message='Welcome')),
+    'ctera_filer_hostname': Scenario('ctera_filer_hostname', dict(hostname='vGateway-02')),
+    'ctera_filer_job_status': Scenario('ctera_filer_job_status', dict(job=dict(id='1', type='restart', filer='127.0.0.1', started=0, stopped=True)),
+                                       idempotent=False),
+    'ctera_filer_license': Scenario('ctera_filer_license', dict(license='EV32')),
+    'ctera_filer_location': Scenario('ctera_filer_location', dict(location='Tel Aviv')),
+    'ctera_filer_network': Scenario('ctera_filer_network', dict(mode='static', address='192.168.1.20', subnet='255.255.255.0', gateway='192.168.1.1',
+                                                                 primary_dns_server='8.8.8.8')),
+    'ctera_filer_nfs': Scenario('ctera_filer_nfs', dict(async_write=True)),
+    'ctera_filer_rsync': Scenario('ctera_filer_rsync', dict(max_connections=20)),
+    'ctera_filer_share': Scenario('ctera_filer_share', dict(name='demo', directory='main/demo', acl=acl)),
+    'ctera_filer_shares': Scenario('ctera_filer_shares', dict(shares=[dict(name='share%d' % index, directory='main/share%d' % index, acl=acl)
+                                                                      for index in range(10)])),
+    'ctera_filer_smb': Scenario('ctera_filer_smb', dict(idle_disconnect_time=10)),
+    'ctera_filer_syslog': Scenario('ctera_filer_syslog', dict(server='192.168.1.1')),
+    'ctera_filer_telnet': Scenario('ctera_filer_telnet', dict(code='123456'), idempotent=False),
+    'ctera_filer_timezone': Scenario('ctera_filer_timezone', dict(timezone='(GMT+02:00) Jerusalem')),
+    'ctera_filer_user': Scenario('ctera_filer_user', dict(username='alice', password='password1', email='alice@example.com')),
+    'ctera_filer_users': Scenario('ctera_filer_users', dict(users=[dict(username='user%d' % index, password='password%d' % index) for index in range(10)])),
+    'ctera_filer_volume': Scenario('ctera_filer_volume', dict(name='main', size=40960)),
+    'ctera_filer_wizard': Scenario('ctera_filer_wizard', dict(enabled=True)),
+}
@@ -0,0 +1,51 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import argparse
+
+from tests.simulator.server import GatewaySimulator
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m tests.simulator', description='Serve a simulated CTERA Edge Filer')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: %(default)s)')
+    parser.add_argument('--latency', type=float, default=0, help='Seconds to wait before handling each request')
+    parser.add_argument('--jitter', type=float, default=0, help='Maximum number of seconds to add at random to the latency')
+    parser.add_argument('--error-rate', type=float, default=0, help='Fraction of the requests that fail with an HTTP 500 response')
+    parser.add_argument('--seed', type=int, help='Seed of the random latency and errors')
+    parser.add_argument('--user', default='admin', help='User name of the administrator (default: %(default)s)')
+    parser.add_argument('--password', default='password', help='Password of the administrator (default: %(default)s)')
+    args = parser.parse_args()
+
+    simulator = GatewaySimulator(args.host, args.port, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, seed=args.seed,
+                                 username=args.user, password=args.password)
+    print('Serving a simulated filer on http://%s:%d' % (simulator.host, simulator.port))
+    simulator.start()
+    try:
+        simulator._thread.join()  # pylint: disable=protected-access
+    except KeyboardInterrupt:
+        simulator.stop()
+
+
+if __name__ == '__main__':
+    main()
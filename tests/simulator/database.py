@@ -0,0 +1,206 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+
+from cterasdk.common import Object
+from cterasdk.edge import enum as gateway_enum
+
+
+class NotFound(Exception):
+
+    def __init__(self, path):
+        super().__init__('Not found: %s' % path)
+        self.path = path
+
+
+def make_object(classname=None, **attributes):
+    obj = Object()
+    if classname is not None:
+        obj._classname = classname  # pylint: disable=protected-access
+    for key, value in attributes.items():
+        setattr(obj, key, value)
+    return obj
+
+
+def default_database(hostname='vGateway-01ba', username='admin', password='password'):
+    """
+    The configuration and status tree of a freshly installed Gateway with a single disk and volume
+    """
+    users = [make_object('UserConfig', username=username, password=password, fullName=None, email='admin@example.com', uid=None)] if username else []
+    ip = make_object(
+        DHCPMode=gateway_enum.Mode.Enabled, address='192.168.1.10', netmask='255.255.255.0', gateway='192.168.1.1', DNSServer1='192.168.1.1', DNSServer2=None
+    )
+    return make_object(
+        config=make_object(
+            device=make_object(hostname=hostname, location='', activeLicenseType='vGateway'),
+            gui=make_object(openFirstTimeWizard=False, adminRemoteAccessSSO=False),
+            time=make_object(TimeZone='(GMT-05:00) Eastern Time (US , Canada)'),
+            auth=make_object(users=users, groups=[make_object('LocalGroup', name='Everyone')]),
+            storage=make_object(volumes=[make_object('VolumeConfig', name='main', device='SATA1', size=51200, fileSystemType='xfs')]),
+            fileservices=make_object(
+                share=[],
+                cifs=make_object(
+                    mode=gateway_enum.Mode.Enabled, packetSigning=gateway_enum.CIFSPacketSigning.IfClientAgrees, idleDisconnectTime=0,
+                    compatibilityMode=False, cifsUnixExtensions=True, hideUnreadable=False, robustMutexes=True, aioReadThreshold=1,
+                    aioWriteThreshold=1, type='workgroup', workgroup='CTERA', domain=None
+                ),
+                nfs=make_object(mode=gateway_enum.Mode.Disabled, aggregateWrites=gateway_enum.Mode.Enabled, **{'async': gateway_enum.Mode.Disabled}),
+                ftp=make_object(
+                    mode=gateway_enum.Mode.Disabled, AllowAnonymousFTP=False, AnonymousDownloadLimit=0, AnonymousFTPFolder='/',
+                    BannerMessage='Welcome to CTERA FTP.', MaxConnectionsPerIP=5, RequireSSL=False
+                ),
+                rsync=make_object(server=gateway_enum.Mode.Disabled, port=873, maxConnections=10)
+            ),
+            logging=make_object(syslog=make_object(mode=gateway_enum.Mode.Disabled, server=None, port=514, proto=gateway_enum.IPProtocol.UDP,
+                                                   minSeverity=gateway_enum.Severity.INFO)),
+            network=make_object(ports=[make_object(ip=ip)]),
+            cloudsync=make_object(
+                mode=gateway_enum.Mode.Disabled,
+                cloudExtender=make_object(operationMode=gateway_enum.OperationMode.Disabled, selectedFolders=None)
+            ),
+            services=None,
+            backup=None
+        ),
+        defaults=make_object(
+            BackupSettings=make_object('BackupSettings', encryptionMode=None, sharedSecret=None, passPhraseSalt=None)
+        ),
+        status=make_object(
+            device=make_object(runningFirmware='7.0.981.7'),
+            services=make_object(
+                CTERAPortal=make_object(connectionState=gateway_enum.ServicesConnectionState.Disconnected, connectedAddress=None,
+                                        serverList=[], establishedTime=None),
+                userDisplayName=None,
+                portalVersion=None
+            ),
+            storage=make_object(
+                arrays=[],
+                disks=[make_object(name='SATA1', availableCapacity=51200)],
+                volumes=[make_object(name='main', status=gateway_enum.VolumeStatus.Ok)]
+            ),
+            network=make_object(ports=[make_object(ip=copy.deepcopy(ip))])
+        ),
+        proc=make_object(
+            bgtasks=[],
+            backup=make_object(backupStatus=make_object(serviceStatus=make_object(id=gateway_enum.BackupConfStatusID.NotInitialized))),
+            cloudsync=make_object(serviceStatus=make_object(id=gateway_enum.SyncStatus.Off, message=None))
+        )
+    )
+
+
+class Database():
+    """
+    A tree of Gateway objects addressed by paths such as /config/fileservices/share/public
+
+    Array elements are addressed by their name, user name or id, or by their index
+    """
+
+    key_attributes = ('name', 'username', 'id')
+
+    def __init__(self, root=None):
+        self.root = root if root is not None else default_database()
+
+    def get(self, path):
+        return copy.deepcopy(self._resolve(path))
+
+    def put(self, path, value):
+        parent, segment = self._parent(path)
+        if isinstance(parent, list):
+            parent[self._index(parent, segment, path)] = value
+        else:
+            setattr(parent, segment, value)
+
+    def delete(self, path):
+        parent, segment = self._parent(path)
+        if not isinstance(parent, list):
+            raise NotFound(path)
+        del parent[self._index(parent, segment, path)]
+
+    def add(self, path, value):
+        collection = self._resolve(path)
+        if not isinstance(collection, list):
+            raise NotFound(path)
+        collection.append(value)
+        return '%s/%s' % (path.rstrip('/'), self.key(value))
+
+    def query(self, path, key, value):
+        collection = self._resolve(path)
+        if not isinstance(collection, list):
+            raise NotFound(path)
+        return [copy.deepcopy(item) for item in collection if getattr(item, key, None) == value]
+
+    def get_multi(self, path, paths):
+        result = Object()
+        for subpath in paths:
+            full_path = '%s/%s' % (path.rstrip('/'), subpath.lstrip('/'))
+            setattr(result, self._segments(full_path)[-1], self.get(full_path))
+        return result
+
+    def exists(self, path):
+        try:
+            self._resolve(path)
+        except NotFound:
+            return False
+        return True
+
+    @staticmethod
+    def key(item):
+        for attribute in Database.key_attributes:
+            value = getattr(item, attribute, None)
+            if value is not None:
+                return value
+        return None
+
+    def _resolve(self, path):
+        node = self.root
+        for segment in self._segments(path):
+            node = self._child(node, segment, path)
+        return node
+
+    def _parent(self, path):
+        segments = self._segments(path)
+        if not segments:
+            raise NotFound(path)
+        node = self.root
+        for segment in segments[:-1]:
+            node = self._child(node, segment, path)
+        return node, segments[-1]
+
+    def _child(self, node, segment, path):
+        if isinstance(node, list):
+            return node[self._index(node, segment, path)]
+        if isinstance(node, Object) and segment in node.__dict__:
+            return getattr(node, segment)
+        raise NotFound(path)
+
+    def _index(self, collection, segment, path):
+        for index, item in enumerate(collection):
+            if any(str(getattr(item, attribute, None)) == segment for attribute in self.key_attributes):
+                return index
+        if segment.isdigit() and int(segment) < len(collection):
+            return int(segment)
+        raise NotFound(path)
+
+    @staticmethod
+    def _segments(path):
+        return [segment for segment in path.split('/') if segment]
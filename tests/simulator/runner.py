@@ -0,0 +1,64 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import contextlib
+import io
+import json
+import traceback
+import unittest.mock as mock
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+
+try:
+    from ansible.module_utils.testing import patch_module_args
+except ImportError:  # ansible-core < 2.19
+    @contextlib.contextmanager
+    def patch_module_args(args=None):
+        with mock.patch.object(basic, '_ANSIBLE_ARGS', to_bytes(json.dumps(dict(ANSIBLE_MODULE_ARGS=args or {})))):
+            yield
+
+
+def run_module(module, args, check_mode=False, diff=False):
+    """
+    Run a module of the collection in-process, the way Ansible runs it, and return its result
+
+    :param module module: The module, such as ansible_collections.ctera.ctera.plugins.modules.ctera_filer_hostname
+    :param dict args: The arguments of the module
+    """
+    args = dict(args, _ansible_check_mode=check_mode, _ansible_diff=diff)
+    stdout = io.StringIO()
+    with patch_module_args(args), contextlib.redirect_stdout(stdout):
+        try:
+            module.main()
+        except SystemExit:
+            pass
+        except Exception as error:  # pylint: disable=broad-except
+            return dict(failed=True, msg='Module failure: %s' % error, exception=traceback.format_exc())
+    return json.loads(stdout.getvalue())
+
+
+def filer_args(simulator, **args):
+    """
+    The connection arguments of a module that manages the simulated Gateway
+    """
+    return dict(filer_host=simulator.host, filer_port=simulator.port, filer_user='admin', filer_password='password', **args)
@@ -0,0 +1,369 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from cterasdk.convert import fromxmlstr, toxmlstr
+from cterasdk.edge import enum as gateway_enum
+
+from tests.simulator.database import Database, NotFound, default_database, make_object
+
+api_prefix = '/admingui/api'
+session_cookie = 'JSESSIONID'
+
+
+class InjectedError():
+
+    def __init__(self, path, method, status, count):
+        self.path = path
+        self.method = method
+        self.status = status
+        self.count = count
+
+    def matches(self, method, path):
+        return self.count != 0 and path.startswith(self.path) and self.method in (None, method)
+
+
+class GatewaySimulator():
+    """
+    A local HTTP server that implements the Gateway API used by the modules of the collection.
+    It records the requests it received, and the largest number of requests it handled at the same time in max_in_flight.
+
+    :param float,optional latency: Seconds to wait before handling each request
+    :param float,optional jitter: Maximum number of seconds to add at random to the latency of each request
+    :param float,optional error_rate: Fraction of the requests that fail at random with an HTTP 500 response
+    :param int,optional seed: Seed of the random latency and errors, to make a run reproducible
+    :param float,optional restart_duration: Seconds the Gateway does not answer after it is rebooted or reset
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0, jitter=0, error_rate=0, seed=None,
+                 hostname='vGateway-01ba', username='admin', password='password', restart_duration=0):  # pylint: disable=too-many-arguments
+        self.latency = latency
+        self.restart_duration = restart_duration
+        self.restarting_until = 0
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.database = Database(default_database(hostname, username, password))
+        self.requests = []
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.sessions = set()
+        self.injected_errors = []
+        self.commands = {
+            ('/status/fileManager', 'listPhysicalFolders'): self._list_physical_folders,
+            ('/status/network', 'tcpconnect'): self._tcp_connect,
+            ('/status/services', 'isWebSsoEnabled'): self._is_web_sso_enabled,
+            ('/status/services', 'attachAndSave'): self._attach_and_save,
+            ('/status/services', 'attachFolder'): self._attach_folder,
+            ('/status/services', 'createFolder'): self._create_folder,
+            ('/status/fileservices/cifs', 'joinDomain'): self._join_domain,
+            ('/config/device', 'startTelnetd'): self._start_telnetd,
+            ('/config/device', 'stopTelnetd'): self._stop_telnetd,
+            ('/status/device', 'reboot'): self._restart,
+            ('/status/device', 'reset2default'): self._restart,
+        }
+        self.backup_folder = None
+        self.telnetd = False
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._server = ThreadingHTTPServer((host, port), _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.simulator = self
+        self._thread = None
+
+    @property
+    def host(self):
+        return self._server.server_address[0]
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs=dict(poll_interval=0.05), name='gateway-simulator', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def inject_error(self, path, method=None, status=500, count=1):
+        """
+        Fail the next requests to a path
+
+        :param str path: The API path, or a prefix of it, such as /config/fileservices/share
+        :param str,optional method: The HTTP method to fail, defaults to all the methods
+        :param int,optional status: The HTTP status code of the response, defaults to 500
+        :param int,optional count: The number of requests to fail, -1 to fail all of them, defaults to 1
+        """
+        self.injected_errors.append(InjectedError(path, method, status, count))
+
+    def reset_requests(self):
+        with self._lock:
+            self.requests = []
+            self.request_bytes = 0
+            self.response_bytes = 0
+            self.max_in_flight = self.in_flight
+
+    def record_traffic(self, request_bytes, response_bytes):
+        with self._lock:
+            self.request_bytes += request_bytes
+            self.response_bytes += response_bytes
+
+    def handle(self, method, path, cookie, body):
+        """
+        Handle an API request and return a tuple of the HTTP status code, the response body and the headers to set
+        """
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return self._handle(method, path, cookie, body)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _handle(self, method, path, cookie, body):
+        with self._lock:
+            self.requests.append((method, path))
+            status = self._injected_status(method, path)
+        self._sleep()
+        if status is not None:
+            return status, None, {}
+        if time.time() < self.restarting_until:
+            return 503, None, {}
+        if path in ('/login', '/logout'):
+            return self._handle_form(path, cookie, body)
+        if not path.startswith('/nosession') and cookie not in self.sessions:
+            return 401, None, {}
+        with self._lock:
+            try:
+                return 200, getattr(self, '_handle_' + method.lower())(path, body), {}
+            except NotFound:
+                return 404, None, {}
+
+    def _injected_status(self, method, path):
+        for injected_error in self.injected_errors:
+            if injected_error.matches(method, path):
+                injected_error.count -= 1
+                return injected_error.status
+        if self.error_rate and self._random.random() < self.error_rate:
+            return 500
+        return None
+
+    def _sleep(self):
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+    def _handle_form(self, path, cookie, body):
+        if path == '/logout':
+            self.sessions.discard(cookie)
+            return 200, None, {}
+        form = {key: values[0] for key, values in parse_qs(body.decode('utf-8')).items()}
+        with self._lock:
+            users = self.database.query('/config/auth/users', 'username', form.get('username'))
+        if not users or users[0].password != form.get('password'):
+            return 401, None, {}
+        token = uuid.uuid4().hex
+        self.sessions.add(token)
+        return 200, None, {'Set-Cookie': '%s=%s; Path=/' % (session_cookie, token)}
+
+    def _handle_get(self, path, _body):
+        if path == '/nosession/logininfo':
+            return make_object(
+                hostname=self.database.get('/config/device/hostname'),
+                isfirstlogin=not self.database.get('/config/auth/users')
+            )
+        if path == '/export':
+            return self.database.get('/config')
+        return self.database.get(path)
+
+    def _handle_put(self, path, body):
+        self.database.put(path, fromxmlstr(body) if body else None)
+        if path == '/config/backup':
+            self.database.put('/proc/backup/backupStatus/serviceStatus/id', gateway_enum.BackupConfStatusID.Attached)
+
+    def _handle_delete(self, path, _body):
+        self.database.delete(path)
+
+    def _handle_post(self, path, body):
+        param = fromxmlstr(body) if body else None
+        if path == '/nosession/createfirstuser':
+            if not self.database.get('/config/auth/users'):
+                self.database.add('/config/auth/users', param)
+            return None
+        if getattr(param, 'type', None) == 'db':
+            return self._db(path, param.name, param.param)
+        if getattr(param, 'type', None) == 'user-defined':
+            command = self.commands.get((path, param.name))
+            return command(param.param) if command is not None else None
+        raise NotFound(path)
+
+    def _db(self, path, name, param):
+        if name == 'add':
+            return self._add(path, param)
+        if name == 'query':
+            return self.database.query(path, param.key, param.value)
+        if name == 'get-multi':
+            return self.database.get_multi(path, param)
+        raise NotFound(path)
+
+    def _add(self, path, param):
+        if path == '/config/fileservices/share':
+            param.directory = '/' + (param.directory or '').lstrip('/')
+            if not hasattr(param, 'clientSideCaching'):
+                param.clientSideCaching = gateway_enum.ClientSideCaching.Manual
+        elif path == '/config/storage/volumes':
+            self.database.add('/status/storage/volumes', make_object(name=param.name, status=gateway_enum.VolumeStatus.Ok))
+        return self.database.add(path, param)
+
+    def _add_task(self, name, result=None):
+        tasks = self.database.get('/proc/bgtasks')
+        task_id = len(tasks) + 1
+        self.database.add('/proc/bgtasks', make_object(id=task_id, name=name, status=gateway_enum.TaskStatus.Completed, result=result))
+        return '/proc/bgtasks/%d' % task_id
+
+    def _list_physical_folders(self, _param):
+        return [make_object(name=volume.name, type='volume', fullpath='/' + volume.name) for volume in self.database.get('/config/storage/volumes')]
+
+    def _tcp_connect(self, param):
+        return self._add_task('TCP connect to %s:%s' % (param.address, param.port), make_object(rc='Open'))
+
+    @staticmethod
+    def _is_web_sso_enabled(_param):
+        return make_object(rc='connectOK', result=make_object(hasWebSSO=False))
+
+    def connect_services(self, server, user='admin'):
+        """
+        Connect the Gateway to CTERA Portal, as attachAndSave does
+        """
+        with self._lock:
+            self.database.put('/config/services', make_object(server=server, user=user))
+            self.database.put('/status/services', make_object(
+                CTERAPortal=make_object(
+                    connectionState=gateway_enum.ServicesConnectionState.Connected,
+                    connectedAddress=server,
+                    serverList=[make_object(name=server)],
+                    establishedTime=time.strftime('%Y-%m-%dT%H:%M:%S')
+                ),
+                userDisplayName=user,
+                portalVersion='7.0'
+            ))
+
+    def _attach_and_save(self, param):
+        self.connect_services(param.server, param.user)
+        return make_object(id=self._add_task('Connecting to %s' % param.server))
+
+    def _attach_folder(self, _param):
+        if self.backup_folder is None:
+            return self._add_task('Attach backup folder', make_object(attachFolderRC='NotFound'))
+        return self._add_task('Attach backup folder', make_object(attachFolderRC='OK', **self.backup_folder))
+
+    def _create_folder(self, param):
+        self.backup_folder = dict(sharedSecret=getattr(param, 'sharedSecret', None) or uuid.uuid4().hex, passPhraseSalt=uuid.uuid4().hex)
+        return self._add_task('Create backup folder', make_object(createFolderRC='OK', **self.backup_folder))
+
+    @staticmethod
+    def _join_domain(_param):
+        return None
+
+    def _start_telnetd(self, _param):
+        if self.telnetd:
+            return 'telnetd already running'
+        self.telnetd = True
+        return 'OK'
+
+    def _stop_telnetd(self, _param):
+        self.telnetd = False
+
+    def _restart(self, _param):
+        self.sessions.clear()
+        self.restarting_until = time.time() + self.restart_duration
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._dispatch()
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        self._dispatch()
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self._dispatch()
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        self._dispatch()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _dispatch(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self._request_bytes = len(self.raw_requestline) + len(str(self.headers)) + len(body)  # pylint: disable=attribute-defined-outside-init
+        path = urlsplit(self.path).path
+        if path.startswith(api_prefix):
+            self._respond(*self.server.simulator.handle(self.command, path[len(api_prefix):] or '/', self._session_cookie(), body))
+        else:
+            self._respond(404, None, {})
+
+    def _session_cookie(self):
+        for cookie in (self.headers.get('Cookie') or '').split(';'):
+            name, _, value = cookie.strip().partition('=')
+            if name == session_cookie:
+                return value
+        return None
+
+    def _respond(self, status, result, headers):
+        payload = toxmlstr(result) if result is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        # Count the traffic before the response is flushed, so that the client never observes stale counters
+        response_bytes = sum(len(line) for line in self._headers_buffer) + len(b'\r\n') + len(payload)  # pylint: disable=no-member
+        self.server.simulator.record_traffic(self._request_bytes, response_bytes)
+        self.end_headers()
+        self.wfile.write(payload)
@@ -0,0 +1,126 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+
+from ansible.errors import AnsibleActionFail
+from ansible.playbook.play_context import PlayContext
+from ansible.playbook.task import Task
+
+from ansible_collections.ctera.ctera.plugins.action.ctera_filer_fleet import ActionModule
+from tests.simulator import GatewaySimulator
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerFleet(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.simulators = [GatewaySimulator().start() for _ in range(3)]
+        for simulator in self.simulators:
+            self.addCleanup(simulator.stop)
+        self.play_context = PlayContext()
+
+    def _run(self, **args):
+        task = Task()
+        task.args = args
+        action = ActionModule(task, mock.MagicMock(), self.play_context, loader=None, templar=mock.MagicMock(), shared_loader_obj=None)
+        return action.run(task_vars={})
+
+    def _filers(self):
+        return [dict(filer_host=simulator.host, filer_port=simulator.port) for simulator in self.simulators]
+
+    def test_run(self):
+        result = self._run(module='ctera_filer_hostname', module_args=dict(hostname='vGateway-02'), filers=self._filers(), filer_user='admin',
+                           filer_password='password', concurrency=2)
+        self.assertTrue(result['changed'])
+        self.assertNotIn('failed', result)
+        self.assertEqual(result['msg'], 'Ran ctera_filer_hostname on 3 filers')
+        self.assertListEqual(result['failed_hosts'], [])
+        self.assertListEqual([host_result['filer_host'] for host_result in result['results']], ['127.0.0.1'] * 3)
+        for simulator in self.simulators:
+            self.assertEqual(simulator.database.get('/config/device/hostname'), 'vGateway-02')
+
+        result = self._run(module='ctera.ctera.ctera_filer_hostname', module_args=dict(hostname='vGateway-02'), filers=self._filers(), filer_user='admin',
+                           filer_password='password')
+        self.assertFalse(result['changed'])
+
+    def test_check_mode(self):
+        self.play_context.check_mode = True
+        result = self._run(module='ctera_filer_hostname', module_args=dict(hostname='vGateway-02'), filers=self._filers(), filer_user='admin',
+                           filer_password='password')
+        self.assertTrue(result['changed'])
+        for simulator in self.simulators:
+            self.assertEqual(simulator.database.get('/config/device/hostname'), 'vGateway-01ba')
+
+    def test_per_filer_credentials(self):
+        filers = self._filers()
+        filers[1]['filer_password'] = 'wrong'
+        result = self._run(module='ctera_filer_hostname', module_args=dict(hostname='vGateway-02'), filers=filers, filer_user='admin',
+                           filer_password='password')
+        self.assertTrue(result['failed'])
+        self.assertListEqual(result['failed_hosts'], ['127.0.0.1:%d' % self.simulators[1].port])
+        self.assertEqual(result['msg'], '1 of 3 filers failed: 127.0.0.1:%d' % self.simulators[1].port)
+        self.assertTrue(result['results'][1]['failed'])
+        self.assertTrue(result['results'][2]['changed'])
+
+    def test_host_names(self):
+        self.patch_call('ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_module_runner.run_module',
+                        side_effect=lambda *args: dict(changed=False))
+        result = self._run(module='ctera_filer_facts', filers=['192.168.1.10', '192.168.1.11'], filer_user='admin', filer_password='password')
+        self.assertListEqual([host_result['filer_host'] for host_result in result['results']], ['192.168.1.10', '192.168.1.11'])
+
+    def test_timings_and_retries(self):
+        host_results = [
+            dict(changed=False, ctera_timings=dict(count=1, total=0.2, calls=[dict(name='login', duration=0.2, success=True)]),
+                 ctera_retries=dict(count=2, calls=dict(login=2))),
+            dict(changed=False, ctera_timings=dict(count=2, total=0.4, calls=[dict(name='login', duration=0.1, success=True),
+                                                                              dict(name='get', duration=0.3, success=False)]),
+                 ctera_retries=dict(count=1, calls=dict(get=1))),
+            dict(changed=False)
+        ]
+        self.patch_call('ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_module_runner.run_module', side_effect=host_results)
+        result = self._run(module='ctera_filer_facts', filers=['192.168.1.10', '192.168.1.11', '192.168.1.12'], concurrency=1)
+        self.assertEqual(result['ctera_timings']['count'], 3)
+        self.assertAlmostEqual(result['ctera_timings']['total'], 0.6)
+        self.assertListEqual([call['name'] for call in result['ctera_timings']['calls']], ['login', 'login', 'get'])
+        self.assertDictEqual(result['ctera_timings']['slowest'], dict(name='get', duration=0.3, success=False))
+        self.assertDictEqual(result['ctera_retries'], dict(count=3, calls=dict(login=2, get=1)))
+
+    def test_no_timings(self):
+        self.patch_call('ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_module_runner.run_module',
+                        side_effect=lambda *args: dict(changed=False))
+        result = self._run(module='ctera_filer_facts', filers=['192.168.1.10'])
+        self.assertNotIn('ctera_timings', result)
+        self.assertNotIn('ctera_retries', result)
+
+    def test_invalid_arguments(self):
+        self.assertRaisesRegex(AnsibleActionFail, 'Unknown module', self._run, module='ctera_filer_missing', filers=['192.168.1.10'])
+        self.assertRaisesRegex(AnsibleActionFail, 'concurrency', self._run, module='ctera_filer_facts', filers=['192.168.1.10'], concurrency=0)
+        self.assertRaisesRegex(AnsibleActionFail, 'Each filer', self._run, module='ctera_filer_facts', filers=[dict(host='192.168.1.10')])
+
+    def test_unsupported_ansible_core(self):
+        self.patch_call('ansible_collections.ctera.ctera.plugins.action.ctera_filer_fleet.ctera_module_runner.supported', return_value=False)
+        self.assertRaisesRegex(AnsibleActionFail, 'requires ansible-core 2.19', self._run, module='ctera_filer_facts', filers=['192.168.1.10'])
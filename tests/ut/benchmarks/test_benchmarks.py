@@ -0,0 +1,106 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+import json
+import os
+
+from tests.benchmarks import harness
+from tests.benchmarks.scenarios import scenarios
+from tests.ut.base import BaseTest
+
+
+class TestBenchmarks(BaseTest):
+
+    _baseline = dict(
+        ctera_filer_hostname=dict(
+            payload_size=1000,
+            change=dict(api_calls=4, wall_time=0.02, bytes_sent=1000, bytes_received=500, changed=True, failed=False),
+            noop=dict(api_calls=3, wall_time=0.01, bytes_sent=800, bytes_received=400, changed=False, failed=False)
+        )
+    )
+
+    def test_scenarios_cover_all_modules(self):
+        modules_path = os.path.join(harness.collection_root, 'ansible_collections', 'ctera', 'ctera', 'plugins', 'modules')
+        modules = set()
+        for name in os.listdir(modules_path):
+            if name.startswith('ctera_') and name.endswith('.py'):
+                with open(os.path.join(modules_path, name)) as f:
+                    if '\ndef main(' in f.read():  # modules without main() only document an action plugin
+                        modules.add(name[:-len('.py')])
+        self.assertEqual(modules, {scenario.module for scenario in scenarios.values()})
+
+    def test_baseline_covers_all_scenarios(self):
+        with open(harness.baseline_path) as f:
+            baseline = json.load(f)
+        self.assertEqual(set(baseline), set(scenarios))
+        for name, scenario in scenarios.items():
+            self.assertEqual('noop' in baseline[name], scenario.idempotent, name)
+
+    def test_run_scenario(self):
+        result = harness.run_scenario(scenarios['ctera_filer_hostname'], payload_size=1000)
+        self.assertEqual(result['payload_size'], 1000)
+        self.assertEqual(result['change']['api_calls'], 4)
+        self.assertTrue(result['change']['changed'])
+        self.assertEqual(result['noop']['api_calls'], 3)
+        self.assertFalse(result['noop']['changed'])
+        self.assertGreater(result['noop']['bytes_sent'], 0)
+        self.assertGreater(result['noop']['bytes_received'], 0)
+
+    def test_run_non_idempotent_scenario(self):
+        result = harness.run_scenario(scenarios['ctera_filer_device_reboot'])
+        self.assertNotIn('noop', result)
+
+    def test_cold_start(self):
+        cold_starts = harness.cold_start_times(['ctera_filer_hostname'])
+        self.assertFalse(cold_starts['ctera_filer_hostname']['sdk_before_validation'])
+        self.assertGreater(cold_starts['ctera_filer_hostname']['validation_time'], 0)
+
+    def test_compare_no_regressions(self):
+        results = copy.deepcopy(self._baseline)
+        results['ctera_filer_hostname']['change']['bytes_sent'] = 1040
+        results['ctera_filer_hostname']['change']['wall_time'] = 5
+        results['ctera_filer_location'] = copy.deepcopy(self._baseline['ctera_filer_hostname'])
+        self.assertEqual(harness.compare(results, self._baseline), [])
+
+    def test_compare_more_api_calls(self):
+        results = copy.deepcopy(self._baseline)
+        results['ctera_filer_hostname']['noop']['api_calls'] = 4
+        self.assertEqual(harness.compare(results, self._baseline), ['ctera_filer_hostname noop: api_calls grew from 3 to 4'])
+
+    def test_compare_larger_sizes(self):
+        results = copy.deepcopy(self._baseline)
+        results['ctera_filer_hostname']['payload_size'] = 1100
+        results['ctera_filer_hostname']['change']['bytes_received'] = 600
+        self.assertEqual(harness.compare(results, self._baseline), [
+            'ctera_filer_hostname: payload_size grew from 1000 to 1100',
+            'ctera_filer_hostname change: bytes_received grew from 500 to 600'
+        ])
+        self.assertEqual(harness.compare(results, self._baseline, tolerance=0.25), [])
+
+    def test_compare_failed(self):
+        results = copy.deepcopy(self._baseline)
+        results['ctera_filer_hostname']['change']['failed'] = True
+        self.assertEqual(harness.compare(results, self._baseline), ['ctera_filer_hostname change: the module failed'])
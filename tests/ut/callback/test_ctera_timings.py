@@ -0,0 +1,74 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+
+import ansible_collections.ctera.ctera.plugins.callback.ctera_timings as ctera_timings
+from tests.ut.base import BaseTest
+
+
+class TestCteraTimingsCallback(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.callback = ctera_timings.CallbackModule()
+        self.callback._display = mock.MagicMock()
+        self.callback.get_option = mock.MagicMock(return_value=10)
+
+    @staticmethod
+    def _result(task_name, result):
+        task_result = mock.MagicMock()
+        task_result._host.get_name.return_value = 'localhost'
+        task_result._task.get_name.return_value = task_name
+        task_result._result = result
+        return task_result
+
+    def test_aggregate(self):
+        self.callback.v2_runner_on_ok(self._result('hostname', dict(changed=True)))
+        self.callback.v2_runner_on_ok(self._result('facts', dict(ctera_timings=dict(count=2, total=0.5, calls=[
+            dict(name='login', duration=0.3, success=True),
+            dict(name='get', duration=0.2, success=True, endpoint='/config')
+        ]))))
+        self.callback.v2_runner_on_failed(self._result('share', dict(ctera_timings=dict(count=2, total=1.5, calls=[
+            dict(name='login', duration=0.5, success=True),
+            dict(name='shares.add', duration=1.0, success=False)
+        ]))))
+        self.assertDictEqual(self.callback.requests, {
+            'login': dict(count=2, total=0.8, slowest=0.5, failed=0),
+            'get': dict(count=1, total=0.2, slowest=0.2, failed=0),
+            'shares.add': dict(count=1, total=1.0, slowest=1.0, failed=1)
+        })
+        self.assertListEqual(self.callback.tasks, [
+            dict(name='localhost: facts', count=2, total=0.5),
+            dict(name='localhost: share', count=2, total=1.5)
+        ])
+        self.callback.v2_playbook_on_stats(mock.MagicMock())
+        self.callback._display.banner.assert_called_once_with('CTERA TIMINGS')
+        self.callback._display.display.assert_called_with('4 requests in 2 tasks took 2.000s')
+
+    def test_no_timings(self):
+        self.callback.v2_runner_on_ok(self._result('hostname', dict(changed=True)))
+        self.callback.v2_playbook_on_stats(mock.MagicMock())
+        self.callback._display.banner.assert_not_called()
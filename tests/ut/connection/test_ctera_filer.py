@@ -0,0 +1,124 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+
+from ansible.errors import AnsibleError
+from ansible.playbook.play_context import PlayContext
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass
+
+import ansible_collections.ctera.ctera.plugins.connection.ctera_filer as ctera_filer
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerConnection(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.gateway_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.connection.ctera_filer.ctera_sdk.Gateway")
+        self.gateway_class_mock.side_effect = lambda *args: mock.MagicMock()
+        self.patch_call(
+            "ansible_collections.ctera.ctera.plugins.connection.ctera_filer.ctera_sdk.dict_from_cookiejar",
+            side_effect=lambda jar: dict(session_id='cookie')
+        )
+        self.connection = ctera_filer.Connection(PlayContext())
+        self.options = dict(session_idle_timeout=600, ctera_connect_timeout=10.0, ctera_read_timeout=60.0, ctera_pool_size=10, ctera_keep_alive=True)
+        self.connection.get_option = mock.MagicMock(side_effect=lambda option: self.options[option])
+        self.configure_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.connection.ctera_filer.ctera_http.configure")
+
+    def _session(self, host, username):
+        sessions = [session for key, session in self.connection._sessions.items() if key[:2] == (host, username)]
+        self.assertLessEqual(len(sessions), 1)
+        return sessions[0] if sessions else None
+
+    def test_get_session_logs_in_once(self):
+        self.assertDictEqual(self.connection.get_session('192.168.1.1', 'admin', 'password'), dict(session_id='cookie'))
+        self.connection.get_session('192.168.1.1', 'admin', 'password')
+        self.gateway_class_mock.assert_called_once_with('192.168.1.1')
+        gateway = self._session('192.168.1.1', 'admin')['gateway']
+        gateway.login.assert_called_once_with('admin', 'password')
+
+    def test_get_session_configures_http_client(self):
+        self.options.update(ctera_connect_timeout=0, ctera_pool_size=2, ctera_keep_alive=False)
+        self.connection.get_session('192.168.1.1', 'admin', 'password')
+        gateway = self._session('192.168.1.1', 'admin')['gateway']
+        self.configure_mock.assert_called_once_with(gateway._ctera_client.http_client, pool_size=2, connect_timeout=None, read_timeout=60.0,
+                                                    keep_alive=False)
+
+    def test_invalid_pool_size(self):
+        self.options.update(ctera_pool_size=0)
+        self.assertRaisesRegex(AnsibleError, 'ctera_pool_size', self.connection._connect)
+
+    def test_get_session_per_host(self):
+        self.connection.get_session('192.168.1.1', 'admin', 'password')
+        self.connection.get_session('192.168.1.2', 'admin', 'password')
+        self.assertEqual(self.gateway_class_mock.call_count, 2)
+
+    def test_get_session_with_port(self):
+        self.connection.get_session('192.168.1.1:8080', 'admin', 'password')
+        self.gateway_class_mock.assert_called_once_with('192.168.1.1', 8080)
+        self.assertIsNotNone(self._session('192.168.1.1:8080', 'admin'))
+
+    def test_get_session_idle_expired(self):
+        self.connection.get_session('192.168.1.1', 'admin', 'password')
+        first_gateway = self._session('192.168.1.1', 'admin')['gateway']
+        self._session('192.168.1.1', 'admin')['last_used'] -= 601
+        self.connection.get_session('192.168.1.1', 'admin', 'password')
+        first_gateway.logout.assert_called_once_with()
+        self.assertEqual(self.gateway_class_mock.call_count, 2)
+
+    def test_get_session_password_changed(self):
+        self.connection.get_session('192.168.1.1', 'admin', 'password')
+        first_gateway = self._session('192.168.1.1', 'admin')['gateway']
+        self.connection.get_session('192.168.1.1', 'admin', 'new-password')
+        first_gateway.logout.assert_called_once_with()
+        self._session('192.168.1.1', 'admin')['gateway'].login.assert_called_once_with('admin', 'new-password')
+        self.assertEqual(self.gateway_class_mock.call_count, 2)
+        self.assertNotIn('password', str(list(self.connection._sessions)))
+
+    def test_get_session_login_failed(self):
+        self.gateway_class_mock.side_effect = None
+        self.gateway_class_mock.return_value.login.side_effect = CTERAException()
+        self.assertRaises(AnsibleError, self.connection.get_session, '192.168.1.1', 'admin', 'password')
+        self.assertDictEqual(self.connection._sessions, {})
+
+    def test_invalidate_session(self):
+        self.connection.get_session('192.168.1.1', 'admin', 'password')
+        gateway = self._session('192.168.1.1', 'admin')['gateway']
+        self.connection.invalidate_session('192.168.1.1', 'admin')
+        gateway.logout.assert_called_once_with()
+        self.assertDictEqual(self.connection._sessions, {})
+
+    def test_close_logs_out(self):
+        self.connection.get_session('192.168.1.1', 'admin', 'password')
+        gateway = self._session('192.168.1.1', 'admin')['gateway']
+        gateway.logout.side_effect = CTERAException()
+        self.connection.close()
+        gateway.logout.assert_called_once_with()
+        self.assertDictEqual(self.connection._sessions, {})
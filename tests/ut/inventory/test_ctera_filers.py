@@ -0,0 +1,158 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import time
+
+import yaml
+
+from ansible import constants as C
+from ansible.errors import AnsibleParserError
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.loader import fragment_loader
+from ansible.utils.plugin_docs import add_fragments
+
+import ansible_collections.ctera.ctera.plugins.inventory.ctera_filers as ctera_filers
+from tests.simulator import GatewaySimulator
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilersInventory(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        documentation = yaml.safe_load(ctera_filers.DOCUMENTATION)
+        add_fragments(documentation, ctera_filers.__file__, fragment_loader=fragment_loader)
+        C.config.initialize_plugin_configuration_definitions('inventory', ctera_filers.InventoryModule.NAME, documentation['options'])
+        self.simulators = [GatewaySimulator().start() for _ in range(2)]
+        for simulator in self.simulators:
+            self.addCleanup(simulator.stop)
+        self.simulators[1].connect_services('portal.example.com')
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def _config(self, **options):
+        config = dict(
+            plugin='ctera.ctera.ctera_filers',
+            filer_user='admin',
+            filer_password='password',
+            filers=[dict(name='filer%d' % index, filer_host=simulator.host, filer_port=simulator.port) for index, simulator in enumerate(self.simulators)],
+            cache=True,
+            cache_plugin='jsonfile',
+            cache_connection=os.path.join(self.directory, 'cache')
+        )
+        config.update(options)
+        path = os.path.join(self.directory, 'filers.ctera_filers.yml')
+        with open(path, 'w') as f:
+            yaml.safe_dump(config, f)
+        return path
+
+    @staticmethod
+    def _parse(path, cache=True):
+        plugin = ctera_filers.InventoryModule()
+        plugin._load_name = ctera_filers.InventoryModule.NAME  # pylint: disable=protected-access
+        plugin._redirected_names = [ctera_filers.InventoryModule.NAME]  # pylint: disable=protected-access
+        inventory = InventoryData()
+        plugin.parse(inventory, DataLoader(), path, cache=cache)
+        if hasattr(plugin, '_cache'):
+            plugin.update_cache_if_changed()  # as the inventory manager does after parsing
+        return inventory
+
+    def _reset_requests(self):
+        for simulator in self.simulators:
+            simulator.reset_requests()
+
+    def test_verify_file(self):
+        plugin = ctera_filers.InventoryModule()
+        self.assertTrue(plugin.verify_file(self._config()))
+        path = os.path.join(self.directory, 'filers.yml')
+        with open(path, 'w') as f:
+            f.write('plugin: ctera.ctera.ctera_filers')
+        self.assertFalse(plugin.verify_file(path))
+
+    def test_inventory(self):
+        inventory = self._parse(self._config(keyed_groups=[dict(key='ctera_license', prefix='license')],
+                                             groups=dict(connected='ctera_cloud_connected')))
+        self.assertListEqual([host.name for host in inventory.groups['ctera_filers'].get_hosts()], ['filer0', 'filer1'])
+        hostvars = inventory.get_host('filer1').get_vars()
+        self.assertEqual(hostvars['ansible_host'], '127.0.0.1')
+        self.assertEqual(hostvars['filer_port'], self.simulators[1].port)
+        self.assertTrue(hostvars['ctera_reachable'])
+        self.assertEqual(hostvars['ctera_firmware'], '7.0.981.7')
+        self.assertEqual(hostvars['ctera_license'], 'EV16')
+        self.assertTrue(hostvars['ctera_cloud_connected'])
+        self.assertListEqual([host.name for host in inventory.groups['license_EV16'].get_hosts()], ['filer0', 'filer1'])
+        self.assertListEqual([host.name for host in inventory.groups['connected'].get_hosts()], ['filer1'])
+
+    def test_host_names(self):
+        inventory = self._parse(self._config(filers=['192.168.1.10'], gather_facts=False, group='edge'))
+        self.assertListEqual([host.name for host in inventory.groups['edge'].get_hosts()], ['192.168.1.10'])
+        self.assertNotIn('filer_port', inventory.get_host('192.168.1.10').get_vars())
+
+    def test_unreachable(self):
+        self.simulators[0].stop()
+        inventory = self._parse(self._config())
+        hostvars = inventory.get_host('filer0').get_vars()
+        self.assertFalse(hostvars['ctera_reachable'])
+        self.assertIn('ctera_error', hostvars)
+        self.assertTrue(inventory.get_host('filer1').get_vars()['ctera_reachable'])
+
+    def test_read_timeout(self):
+        self.simulators[0].latency = 10
+        started = time.time()
+        inventory = self._parse(self._config(read_timeout=0.2, cache=False))
+        self.assertLess(time.time() - started, 5)
+        self.assertFalse(inventory.get_host('filer0').get_vars()['ctera_reachable'])
+        self.assertTrue(inventory.get_host('filer1').get_vars()['ctera_reachable'])
+
+    def test_cache(self):
+        path = self._config()
+        self._parse(path, cache=False)
+        self._reset_requests()
+        inventory = self._parse(path)
+        self.assertListEqual([simulator.requests for simulator in self.simulators], [[], []])
+        self.assertEqual(inventory.get_host('filer0').get_vars()['ctera_firmware'], '7.0.981.7')
+
+        self._parse(path, cache=False)
+        self.assertTrue(all(simulator.requests for simulator in self.simulators))
+
+    def test_cache_queries_new_filers(self):
+        self._parse(self._config(filers=[dict(name='filer0', filer_host=self.simulators[0].host, filer_port=self.simulators[0].port)]), cache=False)
+        self._reset_requests()
+        inventory = self._parse(self._config())
+        self.assertListEqual(self.simulators[0].requests, [])
+        self.assertNotEqual(self.simulators[1].requests, [])
+        self.assertTrue(inventory.get_host('filer1').get_vars()['ctera_reachable'])
+
+    def test_no_gather_facts(self):
+        inventory = self._parse(self._config(gather_facts=False, cache=False))
+        self.assertListEqual([simulator.requests for simulator in self.simulators], [[], []])
+        self.assertNotIn('ctera_firmware', inventory.get_host('filer0').get_vars())
+
+    def test_invalid_filer(self):
+        self.assertRaisesRegex(AnsibleParserError, 'Each filer', self._parse, self._config(filers=[dict(host='192.168.1.10')]))
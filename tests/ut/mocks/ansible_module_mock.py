@@ -4,8 +4,29 @@ class AnsibleModuleMock():
         self.params = dict(
             filer_host='192.168.1.1',
             filer_user='admin',
-            filer_password='password'
+            filer_password='password',
+            filer_port=None,
+            session_cache=False,
+            session_cache_ttl=600,
+            session_cache_dir=None,
+            ctera_timings=False,
+            ctera_retries=0,
+            ctera_retry_backoff=1.0,
+            ctera_retry_max_backoff=30.0,
+            ctera_retry_jitter=0.5,
+            ctera_retry_status_codes=[500, 502, 503, 504],
+            ctera_retry_mutations=False,
+            ctera_connect_timeout=10.0,
+            ctera_read_timeout=60.0,
+            ctera_pool_size=10,
+            ctera_keep_alive=True,
+            ctera_rate_limit=0.0,
+            ctera_rate_burst=1,
+            ctera_max_in_flight=0
         )
+        self._socket_path = None
+        self.check_mode = False
+        self._diff = False
         self.fail_dict = {}
         self.exit_dict = {}
 
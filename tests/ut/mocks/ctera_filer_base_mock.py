@@ -68,7 +68,10 @@ class CteraFilerBaseMock():
         self._ctera_filer.share_mock.enable = mock.MagicMock()
         self._ctera_filer.share_mock.disable = mock.MagicMock()
         self._ctera_filer.share_mock.modify = mock.MagicMock()
+        self._logout = True
         self.ansible_module = mock.MagicMock()
+        self.ansible_module.params = dict(ctera_pool_size=10)
+        self.ansible_module.check_mode = False
         self.ansible_return_value = AnsibleReturnValue()
         self.ansible_module.ctera_return_value = mock.MagicMock(return_value=self.ansible_return_value)
 
@@ -68,6 +68,28 @@ class TestCteraCommon(unittest.TestCase):  #pylint: disable=too-many-public-meth
         put_values['failed'] = False
         self.assertDictEqual(put_values, ansible_return_value.as_dict())
 
+    def test_ansible_return_value_diff(self):
+        ansible_return_value = ctera_common.AnsibleReturnValue()
+        ansible_return_value.diff(dict(comment='old'), dict(comment='new'))
+        ansible_return_value.diff({}, dict(name='demo'), 'demo')
+        self.assertListEqual(ansible_return_value.as_dict()['diff'], [
+            dict(before=dict(comment='old'), after=dict(comment='new')),
+            dict(before={}, after=dict(name='demo'), before_header='demo', after_header='demo')
+        ])
+
+    def test_set_diff(self):
+        current = dict(name='demo', comment='old', indexed=True)
+        for modified_attributes, expected_before, expected_after in [
+                (dict(comment='new'), dict(comment='old'), dict(comment='new')),
+                (None, current, {})
+        ]:
+            ansible_module = mock.MagicMock()
+            ctera_common.set_diff(ansible_module, current, modified_attributes, 'demo')
+            ansible_module.ctera_return_value.return_value.diff.assert_called_once_with(expected_before, expected_after, 'demo')
+        ansible_module = mock.MagicMock()
+        ctera_common.set_diff(ansible_module, None, dict(name='demo'))
+        ansible_module.ctera_return_value.return_value.diff.assert_called_once_with({}, dict(name='demo'), None)
+
     def test_get_parameters(self):
         ansible_parameters = dict(boolean=True, string='string', integer=3, none=None)
         parameters = ctera_common.get_parameters(ansible_parameters)
@@ -80,6 +102,15 @@ class TestCteraCommon(unittest.TestCase):  #pylint: disable=too-many-public-meth
         filtered_parameters = ctera_common.filter_parameters(all_parameters, filter_keys)
         self.assertDictEqual(dict(first='a'), filtered_parameters)
 
+    def test_object_to_dict(self):
+        ctera_object = ctera_common.Object()
+        ctera_object._classname = 'Volume'
+        ctera_object.name = 'main'
+        ctera_object.devices = [ctera_common.Object()]
+        ctera_object.devices[0].name = 'SATA1'
+        self.assertDictEqual(ctera_common.object_to_dict(ctera_object), dict(name='main', devices=[dict(name='SATA1')]))
+        self.assertEqual(ctera_common.object_to_dict('main'), 'main')
+
     def test_cmp_int(self):
         self.assertEqual(ctera_common.cmp(1, 1), 0)
         self.assertNotEqual(ctera_common.cmp(1, 2), 0)
@@ -118,6 +149,73 @@ class TestCteraCommon(unittest.TestCase):  #pylint: disable=too-many-public-meth
         desired = ["hello", "bar"]
         self.assertListEqual(ctera_common.compare_lists(current, desired, True), ["bar"])
 
+    def test_compare_lists_dicts_reorder(self):
+        current = [dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'), dict(principal_type='LocalUser', name='alice', perm='ReadOnly')]
+        desired = [dict(perm='ReadOnly', name='alice', principal_type='LocalUser'), dict(name='Admins', perm='ReadWrite', principal_type='LocalGroup')]
+        self.assertListEqual(ctera_common.compare_lists(current, desired, False), [])
+
+    def test_compare_lists_dicts_get_desired_diff(self):
+        current = [dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'), dict(principal_type='LocalUser', name='alice', perm='ReadOnly')]
+        desired = [dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'), dict(principal_type='LocalUser', name='alice', perm='ReadWrite')]
+        self.assertListEqual(ctera_common.compare_lists(current, desired, True), [desired[1]])
+
+    def test_compare_lists_removed_only(self):
+        current = ["hello", "world"]
+        desired = ["hello"]
+        self.assertListEqual(ctera_common.compare_lists(current, desired, False), desired)
+        self.assertListEqual(ctera_common.compare_lists(current, desired, True), [])
+
+    def test_freeze(self):
+        self.assertEqual(ctera_common.freeze(dict(a=[1, dict(b={2})])), ctera_common.freeze(dict(a=[1, dict(b={2})])))
+        self.assertNotEqual(ctera_common.freeze(dict(a=[1, 2])), ctera_common.freeze(dict(a=[2, 1])))
+        hash(ctera_common.freeze(dict(a=[1, dict(b={2})])))
+
+    def test_canonical(self):
+        self.assertEqual(ctera_common.canonical(dict(a=['World', 'hello'], b=[dict(c=2), dict(c=1)], d=None, e='Enabled', f=dict(g='Enabled'))),
+                         dict(a=['World', 'hello'], b=[dict(c=1), dict(c=2)], d=None, e='enabled', f=dict(g='Enabled')))
+        self.assertEqual(ctera_common.canonical('Enabled'), 'enabled')
+
+    def test_canonical_agrees_with_compare(self):
+        acl = [dict(name='Alice', perm='ReadOnly'), dict(name='Everyone', perm='ReadWrite')]
+        for current, desired in [
+                (acl, list(reversed(acl))),
+                (acl, [dict(name='alice', perm='ReadOnly'), dict(name='Everyone', perm='ReadWrite')]),
+                (acl, acl[:1]),
+                (['SMB', 'NFS'], ['nfs', 'smb'])]:
+            self.assertEqual(ctera_common.compare_lists(current, desired, False) == [],
+                             ctera_common.canonical(current) == ctera_common.canonical(desired))
+        for current, desired in [('Enabled', 'enabled'), ('enabled', 'disabled')]:
+            self.assertEqual(ctera_common.cmp(current, desired) == 0, ctera_common.canonical(current) == ctera_common.canonical(desired))
+        current, desired = dict(id=1, ipconfig=dict(mode='DHCP')), dict(id=1, ipconfig=dict(mode='dhcp'))
+        self.assertEqual(ctera_common.get_list_delta([current], [desired], ('id',))['changed'] == [],
+                         ctera_common.canonical(current) == ctera_common.canonical(desired))
+
+    def test_fingerprint(self):
+        fingerprint = ctera_common.fingerprint(dict(shares=[dict(name='public', acl=[1, 2]), dict(name='demo')], mode='enabled'))
+        self.assertEqual(fingerprint, ctera_common.fingerprint(dict(mode='Enabled', shares=[dict(name='demo'), dict(acl=[2, 1], name='public')])))
+        self.assertNotEqual(fingerprint, ctera_common.fingerprint(dict(shares=[dict(name='public', acl=[1, 2]), dict(name='demo')], mode='disabled')))
+        self.assertNotEqual(fingerprint, ctera_common.fingerprint(dict(shares=[dict(name='Public', acl=[1, 2]), dict(name='demo')], mode='enabled')))
+        self.assertEqual(len(fingerprint), 64)
+
+    def test_get_list_delta(self):
+        key = ('principal_type', 'name')
+        current = [
+            dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'),
+            dict(principal_type='LocalUser', name='alice', perm='ReadOnly'),
+            dict(principal_type='DomainGroup', name='Legacy', perm='ReadOnly')
+        ]
+        desired = [
+            dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'),
+            dict(principal_type='LocalUser', name='alice', perm='ReadWrite'),
+            dict(principal_type='DomainGroup', name='Staff', perm='ReadOnly')
+        ]
+        self.assertDictEqual(ctera_common.get_list_delta(current, desired, key), dict(
+            added=[desired[2]],
+            removed=[current[2]],
+            changed=[desired[1]]
+        ))
+        self.assertDictEqual(ctera_common.get_list_delta(current, current, key), dict(added=[], removed=[], changed=[]))
+
     def test_get_modified_attributes_empty(self):
         current = dict(first='a', second='b')
         self.assertDictEqual(ctera_common.get_modified_attributes(None, {}), {})
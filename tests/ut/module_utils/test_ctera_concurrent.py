@@ -0,0 +1,75 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_concurrent as ctera_concurrent
+from tests.ut.base import BaseTest
+
+
+class TestCteraConcurrent(BaseTest):
+
+    def test_fetch_in_order(self):
+        def delayed(value, delay):
+            def call():
+                time.sleep(delay)
+                return value
+            return call
+        calls = [delayed(1, 0.03), delayed(2, 0.02), delayed(3, 0.01)]
+        self.assertListEqual(ctera_concurrent.fetch(calls, max_workers=3), [1, 2, 3])
+
+    def test_fetch_max_workers(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def call():
+            with lock:
+                running.append(None)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+        ctera_concurrent.fetch([call] * 8, max_workers=3)
+        self.assertGreater(max(peak), 1)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_fetch_sequential(self):
+        threads = []
+        ctera_concurrent.fetch([lambda: threads.append(threading.current_thread())] * 2)
+        ctera_concurrent.fetch([lambda: threads.append(threading.current_thread())], max_workers=4)
+        self.assertListEqual(threads, [threading.current_thread()] * 3)
+
+    def test_fetch_first_error(self):
+        def fail(message, delay):
+            def call():
+                time.sleep(delay)
+                raise ValueError(message)
+            return call
+        with self.assertRaises(ValueError) as context:
+            ctera_concurrent.fetch([lambda: 1, fail('first', 0.02), fail('second', 0)], max_workers=3)
+        self.assertEqual(str(context.exception), 'first')
+
+    def test_fetch_nothing(self):
+        self.assertListEqual(ctera_concurrent.fetch([], max_workers=4), [])
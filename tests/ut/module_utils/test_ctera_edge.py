@@ -1,3 +1,5 @@
+# pylint: disable=protected-access
+
 # This code is part of Ansible, but is an independent component.
 # This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
 # Modules you write using this snippet, which is embedded dynamically by Ansible
@@ -22,12 +24,15 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import unittest.mock as mock
+import munch
 
 try:
     from cterasdk import CTERAException
 except ImportError:  # pragma: no cover
     pass
 
+from ansible.module_utils.connection import ConnectionError  # pylint: disable=redefined-builtin
+
 import ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge as ctera_edge
 from tests.ut.mocks import ansible_module_mock
 from tests.ut.base import BaseTest
@@ -39,7 +44,7 @@ class TestCteraEdge(BaseTest):  #pylint: disable=too-many-public-methods
         super().setUp()
         ansible_module_mock.mock_bases(self, ctera_edge.GatewayAnsibleModule)
 
-        self.gateway_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.Gateway")
+        self.gateway_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_sdk.Gateway")
         self.gateway_object_mock = self.gateway_class_mock.return_value
 
         self.ansible_return_value_class_mock = self.patch_call(
@@ -49,8 +54,7 @@ class TestCteraEdge(BaseTest):  #pylint: disable=too-many-public-methods
 
     def test_no_cterasdk(self):
         cterasdk_imp_err = "Failed to import"
-        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_common.HAS_CTERASDK", new=False)
-        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_common.CTERASDK_IMP_ERR", new=cterasdk_imp_err)
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_sdk.import_error", return_value=cterasdk_imp_err)
         gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
         self.assertDictEqual(gateway_ansible_module.fail_dict, dict(msg=mock.ANY, exception=cterasdk_imp_err))
 
@@ -82,6 +86,259 @@ class TestCteraEdge(BaseTest):  #pylint: disable=too-many-public-methods
         gateway_ansible_module.ctera_logout()
         self.gateway_object_mock.logout.assert_called_once_with()
 
+    def test_ctera_filer_persistent_login(self):
+        connection_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.Connection")
+        connection_class_mock.return_value.get_session.return_value = dict(session_id='cookie')
+        gateway_session_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_sdk.gateway_session")
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module._socket_path = '/tmp/socket'
+        gateway_ansible_module.ctera_filer()
+        connection_class_mock.assert_called_once_with('/tmp/socket')
+        connection_class_mock.return_value.get_session.assert_called_once_with('192.168.1.1', 'admin', 'password')
+        self.gateway_object_mock.login.assert_not_called()
+        self.gateway_object_mock._ctera_client.http_client.session.cookies.update.assert_called_once_with(dict(session_id='cookie'))
+        gateway_session_mock.start_local_session.assert_called_once_with(self.gateway_object_mock, '192.168.1.1', 'admin')
+        gateway_ansible_module.ctera_logout()
+        self.gateway_object_mock.logout.assert_not_called()
+
+    def test_ctera_filer_persistent_login_session_ended(self):
+        connection_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.Connection")
+        connection_class_mock.return_value.get_session.side_effect = [dict(session_id='ended'), dict(session_id='cookie')]
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_sdk.gateway_session")
+        self.gateway_object_mock.get.side_effect = [CTERAException(response=munch.Munch(code=401)), 'vGateway']
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module._socket_path = '/tmp/socket'
+        gateway_ansible_module.ctera_filer()
+        connection_class_mock.return_value.invalidate_session.assert_called_once_with('192.168.1.1', 'admin')
+        self.assertEqual(connection_class_mock.return_value.get_session.call_count, 2)
+        self.gateway_object_mock._ctera_client.http_client.session.cookies.clear.assert_called_once_with()
+        self.gateway_object_mock._ctera_client.http_client.session.cookies.update.assert_called_with(dict(session_id='cookie'))
+        self.ansible_return_value_object_mock.failed.assert_not_called()
+        gateway_ansible_module.ctera_logout()
+        self.gateway_object_mock.logout.assert_not_called()
+
+    def test_ctera_filer_persistent_login_failed(self):
+        connection_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.Connection")
+        connection_class_mock.return_value.get_session.side_effect = ConnectionError('Login failed')
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module._socket_path = '/tmp/socket'
+        gateway_ansible_module.ctera_filer()
+        self.ansible_return_value_object_mock.failed.assert_called_once_with()
+
+    def test_ctera_filer_session_cache_miss(self):
+        session_cache_mock = self._mock_session_cache(None)
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_sdk.dict_from_cookiejar", return_value=dict(session_id='cookie'))
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module.params['session_cache'] = True
+        gateway_ansible_module.ctera_filer()
+        self.gateway_object_mock.login.assert_called_once_with('admin', 'password')
+        session_cache_mock.store.assert_called_once_with('192.168.1.1', 'admin', 'password', dict(session_id='cookie'))
+        gateway_ansible_module.ctera_logout()
+        self.gateway_object_mock.logout.assert_not_called()
+
+    def test_ctera_filer_with_port(self):
+        session_cache_mock = self._mock_session_cache(None)
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_sdk.dict_from_cookiejar", return_value=dict(session_id='cookie'))
+        original_init = ansible_module_mock.AnsibleModuleMock.__init__
+
+        def init_with_port(mock_self, argument_spec, **kwargs):
+            original_init(mock_self, argument_spec, **kwargs)
+            mock_self.params['filer_port'] = 8080
+            mock_self.params['session_cache'] = True
+
+        with mock.patch.object(ansible_module_mock.AnsibleModuleMock, '__init__', init_with_port):
+            gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        self.gateway_class_mock.assert_called_once_with('192.168.1.1', 8080)
+        gateway_ansible_module.ctera_filer()
+        session_cache_mock.load.assert_called_once_with('192.168.1.1:8080', 'admin', 'password')
+        session_cache_mock.store.assert_called_once_with('192.168.1.1:8080', 'admin', 'password', dict(session_id='cookie'))
+
+    def test_ctera_filer_session_cache_hit(self):
+        self._mock_session_cache(dict(session_id='cookie'))
+        gateway_session_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_sdk.gateway_session")
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module.params['session_cache'] = True
+        gateway_ansible_module.ctera_filer()
+        self.gateway_object_mock.login.assert_not_called()
+        self.gateway_object_mock._ctera_client.http_client.session.cookies.update.assert_called_once_with(dict(session_id='cookie'))
+        gateway_session_mock.start_local_session.assert_called_once_with(self.gateway_object_mock, '192.168.1.1', 'admin')
+        self.gateway_object_mock.get.assert_called_once_with('/config/device/hostname')
+        gateway_ansible_module.ctera_logout()
+        self.gateway_object_mock.logout.assert_not_called()
+
+    def test_ctera_filer_session_cache_rejected(self):
+        session_cache_mock = self._mock_session_cache(dict(session_id='expired'))
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_sdk.gateway_session")
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_sdk.dict_from_cookiejar", return_value=dict(session_id='cookie'))
+        self.gateway_object_mock.get.side_effect = CTERAException()
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module.params['session_cache'] = True
+        gateway_ansible_module.ctera_filer()
+        session_cache_mock.invalidate.assert_called_once_with('192.168.1.1', 'admin')
+        self.gateway_object_mock._ctera_client.http_client.session.cookies.clear.assert_called_once_with()
+        self.gateway_object_mock.login.assert_called_once_with('admin', 'password')
+        session_cache_mock.store.assert_called_once_with('192.168.1.1', 'admin', 'password', dict(session_id='cookie'))
+
+    def _mock_session_cache(self, cookies):
+        session_cache_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.SessionCache")
+        session_cache_class_mock.return_value.load.return_value = cookies
+        return session_cache_class_mock.return_value
+
+    def test_ctera_filer_check_mode(self):
+        for check_mode in [True, False]:
+            self._test_ctera_filer_check_mode(check_mode)
+
+    def _test_ctera_filer_check_mode(self, check_mode):
+        original_init = ansible_module_mock.AnsibleModuleMock.__init__
+
+        def init_with_check_mode(mock_self, argument_spec, **kwargs):
+            original_init(mock_self, argument_spec, **kwargs)
+            mock_self.check_mode = check_mode
+
+        with mock.patch.object(ansible_module_mock.AnsibleModuleMock, '__init__', init_with_check_mode):
+            gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_object_mock = self.gateway_class_mock.return_value
+        gateway_object_mock.reset_mock()
+        ctera_filer = gateway_ansible_module.ctera_filer(login=False)
+        ctera_filer.put('/config/device/hostname', 'vGateway')
+        ctera_filer.get('/config/device/hostname')
+        gateway_object_mock.get.assert_called_once_with('/config/device/hostname')
+        if check_mode:
+            gateway_object_mock.put.assert_not_called()
+        else:
+            gateway_object_mock.put.assert_called_once_with('/config/device/hostname', 'vGateway')
+
+    def test_ctera_exit_api_calls_saved(self):
+        self.ansible_return_value_object_mock.has_failed.return_value = False
+        self.ansible_return_value_object_mock.as_dict.return_value = dict(msg='Success')
+        self.gateway_object_mock.get.return_value = 'vGateway'
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        ctera_filer = gateway_ansible_module.ctera_filer(login=False)
+        for _ in range(3):
+            self.assertEqual(ctera_filer.get('/config/device/hostname'), 'vGateway')
+        self.gateway_object_mock.get.assert_called_once_with('/config/device/hostname')
+        gateway_ansible_module.ctera_exit()
+        self.assertDictEqual(gateway_ansible_module.exit_dict, dict(msg='Success', ctera_api_calls_saved=2))
+
+    def test_ctera_exit_timings(self):
+        self.ansible_return_value_object_mock.has_failed.return_value = False
+        self.ansible_return_value_object_mock.as_dict.return_value = dict(msg='Success')
+        original_init = ansible_module_mock.AnsibleModuleMock.__init__
+
+        def init_with_timings(mock_self, argument_spec, **kwargs):
+            original_init(mock_self, argument_spec, **kwargs)
+            mock_self.params['ctera_timings'] = True
+
+        with mock.patch.object(ansible_module_mock.AnsibleModuleMock, '__init__', init_with_timings):
+            gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module.ctera_filer().get('/config/device/hostname')
+        gateway_ansible_module.ctera_logout()
+        gateway_ansible_module.ctera_exit()
+        ctera_timings = gateway_ansible_module.exit_dict['ctera_timings']
+        self.assertEqual(ctera_timings['count'], 3)
+        self.assertListEqual([record['name'] for record in ctera_timings['calls']], ['login', 'get', 'logout'])
+        self.assertEqual(ctera_timings['calls'][1]['endpoint'], '/config/device/hostname')
+        self.assertNotIn('endpoint', ctera_timings['calls'][0])
+
+    def test_ctera_retries(self):
+        self.ansible_return_value_object_mock.has_failed.return_value = False
+        self.ansible_return_value_object_mock.as_dict.return_value = dict(msg='Success')
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_gateway_proxy.time.sleep")
+        unavailable = CTERAException(response=munch.Munch(code=503))
+        self.gateway_object_mock.login.side_effect = [unavailable, None]
+        self.gateway_object_mock.get.side_effect = [unavailable, unavailable, 'vGateway']
+        original_init = ansible_module_mock.AnsibleModuleMock.__init__
+
+        def init_with_retries(mock_self, argument_spec, **kwargs):
+            original_init(mock_self, argument_spec, **kwargs)
+            mock_self.params['ctera_retries'] = 2
+
+        with mock.patch.object(ansible_module_mock.AnsibleModuleMock, '__init__', init_with_retries):
+            gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        self.assertEqual(gateway_ansible_module.ctera_filer().get('/config/device/hostname'), 'vGateway')
+        self.assertEqual(self.gateway_object_mock.login.call_count, 2)
+        gateway_ansible_module.ctera_exit()
+        self.assertDictEqual(gateway_ansible_module.exit_dict['ctera_retries'], dict(count=3, calls=dict(login=1, get=2)))
+
+    def test_ctera_http(self):
+        configure_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_http.configure")
+        original_init = ansible_module_mock.AnsibleModuleMock.__init__
+
+        def init_with_connections(mock_self, argument_spec, **kwargs):
+            original_init(mock_self, argument_spec, **kwargs)
+            mock_self.params['ctera_read_timeout'] = 0
+            mock_self.params['ctera_pool_size'] = 4
+            mock_self.params['ctera_keep_alive'] = False
+
+        with mock.patch.object(ansible_module_mock.AnsibleModuleMock, '__init__', init_with_connections):
+            ctera_edge.GatewayAnsibleModule(dict())
+        configure_mock.assert_called_once_with(self.gateway_object_mock._ctera_client.http_client, pool_size=4, connect_timeout=10.0,
+                                               read_timeout=None, keep_alive=False)
+
+    def test_ctera_retries_invalid(self):
+        original_init = ansible_module_mock.AnsibleModuleMock.__init__
+        for param, value, msg in [
+                ('ctera_retry_jitter', 1.5, 'ctera_retry_jitter must be between 0 and 1'),
+                ('ctera_retry_jitter', -0.5, 'ctera_retry_jitter must be between 0 and 1'),
+                ('ctera_retry_backoff', -1.0, 'ctera_retry_backoff must not be negative')]:
+
+            def init_with_param(mock_self, argument_spec, param=param, value=value, **kwargs):
+                original_init(mock_self, argument_spec, **kwargs)
+                mock_self.params[param] = value
+
+            with mock.patch.object(ansible_module_mock.AnsibleModuleMock, '__init__', init_with_param):
+                gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+            self.assertDictEqual(gateway_ansible_module.fail_dict, dict(msg=msg))
+
+    def test_ctera_http_invalid_pool_size(self):
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.ctera_http.configure")
+        original_init = ansible_module_mock.AnsibleModuleMock.__init__
+
+        def init_with_pool_size(mock_self, argument_spec, **kwargs):
+            original_init(mock_self, argument_spec, **kwargs)
+            mock_self.params['ctera_pool_size'] = 0
+
+        with mock.patch.object(ansible_module_mock.AnsibleModuleMock, '__init__', init_with_pool_size):
+            gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        self.assertDictEqual(gateway_ansible_module.fail_dict, dict(msg='ctera_pool_size must be at least 1'))
+
+    def test_ctera_rate_limit(self):
+        self.ansible_return_value_object_mock.has_failed.return_value = False
+        self.ansible_return_value_object_mock.as_dict.return_value = dict(msg='Success')
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_gateway_proxy.time.sleep")
+        self.gateway_object_mock.get.return_value = 'vGateway'
+        original_init = ansible_module_mock.AnsibleModuleMock.__init__
+
+        def init_with_rate_limit(mock_self, argument_spec, **kwargs):
+            original_init(mock_self, argument_spec, **kwargs)
+            mock_self.params['ctera_rate_limit'] = 1.0
+
+        with mock.patch.object(ansible_module_mock.AnsibleModuleMock, '__init__', init_with_rate_limit):
+            gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        ctera_filer = gateway_ansible_module.ctera_filer()
+        self.assertEqual(ctera_filer.get('/config/device/hostname'), 'vGateway')
+        gateway_ansible_module.ctera_exit()
+        self.assertEqual(gateway_ansible_module.exit_dict['ctera_throttle']['count'], 1)
+
+    def test_ctera_rate_limit_disabled(self):
+        self.ansible_return_value_object_mock.has_failed.return_value = False
+        self.ansible_return_value_object_mock.as_dict.return_value = dict(msg='Success')
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module.ctera_exit()
+        self.assertNotIn('ctera_throttle', gateway_ansible_module.exit_dict)
+
+    def test_ctera_exit_diff(self):
+        for diff in [True, False]:
+            self.ansible_return_value_object_mock.has_failed.return_value = False
+            self.ansible_return_value_object_mock.as_dict.return_value = dict(changed=True, diff=[dict(before={}, after={})])
+            gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+            gateway_ansible_module._diff = diff
+            gateway_ansible_module.ctera_exit()
+            if diff:
+                self.assertDictEqual(gateway_ansible_module.exit_dict, dict(changed=True, diff=[dict(before={}, after={})]))
+            else:
+                self.assertDictEqual(gateway_ansible_module.exit_dict, dict(changed=True))
+
     def test_ctera_return_value(self):
         gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
         self.gateway_class_mock.assert_called_once_with('192.168.1.1')
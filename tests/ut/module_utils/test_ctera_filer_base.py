@@ -49,3 +49,10 @@ class TestCteraFilerBase(BaseTest):  #pylint: disable=too-many-public-methods
         self.assertTrue(runner.generic_failure_message_called)
         self._obj_mock.ctera_logout.assert_called_once_with()
         self._obj_mock.ctera_exit.assert_called_once_with()
+
+    def test_run_without_logout(self):
+        runner = CteraFilerTestChild(True)
+        runner._logout = False
+        runner.run()
+        self._obj_mock.ctera_logout.assert_not_called()
+        self._obj_mock.ctera_exit.assert_called_once_with()
@@ -0,0 +1,203 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_config_utils as ctera_filer_config_utils
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerConfigUtils(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.ctera_filer = mock.MagicMock()
+
+    def _plan(self, section, current, **parameters):
+        changes = section.plan(current, parameters)
+        for change in changes:
+            change.apply(self.ctera_filer)
+        return [change.description for change in changes]
+
+    @staticmethod
+    def _section(name):
+        return next(section for section in ctera_filer_config_utils.sections if section.name == name)
+
+    def test_sections_order(self):
+        self.assertListEqual([section.name for section in ctera_filer_config_utils.sections], [
+            'hostname', 'location', 'timezone', 'network', 'directory_services', 'cloud_services', 'license',
+            'volumes', 'shares', 'smb', 'nfs', 'ftp', 'rsync', 'syslog'
+        ])
+
+    def test_setting(self):
+        section = self._section('hostname')
+        self.ctera_filer.config.get_hostname.return_value = 'vGateway-01ba'
+        self.assertEqual(section.read(self.ctera_filer), 'vGateway-01ba')
+        self.assertListEqual(self._plan(section, 'vGateway-01ba', hostname='vGateway-01ba'), [])
+        self.assertListEqual(self._plan(section, 'vGateway-01ba', hostname='branch-01'), ['Set hostname to branch-01'])
+        self.ctera_filer.config.set_hostname.assert_called_once_with('branch-01')
+
+    def test_setting_path(self):
+        section = self._section('timezone')
+        self.assertEqual(section.path, 'time/TimeZone')
+        changes = section.plan('(GMT-05:00) Eastern Time (US , Canada)', dict(timezone='(GMT+02:00) Jerusalem'))
+        self.assertTupleEqual(changes[0].setting, ('time/TimeZone', '(GMT+02:00) Jerusalem'))
+        self.assertIsNone(self._section('license').path)
+
+    def test_config_settings(self):
+        self.ctera_filer.get_multi.return_value = munch.Munch(device=munch.Munch(hostname='vGateway-01ba', location=''), time=munch.Munch(TimeZone='GMT'))
+        settings = ctera_filer_config_utils.ConfigSettings(self.ctera_filer, ['time/TimeZone', 'device/hostname', 'device/location'])
+        self.ctera_filer.get_multi.assert_called_once_with('/config', ['/device', '/time'])
+        self.assertEqual(settings.get('device/hostname'), 'vGateway-01ba')
+        settings.set('device/hostname', 'branch-01')
+        settings.set('device/location', 'Tel Aviv')
+        self.assertTrue(settings.pending('device/location'))
+        self.assertFalse(settings.pending('time/TimeZone'))
+        settings.commit()
+        self.ctera_filer.put.assert_called_once_with('/config/device', munch.Munch(hostname='branch-01', location='Tel Aviv'))
+        self.assertFalse(settings.pending('device/location'))
+
+    def test_config_settings_none(self):
+        ctera_filer_config_utils.ConfigSettings(self.ctera_filer, []).commit()
+        self.ctera_filer.get_multi.assert_not_called()
+        self.ctera_filer.put.assert_not_called()
+
+    def test_network_static(self):
+        current = dict(mode='dynamic', address='192.168.1.10', subnet='255.255.255.0', gateway='192.168.1.1',
+                       primary_dns_server='192.168.1.1', secondary_dns_server=None)
+        desired = dict(current, mode='static', address='192.168.1.20')
+        self.assertListEqual(self._plan(ctera_filer_config_utils.network, current, network=desired), ['Set the IP configuration'])
+        self.ctera_filer.network.set_static_ipaddr.assert_called_once_with(address='192.168.1.20', subnet='255.255.255.0', gateway='192.168.1.1',
+                                                                           primary_dns_server='192.168.1.1')
+        self.assertListEqual(self._plan(ctera_filer_config_utils.network, dict(desired), network=desired), [])
+
+    def test_network_dynamic(self):
+        current = dict(mode='static', address='192.168.1.10', subnet='255.255.255.0', gateway='192.168.1.1',
+                       primary_dns_server='192.168.1.1', secondary_dns_server=None)
+        self.assertListEqual(self._plan(ctera_filer_config_utils.network, current, network=dict(mode='dynamic', primary_dns_server='8.8.8.8')),
+                             ['Enable DHCP', 'Set the DNS servers'])
+        self.ctera_filer.network.enable_dhcp.assert_called_once_with()
+        self.ctera_filer.network.set_static_nameserver.assert_called_once_with('8.8.8.8', secondary_dns_server=None)
+
+    def test_modified_dns_servers(self):
+        current = dict(mode='static', primary_dns_server='192.168.1.1', secondary_dns_server='192.168.1.2')
+        self.assertIsNone(ctera_filer_config_utils.modified_dns_servers(current, dict(mode='dynamic')))
+        self.assertIsNone(ctera_filer_config_utils.modified_dns_servers(current, dict(primary_dns_server='192.168.1.1', secondary_dns_server='192.168.1.2')))
+        self.assertDictEqual(ctera_filer_config_utils.modified_dns_servers(current, dict(primary_dns_server='192.168.1.1')),
+                             dict(primary_dns_server='192.168.1.1', secondary_dns_server=None))
+
+    def test_static_ip_modified_attributes(self):
+        current = dict(mode='static', address='192.168.1.10', subnet='255.255.255.0')
+        self.assertIsNone(ctera_filer_config_utils.static_ip_modified_attributes(current, dict(address='192.168.1.10')))
+        self.assertDictEqual(ctera_filer_config_utils.static_ip_modified_attributes(dict(current, mode='dynamic'), dict(address='192.168.1.10')), {})
+        self.assertDictEqual(ctera_filer_config_utils.static_ip_modified_attributes(current, dict(address='192.168.1.20')), dict(address='192.168.1.20'))
+
+    def test_directory_services(self):
+        section = ctera_filer_config_utils.directory_services
+        desired = dict(state='connected', domain='ctera.local', username='admin', password='password', ou=None, force_reconnect=False)
+        self.assertListEqual(self._plan(section, dict(domain='ctera.local'), directory_services=desired), [])
+        self.assertListEqual(self._plan(section, dict(domain=None), directory_services=desired), ['Connect to ctera.local'])
+        self.ctera_filer.directoryservice.connect.assert_called_once_with(domain='ctera.local', username='admin', password='password')
+        self.assertListEqual(self._plan(section, dict(domain='legacy.local'), directory_services=desired),
+                             ['Disconnect from legacy.local', 'Connect to ctera.local'])
+        self.assertListEqual(self._plan(section, dict(domain='legacy.local'), directory_services=dict(desired, state='disconnected')),
+                             ['Disconnect from legacy.local'])
+
+    def test_cloud_services(self):
+        section = ctera_filer_config_utils.cloud_services
+        desired = dict(state='connected', server='portal.example.com', user='admin', password='password', ctera_license='EV16',
+                       force_reconnect=False, sso=True, trust_certificate=False)
+        self.assertListEqual(self._plan(section, dict(server=None, sso=False), cloud_services=desired), ['Connect to portal.example.com', 'Enable SSO'])
+        self.ctera_filer.services.connect.assert_called_once_with(server='portal.example.com', user='admin', password='password', ctera_license='EV16')
+        self.ctera_filer.services.disconnect.assert_not_called()
+        self.ctera_filer.services.enable_sso.assert_called_once_with()
+        self.assertListEqual(self._plan(section, dict(server='portal.example.com', sso=True), cloud_services=desired), [])
+        self.assertListEqual(self._plan(section, dict(server='portal.example.com', sso=True), cloud_services=dict(desired, state='disconnected')),
+                             ['Disconnect from portal.example.com'])
+
+    def test_cloud_services_read(self):
+        self.ctera_filer.services.get_status.return_value = munch.Munch(connected=False)
+        self.assertDictEqual(ctera_filer_config_utils.cloud_services.read(self.ctera_filer), dict(server=None, sso=False))
+        self.ctera_filer.services.sso_enabled.assert_not_called()
+
+    def test_volumes(self):
+        current = dict(main=dict(name='main', size=51200, device='SATA1'), legacy=dict(name='legacy', size=1024, device='SATA2'))
+        volumes = [
+            dict(state='present', name='main', size=40960, filesystem=None, device=None, passphrase=None),
+            dict(state='present', name='data', size=None, filesystem=None, device='SATA3', passphrase=None),
+            dict(state='absent', name='legacy', size=None, filesystem=None, device=None, passphrase=None)
+        ]
+        self.assertListEqual(self._plan(ctera_filer_config_utils.volumes, current, volumes=volumes),
+                             ['Resize volume main', 'Create volume data', 'Delete volume legacy'])
+        self.ctera_filer.volumes.modify.assert_called_once_with('main', size=40960)
+        self.ctera_filer.volumes.add.assert_called_once_with(name='data', device='SATA3')
+        self.ctera_filer.volumes.delete.assert_called_once_with('legacy')
+
+    def test_volumes_listed_more_than_once(self):
+        volumes = [dict(state='present', name='main'), dict(state='absent', name='main')]
+        self.assertRaises(CTERAException, ctera_filer_config_utils.volumes.plan, {}, dict(volumes=volumes))
+
+    def test_shares(self):
+        current = dict(
+            public=dict(name='public', directory='main/public', acl=[], comment=None),
+            legacy=dict(name='legacy', directory='main/legacy', acl=[], comment=None)
+        )
+        shares = [dict(state='present', name='public', comment='Public'), dict(state='present', name='demo', directory='main/demo')]
+        self.assertListEqual(self._plan(ctera_filer_config_utils.shares, current, shares=shares, purge_shares=True),
+                             ['Modify share public', 'Create share demo', 'Delete share legacy'])
+        self.ctera_filer.shares.modify.assert_called_once_with('public', comment='Public')
+        self.ctera_filer.shares.add.assert_called_once_with(name='demo', directory='main/demo')
+        self.ctera_filer.shares.delete.assert_called_once_with('legacy')
+
+    def test_file_service(self):
+        current = dict(server='disabled', port=873, max_connections=10)
+        # Enabling the service reset its port, so the configuration is compared again once it is enabled
+        self.ctera_filer.rsync.get_configuration.return_value = munch.Munch(server='enabled', port=874, maxConnections=10)
+        self.assertListEqual(self._plan(ctera_filer_config_utils.rsync, current, rsync=dict(enabled=True, port=873, max_connections=20)),
+                             ['Enable RSync', 'Configure RSync'])
+        self.ctera_filer.rsync.enable.assert_called_once_with()
+        self.ctera_filer.rsync.modify.assert_called_once_with(port=873, max_connections=20)
+        self.ctera_filer.rsync.modify.reset_mock()
+        self.assertListEqual(self._plan(ctera_filer_config_utils.rsync, dict(current, server='enabled'), rsync=dict(enabled=True, max_connections=20)),
+                             ['Configure RSync'])
+        self.ctera_filer.rsync.modify.assert_called_once_with(max_connections=20)
+        self.assertListEqual(self._plan(ctera_filer_config_utils.rsync, current, rsync=dict(enabled=False)), [])
+        self.assertListEqual(self._plan(ctera_filer_config_utils.rsync, dict(current, server='enabled'), rsync=dict(enabled=False)), ['Disable RSync'])
+        self.ctera_filer.rsync.disable.assert_called_once_with()
+
+    def test_syslog(self):
+        current = dict(mode='disabled', server=None, port=514, proto='UDP', min_severity='info')
+        desired = dict(enabled=True, server='192.168.1.1', port=514, proto='UDP', min_severity='info')
+        self.assertListEqual(self._plan(ctera_filer_config_utils.syslog, current, syslog=desired), ['Enable Syslog'])
+        self.ctera_filer.syslog.enable.assert_called_once_with(server='192.168.1.1', port=514, proto='UDP', min_severity='info')
+        current = dict(current, mode='enabled', server='192.168.1.1')
+        self.assertListEqual(self._plan(ctera_filer_config_utils.syslog, current, syslog=desired), [])
+        self.assertListEqual(self._plan(ctera_filer_config_utils.syslog, current, syslog=dict(desired, port=1514)), ['Configure Syslog'])
+        self.ctera_filer.syslog.modify.assert_called_once_with(port=1514)
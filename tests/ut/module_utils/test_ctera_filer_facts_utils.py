@@ -0,0 +1,80 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_facts_utils as ctera_filer_facts_utils
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerFactsUtils(BaseTest):
+
+    def test_resolve_subset_all(self):
+        self.assertListEqual(ctera_filer_facts_utils.resolve_subset(['all']), sorted(ctera_filer_facts_utils.gatherers))
+
+    def test_resolve_subset_include(self):
+        self.assertListEqual(ctera_filer_facts_utils.resolve_subset(['shares', 'hostname']), ['hostname', 'shares'])
+
+    def test_resolve_subset_exclude(self):
+        expected_subsets = sorted(set(ctera_filer_facts_utils.gatherers) - {'users', 'shares'})
+        self.assertListEqual(ctera_filer_facts_utils.resolve_subset(['!users', '!shares']), expected_subsets)
+        self.assertListEqual(ctera_filer_facts_utils.resolve_subset(['all', '!users', '!shares']), expected_subsets)
+        self.assertListEqual(ctera_filer_facts_utils.resolve_subset(['users', 'shares', '!users']), ['shares'])
+
+    def test_resolve_subset_unknown(self):
+        self.assertRaises(CTERAException, ctera_filer_facts_utils.resolve_subset, ['hostname', 'unknown'])
+
+    def test_resolve_subset_of_subsets(self):
+        self.assertListEqual(ctera_filer_facts_utils.resolve_subset(['!hostname'], ['hostname', 'smb', 'nfs']), ['nfs', 'smb'])
+        self.assertRaises(CTERAException, ctera_filer_facts_utils.resolve_subset, ['sync'], ctera_filer_facts_utils.fingerprinted)
+
+    def test_gather_facts(self):
+        for max_workers in [1, 4]:
+            ctera_filer = mock.MagicMock()
+            ctera_filer.config.get_hostname.return_value = 'vGateway'
+            ctera_filer.cache.is_enabled.return_value = True
+            ctera_filer.smb.get_configuration.return_value = munch.Munch(mode='enabled', _classname='SMB')
+            ctera_filer.users.get.return_value = [munch.Munch(username='alice', fullName='Alice', password='secret')]
+            facts = ctera_filer_facts_utils.gather_facts(ctera_filer, ['cache', 'hostname', 'smb', 'users'], max_workers=max_workers)
+            self.assertDictEqual(facts, dict(
+                cache=dict(enabled=True),
+                hostname='vGateway',
+                smb=dict(mode='enabled'),
+                users=[dict(username='alice', full_name='Alice')]
+            ))
+            self.assertListEqual(list(facts), ['cache', 'hostname', 'smb', 'users'])
+            ctera_filer.shares.get.assert_not_called()
+
+    def test_gather_fingerprints(self):
+        ctera_filer = mock.MagicMock()
+        ctera_filer.config.get_hostname.return_value = 'vGateway'
+        ctera_filer.smb.get_configuration.return_value = munch.Munch(mode='enabled', _classname='SMB')
+        fingerprints = ctera_filer_facts_utils.gather_fingerprints(ctera_filer, ['hostname', 'smb'])
+        self.assertDictEqual(fingerprints, dict(hostname=ctera_common.fingerprint('vGateway'), smb=ctera_common.fingerprint(dict(mode='enabled'))))
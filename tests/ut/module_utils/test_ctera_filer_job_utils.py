@@ -0,0 +1,88 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_job_utils as ctera_filer_job_utils
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerJobUtils(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.time_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_job_utils.time.time", return_value=1000)
+        self.ctera_filer = mock.MagicMock()
+
+    def test_create_job(self):
+        job = ctera_filer_job_utils.create_job(ctera_filer_job_utils.CLOUD_SYNC, '192.168.1.10', operations=['refresh_folders'])
+        self.assertEqual(len(job.pop('id')), 32)
+        self.assertDictEqual(job, dict(type='cloud_sync', filer='192.168.1.10', port=None, started=1000, operations=['refresh_folders']))
+
+    def test_create_job_port(self):
+        job = ctera_filer_job_utils.create_job(ctera_filer_job_utils.RESTART, '192.168.1.10', port=8080)
+        self.assertEqual(job['port'], 8080)
+
+    def test_get_tracker(self):
+        self.assertIsInstance(ctera_filer_job_utils.get_tracker(dict(type='restart')), ctera_filer_job_utils.RestartTracker)
+        self.assertIsInstance(ctera_filer_job_utils.get_tracker(dict(type='cloud_sync')), ctera_filer_job_utils.CloudSyncTracker)
+        self.assertRaises(ctera_sdk.CTERAException, ctera_filer_job_utils.get_tracker, dict(type='upgrade'))
+
+    def test_restart_tracker(self):
+        job = dict(type='restart', started=990)
+        tracker = ctera_filer_job_utils.RestartTracker(job)
+        self.assertTupleEqual(tracker.poll(self.ctera_filer), ('running', 'Waiting for the filer to restart'))
+        self.ctera_filer.test.side_effect = ctera_sdk.CTERAException()
+        self.assertTupleEqual(tracker.poll(self.ctera_filer), ('running', 'The filer is restarting'))
+        self.assertTrue(job['stopped'])
+        self.ctera_filer.test.side_effect = None
+        self.assertTupleEqual(tracker.poll(self.ctera_filer), ('completed', 'The filer is up and running'))
+
+    def test_restart_tracker_stopped_in_previous_poll(self):
+        tracker = ctera_filer_job_utils.RestartTracker(dict(type='restart', started=990, stopped=True))
+        self.assertTupleEqual(tracker.poll(self.ctera_filer), ('completed', 'The filer is up and running'))
+
+    def test_restart_tracker_never_stopped(self):
+        tracker = ctera_filer_job_utils.RestartTracker(dict(type='restart', started=990, grace=10))
+        self.assertTupleEqual(tracker.poll(self.ctera_filer), ('failed', 'The filer did not stop answering within 10 seconds of the restart request'))
+
+    def test_cloud_sync_tracker(self):
+        job = dict(type='cloud_sync', started=990)
+        tracker = ctera_filer_job_utils.CloudSyncTracker(job)
+        for status_id, message, expected in [
+            ('Synced', None, ('running', 'Waiting for Cloud Sync to start. Cloud Sync status: Synced')),
+            ('Syncing', None, ('running', 'Cloud Sync status: Syncing')),
+            ('Synced', None, ('completed', 'Cloud Sync status: Synced')),
+            ('ShouldSupportWinNtAcl', 'Unsupported volume', ('failed', 'Cloud Sync status: ShouldSupportWinNtAcl. Unsupported volume'))
+        ]:
+            self.ctera_filer.sync.get_status.return_value = mock.MagicMock(id=status_id, message=message)
+            self.assertTupleEqual(tracker.poll(self.ctera_filer), expected)
+        self.assertTrue(job['busy'])
+
+    def test_cloud_sync_tracker_grace(self):
+        tracker = ctera_filer_job_utils.CloudSyncTracker(dict(type='cloud_sync', started=990, grace=10))
+        self.ctera_filer.sync.get_status.return_value = mock.MagicMock(id='Synced', message=None)
+        self.assertTupleEqual(tracker.poll(self.ctera_filer), ('completed', 'Cloud Sync status: Synced'))
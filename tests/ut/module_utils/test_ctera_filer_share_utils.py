@@ -0,0 +1,101 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_utils as ctera_filer_share_utils
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerShareUtils(BaseTest):
+
+    def test_to_acl_dict_local(self):
+        expected_acl_dict = dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')
+        acl_obj = munch.Munch(
+            permissions=munch.Munch(allowedFileAccess='ReadWrite'),
+            principal2=munch.Munch(
+                _classname='LocalGroup',
+                ref='#Admins'
+            )
+        )
+        self.assertDictEqual(expected_acl_dict, ctera_filer_share_utils.to_acl_dict(acl_obj))
+
+    def test_to_acl_dict_domain(self):
+        expected_acl_dict = dict(principal_type='DomainGroup', name='Admins', perm='ReadWrite')
+        acl_obj = munch.Munch(
+            permissions=munch.Munch(allowedFileAccess='ReadWrite'),
+            principal2=munch.Munch(
+                _classname='DomainGroup',
+                name='Admins'
+            )
+        )
+        self.assertDictEqual(expected_acl_dict, ctera_filer_share_utils.to_acl_dict(acl_obj))
+
+    def test_modify_share_without_acl(self):
+        ctera_filer = mock.MagicMock()
+        ctera_filer_share_utils.modify_share(ctera_filer, 'demo', dict(comment='comment'))
+        ctera_filer.shares.modify.assert_called_once_with('demo', comment='comment')
+
+    def test_get_acl_delta(self):
+        current = [dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')]
+        desired = [dict(principal_type='LocalGroup', name='Admins', perm='ReadOnly'), dict(principal_type='LocalUser', name='alice', perm='ReadOnly')]
+        self.assertDictEqual(ctera_filer_share_utils.get_acl_delta(current, desired), dict(added=[desired[1]], removed=[], changed=[desired[0]]))
+
+    def test_merge_acl_replace(self):
+        current = [dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')]
+        desired = [dict(principal_type='LocalUser', name='alice', perm='ReadOnly')]
+        self.assertListEqual(ctera_filer_share_utils.merge_acl(current, desired, 'replace'), desired)
+        self.assertListEqual(ctera_filer_share_utils.merge_acl(current, [], 'replace'), [])
+        self.assertIsNone(ctera_filer_share_utils.merge_acl(current, list(current), 'replace'))
+
+    def test_merge_acl_append(self):
+        current = [dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'), dict(principal_type='LocalUser', name='alice', perm='ReadOnly')]
+        desired = [dict(principal_type='LocalUser', name='alice', perm='ReadWrite'), dict(principal_type='LocalUser', name='bob', perm='ReadOnly')]
+        self.assertListEqual(ctera_filer_share_utils.merge_acl(current, desired, 'append'), [current[0], desired[0], desired[1]])
+        self.assertIsNone(ctera_filer_share_utils.merge_acl(current, [current[1]], 'append'))
+
+    def test_merge_acl_remove(self):
+        current = [dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'), dict(principal_type='LocalUser', name='alice', perm='ReadOnly')]
+        desired = [dict(principal_type='LocalUser', name='alice', perm='None'), dict(principal_type='LocalUser', name='bob', perm='ReadOnly')]
+        self.assertListEqual(ctera_filer_share_utils.merge_acl(current, desired, 'remove'), [current[0]])
+        self.assertIsNone(ctera_filer_share_utils.merge_acl(current, [desired[1]], 'remove'))
+
+    def test_get_modified_share_attributes(self):
+        current = dict(name='demo', comment='comment', acl=[dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')])
+        desired = dict(name='demo', comment='new comment', acl=[dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')], acl_mode='append')
+        self.assertDictEqual(ctera_filer_share_utils.get_modified_share_attributes(current, desired), dict(comment='new comment'))
+        self.assertIn('acl_mode', desired)
+
+    def test_add_share_remove_mode(self):
+        ctera_filer = mock.MagicMock()
+        ctera_filer_share_utils.add_share(ctera_filer, dict(
+            name='demo', directory='/main/demo', acl=[dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')], acl_mode='remove'
+        ))
+        ctera_filer.shares.add.assert_called_once_with(name='demo', directory='/main/demo')
+
+    def test_modify_share_acl_only(self):
+        ctera_filer = mock.MagicMock()
+        ctera_filer_share_utils.modify_share(ctera_filer, 'demo', dict(acl=[dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')]))
+        ctera_filer.shares.modify.assert_not_called()
+        ctera_filer.shares.set_acl.assert_called_once_with('demo', mock.ANY)
@@ -0,0 +1,308 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+    from cterasdk.edge.base_command import BaseCommand
+    from cterasdk.exception import HostUnreachable
+except ImportError:  # pragma: no cover
+    pass
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_gateway_proxy import GatewayProxy, CheckModeInterceptor, ReadCacheInterceptor, \
+    RetryInterceptor, TimingInterceptor, RateLimitInterceptor
+from tests.ut.base import BaseTest
+
+
+class SharesMock(BaseCommand):
+
+    def __init__(self, gateway):
+        super().__init__(gateway)
+        self.shares = ['demo']
+
+    def get(self, name=None):
+        self._gateway.reads += 1
+        return self.shares if name is None else name
+
+    def delete(self, name):
+        self.shares.remove(name)
+        return 'deleted'
+
+
+class GatewayMock():
+
+    def __init__(self):
+        self.shares = SharesMock(self)
+        self.host = '192.168.1.1'
+        self.reads = 0
+        self._ctera_client = mock.MagicMock()
+
+    @staticmethod
+    def put(path, value):
+        return (path, value)
+
+    def openfile(self, path):
+        self.reads += 1
+        return iter([path.encode('utf-8')])
+
+
+class RecordingInterceptor():
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def intercept(self, call, proceed):
+        self.calls.append((self.name, call.name, call.args, call.kwargs))
+        return proceed()
+
+
+class ClockMock():
+
+    def __init__(self):
+        self.now = 100.0
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestCteraGatewayProxy(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.gateway = GatewayMock()
+
+    def test_passthrough(self):
+        proxy = GatewayProxy(self.gateway, [])
+        self.assertEqual(proxy.shares.get(name='demo'), 'demo')
+        self.assertEqual(proxy.put('/config', 1), ('/config', 1))
+        self.assertEqual(proxy.host, '192.168.1.1')
+        self.assertIs(proxy._ctera_client, self.gateway._ctera_client)
+
+    def test_interceptor_chain(self):
+        calls = []
+        proxy = GatewayProxy(self.gateway, [RecordingInterceptor('first', calls), RecordingInterceptor('second', calls)])
+        self.assertEqual(proxy.shares.delete('demo'), 'deleted')
+        self.assertListEqual(calls, [('first', 'shares.delete', ('demo',), {}), ('second', 'shares.delete', ('demo',), {})])
+        self.assertListEqual(self.gateway.shares.shares, [])
+
+    def test_check_mode(self):
+        check_mode = CheckModeInterceptor()
+        proxy = GatewayProxy(self.gateway, [check_mode])
+        self.assertListEqual(proxy.shares.get(), ['demo'])
+        self.assertIsNone(proxy.shares.delete('demo'))
+        self.assertIsNone(proxy.put('/config', 1))
+        self.assertListEqual(self.gateway.shares.shares, ['demo'])
+        self.assertListEqual(check_mode.skipped_calls, ['shares.delete', 'put'])
+
+    def test_read_cache(self):
+        read_cache = ReadCacheInterceptor()
+        proxy = GatewayProxy(self.gateway, [read_cache])
+        self.assertListEqual(proxy.shares.get(), ['demo'])
+        shares = proxy.shares.get()
+        shares.append('modified by caller')
+        self.assertListEqual(proxy.shares.get(), ['demo'])
+        self.assertEqual(proxy.shares.get(name='demo'), 'demo')
+        self.assertEqual(self.gateway.reads, 2)
+        self.assertEqual(read_cache.saved_calls, 2)
+
+    def test_read_cache_invalidated(self):
+        read_cache = ReadCacheInterceptor()
+        proxy = GatewayProxy(self.gateway, [read_cache])
+        self.assertListEqual(proxy.shares.get(), ['demo'])
+        proxy.shares.delete('demo')
+        self.assertListEqual(proxy.shares.get(), [])
+        self.assertEqual(self.gateway.reads, 2)
+        self.assertEqual(read_cache.saved_calls, 0)
+
+    def test_read_cache_invalidate(self):
+        read_cache = ReadCacheInterceptor()
+        proxy = GatewayProxy(self.gateway, [read_cache])
+        proxy.shares.get()
+        read_cache.invalidate()
+        proxy.shares.get()
+        self.assertEqual(self.gateway.reads, 2)
+        self.assertEqual(read_cache.saved_calls, 0)
+
+    def test_read_cache_unhashable_arguments(self):
+        read_cache = ReadCacheInterceptor()
+        proxy = GatewayProxy(self.gateway, [read_cache])
+        proxy.shares.get(name=bytearray(b'demo'))
+        proxy.shares.get(name=bytearray(b'demo'))
+        self.assertEqual(self.gateway.reads, 2)
+
+    def test_read_cache_streaming(self):
+        read_cache = ReadCacheInterceptor()
+        proxy = GatewayProxy(self.gateway, [read_cache])
+        self.assertListEqual(list(proxy.openfile('/export')), [b'/export'])
+        self.assertListEqual(list(proxy.openfile('/export')), [b'/export'])
+        self.assertEqual(self.gateway.reads, 2)
+        self.assertEqual(read_cache.saved_calls, 0)
+
+    def test_check_mode_session_calls(self):
+        check_mode = CheckModeInterceptor()
+        gateway = mock.MagicMock()
+        proxy = GatewayProxy(gateway, [check_mode])
+        proxy.login('admin', 'password')
+        proxy.logout()
+        gateway.login.assert_called_once_with('admin', 'password')
+        gateway.logout.assert_called_once_with()
+        self.assertListEqual(check_mode.skipped_calls, [])
+
+    def test_timings(self):
+        timings = TimingInterceptor()
+        proxy = GatewayProxy(self.gateway, [timings])
+        proxy.shares.get()
+        proxy.put('/config', 1)
+        proxy.shares.delete('demo')
+        with self.assertRaises(ValueError):
+            proxy.shares.delete('demo')
+        self.assertListEqual(
+            [(record['name'], record.get('endpoint'), record['success']) for record in timings.calls],
+            [('shares.get', None, True), ('put', '/config', True), ('shares.delete', None, True), ('shares.delete', None, False)]
+        )
+        summary = timings.summary()
+        self.assertEqual(summary['count'], 4)
+        self.assertIn(summary['slowest'], timings.calls)
+        self.assertLessEqual(summary['p50'], summary['p95'])
+        self.assertLessEqual(summary['p95'], summary['slowest']['duration'])
+
+    def test_timings_percentiles(self):
+        timings = TimingInterceptor()
+        timings.calls = [dict(name='get', duration=duration / 10.0, success=True) for duration in range(20, 0, -1)]
+        summary = timings.summary()
+        self.assertEqual(summary['count'], 20)
+        self.assertAlmostEqual(summary['total'], 21.0)
+        self.assertEqual(summary['p50'], 1.0)
+        self.assertEqual(summary['p95'], 1.9)
+        self.assertEqual(summary['slowest'], dict(name='get', duration=2.0, success=True))
+
+    def test_timings_no_calls(self):
+        self.assertDictEqual(TimingInterceptor().summary(), dict(count=0, total=0, p50=0, p95=0, slowest=None, calls=[]))
+
+    @staticmethod
+    def _http_error(code):
+        return CTERAException(response=munch.Munch(code=code))
+
+    def test_retry(self):
+        sleep = mock.MagicMock()
+        retry = RetryInterceptor(3, backoff=1.0, max_backoff=3.0, jitter=0.5, sleep=sleep, uniform=lambda low, high: high)
+        gateway = mock.MagicMock()
+        gateway.get.side_effect = [self._http_error(503), HostUnreachable(None, '192.168.1.1', 80, 'HTTP'), self._http_error(500), 'vGateway']
+        proxy = GatewayProxy(gateway, [retry])
+        self.assertEqual(proxy.get('/config/device/hostname'), 'vGateway')
+        self.assertListEqual(sleep.call_args_list, [mock.call(0.5), mock.call(1.0), mock.call(1.5)])
+        self.assertDictEqual(retry.summary(), dict(count=3, calls=dict(get=3)))
+
+    def test_retry_delay_not_negative(self):
+        self.assertEqual(RetryInterceptor(1, jitter=2, uniform=lambda low, high: high).delay(0), 0)
+        self.assertEqual(RetryInterceptor(1, backoff=-1, uniform=lambda low, high: high).delay(0), 0)
+
+    def test_retry_exhausted(self):
+        sleep = mock.MagicMock()
+        retry = RetryInterceptor(2, sleep=sleep)
+        gateway = mock.MagicMock()
+        gateway.login.side_effect = self._http_error(503)
+        proxy = GatewayProxy(gateway, [retry])
+        self.assertRaises(CTERAException, proxy.login, 'admin', 'password')
+        self.assertEqual(gateway.login.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_retry_not_retryable(self):
+        sleep = mock.MagicMock()
+        retry = RetryInterceptor(2, sleep=sleep)
+        gateway = mock.MagicMock()
+        gateway.get.side_effect = self._http_error(401)
+        gateway.put.side_effect = self._http_error(503)
+        proxy = GatewayProxy(gateway, [retry])
+        self.assertRaises(CTERAException, proxy.get, '/config/device/hostname')
+        self.assertRaises(CTERAException, proxy.put, '/config/device/hostname', 'vGateway')
+        self.assertEqual(gateway.get.call_count, 1)
+        self.assertEqual(gateway.put.call_count, 1)
+        sleep.assert_not_called()
+        self.assertDictEqual(retry.summary(), dict(count=0, calls={}))
+
+    def test_retry_mutations(self):
+        retry = RetryInterceptor(1, retry_mutations=True, sleep=mock.MagicMock())
+        gateway = mock.MagicMock()
+        gateway.put.side_effect = [self._http_error(503), 'vGateway']
+        proxy = GatewayProxy(gateway, [retry])
+        self.assertEqual(proxy.put('/config/device/hostname', 'vGateway'), 'vGateway')
+        self.assertEqual(gateway.put.call_count, 2)
+
+    def test_rate_limit(self):
+        clock = ClockMock()
+        rate_limit = RateLimitInterceptor(rate=2, burst=2, clock=clock.clock, sleep=clock.sleep)
+        proxy = GatewayProxy(self.gateway, [rate_limit])
+        for _ in range(4):
+            proxy.put('/config/device/hostname', 'vGateway')
+        self.assertEqual(clock.now, 101.0)
+        self.assertDictEqual(rate_limit.summary(), dict(count=2, wait=1.0))
+        clock.now += 10
+        proxy.put('/config/device/hostname', 'vGateway')
+        proxy.put('/config/device/hostname', 'vGateway')
+        self.assertEqual(clock.now, 111.0)
+        self.assertDictEqual(rate_limit.summary(), dict(count=2, wait=1.0))
+
+    def test_rate_limit_unlimited(self):
+        sleep = mock.MagicMock()
+        rate_limit = RateLimitInterceptor(sleep=sleep)
+        proxy = GatewayProxy(self.gateway, [rate_limit])
+        for _ in range(10):
+            proxy.put('/config/device/hostname', 'vGateway')
+        sleep.assert_not_called()
+        self.assertDictEqual(rate_limit.summary(), dict(count=0, wait=0))
+
+    def test_max_in_flight(self):
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def put(_path, _value):
+            with lock:
+                in_flight.append(None)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+        gateway = mock.MagicMock()
+        gateway.put.side_effect = put
+        rate_limit = RateLimitInterceptor(max_in_flight=2)
+        proxy = GatewayProxy(gateway, [rate_limit])
+        threads = [threading.Thread(target=proxy.put, args=('/config/device/hostname', 'vGateway')) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(max(peak), 2)
+        self.assertGreater(rate_limit.summary()['count'], 0)
+        self.assertGreater(rate_limit.summary()['wait'], 0)
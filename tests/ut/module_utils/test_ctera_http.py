@@ -0,0 +1,67 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+
+import requests
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_http as ctera_http
+from tests.ut.base import BaseTest
+
+
+class TestCteraHttp(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.http_client = mock.MagicMock()
+        self.http_client.session = requests.Session()
+        self.request_mock = self.patch_call("requests.Session.request")
+
+    def test_pool(self):
+        ctera_http.configure(self.http_client, pool_size=4)
+        adapter = self.http_client.session.get_adapter('https://192.168.1.1/admingui/api/config')
+        self.assertEqual(adapter._pool_maxsize, 4)  # pylint: disable=protected-access
+        self.assertEqual(adapter.max_retries.total, 0)
+        self.assertIs(self.http_client.session.get_adapter('http://192.168.1.1'), adapter)
+        self.assertEqual(self.http_client.retries, 1)
+
+    def test_keep_alive(self):
+        ctera_http.configure(self.http_client)
+        self.assertEqual(self.http_client.session.headers['Connection'], 'keep-alive')
+        ctera_http.configure(self.http_client, keep_alive=False)
+        self.assertEqual(self.http_client.session.headers['Connection'], 'close')
+
+    def test_timeout(self):
+        ctera_http.configure(self.http_client, connect_timeout=5, read_timeout=30)
+        self.http_client.session.request('GET', 'https://192.168.1.1')
+        self.request_mock.assert_called_once_with('GET', 'https://192.168.1.1', timeout=(5, 30))
+
+    def test_timeout_of_request(self):
+        ctera_http.configure(self.http_client, connect_timeout=5, read_timeout=30)
+        self.http_client.session.request('GET', 'https://192.168.1.1', timeout=1)
+        self.request_mock.assert_called_once_with('GET', 'https://192.168.1.1', timeout=1)
+
+    def test_no_timeout(self):
+        ctera_http.configure(self.http_client)
+        self.http_client.session.request('GET', 'https://192.168.1.1')
+        self.request_mock.assert_called_once_with('GET', 'https://192.168.1.1')
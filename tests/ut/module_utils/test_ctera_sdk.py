@@ -0,0 +1,78 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import os
+import subprocess
+import sys
+
+try:
+    from cterasdk import CTERAException, Gateway
+    from cterasdk.edge import session as gateway_session
+    from cterasdk.edge.base_command import BaseCommand
+except ImportError:  # pragma: no cover
+    pass
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk as ctera_sdk
+from tests.ut.base import BaseTest
+
+
+class TestCteraSdk(BaseTest):
+
+    def test_attributes(self):
+        self.assertIs(ctera_sdk.CTERAException, CTERAException)
+        self.assertIs(ctera_sdk.gateway_session, gateway_session)
+        self.assertIs(ctera_sdk.BaseCommand, BaseCommand)
+
+    def test_no_module_getattr(self):
+        # A module level __getattr__ is ignored before Python 3.7
+        self.assertNotIn('__getattr__', vars(ctera_sdk))
+        self.assertIs(ctera_sdk.Gateway, Gateway)
+
+    def test_plugins_import_lazily(self):
+        plugins = [
+            'ansible_collections.ctera.ctera.plugins.connection.ctera_filer',
+            'ansible_collections.ctera.ctera.plugins.inventory.ctera_filers',
+            'ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_module_runner',
+        ]
+        code = 'import sys\n%s\nprint("cterasdk" in sys.modules)' % '\n'.join('import %s' % plugin for plugin in plugins)
+        root = os.path.dirname(list(importlib.import_module('ansible_collections').__path__)[0])
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=root)
+        self.assertEqual(output.strip(), b'False')
+
+    def test_unknown_attribute(self):
+        self.assertRaises(AttributeError, getattr, ctera_sdk, 'NoSuchAttribute')
+        self.assertRaises(AttributeError, getattr, ctera_sdk, '__wrapped__')
+
+    def test_import_error(self):
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk._import_error", new=[])
+        self.assertIsNone(ctera_sdk.import_error())
+
+    def test_import_error_no_cterasdk(self):
+        self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk._import_error", new=[])
+        import_module_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_sdk.importlib.import_module",
+                                             side_effect=ImportError('No module named cterasdk'))
+        self.assertIn('No module named cterasdk', ctera_sdk.import_error())
+        self.assertIn('No module named cterasdk', ctera_sdk.import_error())
+        import_module_mock.assert_called_once_with('cterasdk')
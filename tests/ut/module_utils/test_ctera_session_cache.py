@@ -0,0 +1,80 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import stat
+import tempfile
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_session_cache import SessionCache
+from tests.ut.base import BaseTest
+
+
+class TestCteraSessionCache(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache_directory = os.path.join(self.directory.name, 'sessions')
+        self.cookies = dict(session_id='cookie')
+
+    def test_store_and_load(self):
+        session_cache = SessionCache(self.cache_directory)
+        session_cache.store('192.168.1.1', 'admin', 'password', self.cookies)
+        self.assertDictEqual(session_cache.load('192.168.1.1', 'admin', 'password'), self.cookies)
+
+    def test_file_permissions(self):
+        session_cache = SessionCache(self.cache_directory)
+        session_cache.store('192.168.1.1', 'admin', 'password', self.cookies)
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_directory).st_mode), 0o700)
+        cache_files = os.listdir(self.cache_directory)
+        self.assertEqual(len(cache_files), 1)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(self.cache_directory, cache_files[0])).st_mode), 0o600)
+
+    def test_load_missing(self):
+        self.assertIsNone(SessionCache(self.cache_directory).load('192.168.1.1', 'admin', 'password'))
+
+    def test_load_other_user(self):
+        session_cache = SessionCache(self.cache_directory)
+        session_cache.store('192.168.1.1', 'admin', 'password', self.cookies)
+        self.assertIsNone(session_cache.load('192.168.1.1', 'operator', 'password'))
+        self.assertIsNone(session_cache.load('192.168.1.2', 'admin', 'password'))
+
+    def test_load_wrong_password(self):
+        session_cache = SessionCache(self.cache_directory)
+        session_cache.store('192.168.1.1', 'admin', 'password', self.cookies)
+        self.assertIsNone(session_cache.load('192.168.1.1', 'admin', 'wrong'))
+        self.assertIsNone(session_cache.load('192.168.1.1', 'admin', 'password'))
+
+    def test_load_expired(self):
+        session_cache = SessionCache(self.cache_directory, ttl=-1)
+        session_cache.store('192.168.1.1', 'admin', 'password', self.cookies)
+        self.assertIsNone(session_cache.load('192.168.1.1', 'admin', 'password'))
+        self.assertListEqual(os.listdir(self.cache_directory), [])
+
+    def test_invalidate(self):
+        session_cache = SessionCache(self.cache_directory)
+        session_cache.store('192.168.1.1', 'admin', 'password', self.cookies)
+        session_cache.invalidate('192.168.1.1', 'admin')
+        self.assertIsNone(session_cache.load('192.168.1.1', 'admin', 'password'))
+        session_cache.invalidate('192.168.1.1', 'admin')
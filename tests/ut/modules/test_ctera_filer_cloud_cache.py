@@ -82,7 +82,7 @@ class TestCteraFilerCloudCache(BaseTest):
     def _test__ensure_cache_enabled(self, is_cache_enabled, force_eviction, current_sync, desired_sync):
         expected_changed = False
         cloud_cache = ctera_filer_cloud_cache.CteraFilerCloudSync()
-        cloud_cache.parameters = dict(force_eviction=force_eviction, sync_enabled=desired_sync)
+        cloud_cache.parameters = dict(force_eviction=force_eviction, sync_enabled=desired_sync, filer_host='192.168.1.10')
         cloud_cache._ctera_filer.sync.is_enabled.return_value = current_sync
         cloud_cache._ensure_sync_enabled = mock.MagicMock()
         cloud_cache._ensure_sync_disabled = mock.MagicMock()
@@ -105,6 +105,11 @@ class TestCteraFilerCloudCache(BaseTest):
             self.assertTrue(cloud_cache.ansible_return_value.param.changed)
         else:
             self.assertFalse(hasattr(cloud_cache.ansible_return_value.param, 'changed'))
+        if force_eviction:
+            self.assertEqual(cloud_cache.ansible_return_value.param.job['type'], 'cloud_sync')
+            self.assertListEqual(cloud_cache.ansible_return_value.param.job['operations'], ['force_eviction'])
+        else:
+            self.assertFalse(hasattr(cloud_cache.ansible_return_value.param, 'job'))
 
     def test__ensure_cache_disabled(self):
         for is_cache_enabled in [True, False]:
@@ -154,6 +159,7 @@ class TestCteraFilerCloudCache(BaseTest):
         else:
             cloud_cache._ctera_filer.sync.refresh.assert_not_called()
         self.assertDictEqual(expected_messages, messages)
+        self.assertListEqual(cloud_cache._operations, ['refresh_folders'] if 'Started refreshing cloud folders' in messages['changed'] else [])
 
     def test__ensure_sync_disabled(self):
         for is_sync_enabled in [True, False]:
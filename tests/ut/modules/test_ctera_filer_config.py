@@ -0,0 +1,101 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_config as ctera_filer_config
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerConfig(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_config.CteraFilerConfig)
+
+    def _config(self, **parameters):
+        config = ctera_filer_config.CteraFilerConfig()
+        config.parameters = parameters
+        config._ctera_filer.get_multi.return_value = munch.Munch(
+            device=munch.Munch(hostname='vGateway-01ba', location=''),
+            time=munch.Munch(TimeZone='(GMT-05:00) Eastern Time (US , Canada)')
+        )
+        config._ctera_filer.nfs.get_configuration.return_value = munch.Munch(mode='disabled', aggregateWrites='enabled', **{'async': 'enabled'})
+        return config
+
+    def test_execute_in_dependency_order(self):
+        config = self._config(nfs=dict(enabled=True, async_write=True, aggregate_writes=True), timezone='(GMT+02:00) Jerusalem', hostname='branch-01')
+        config._execute()
+        self.assertListEqual(config._ctera_filer.method_calls, [
+            mock.call.get_multi('/config', ['/device', '/time']),
+            mock.call.nfs.get_configuration(),
+            mock.call.put('/config/device', munch.Munch(hostname='branch-01', location='')),
+            mock.call.put('/config/time', munch.Munch(TimeZone='(GMT+02:00) Jerusalem')),
+            mock.call.nfs.enable()
+        ])
+        result = config.ansible_return_value.as_dict()
+        self.assertTrue(result['changed'])
+        self.assertListEqual(result['changes'], [
+            'hostname: Set hostname to branch-01',
+            'timezone: Set timezone to (GMT+02:00) Jerusalem',
+            'nfs: Enable NFS'
+        ])
+
+    def test_execute_settings_in_one_request(self):
+        config = self._config(hostname='branch-01', location='Tel Aviv')
+        config._execute()
+        config._ctera_filer.get_multi.assert_called_once_with('/config', ['/device'])
+        config._ctera_filer.put.assert_called_once_with('/config/device', munch.Munch(hostname='branch-01', location='Tel Aviv'))
+        self.assertListEqual(config.ansible_return_value.as_dict()['changes'], [
+            'hostname: Set hostname to branch-01',
+            'location: Set location to Tel Aviv'
+        ])
+
+    def test_execute_no_changes(self):
+        config = self._config(hostname='vGateway-01ba')
+        config._execute()
+        config._ctera_filer.put.assert_not_called()
+        config._ctera_filer.get_multi.assert_called_once_with('/config', ['/device'])
+        result = config.ansible_return_value.as_dict()
+        self.assertNotIn('changed', result)
+        self.assertEqual(result['msg'], 'The configuration is up to date')
+        self.assertListEqual(result['changes'], [])
+
+    def test_execute_failure(self):
+        config = self._config(hostname='branch-01', timezone='(GMT+02:00) Jerusalem', nfs=dict(enabled=True))
+        config._ctera_filer.put.side_effect = [None, CTERAException()]
+        config._execute()
+        config._ctera_filer.nfs.enable.assert_not_called()
+        result = config.ansible_return_value.as_dict()
+        self.assertTrue(result['failed'])
+        self.assertTrue(result['msg'].startswith('Failed to apply timezone: Set timezone to (GMT+02:00) Jerusalem.'))
+        self.assertListEqual(result['changes'], ['hostname: Set hostname to branch-01'])
+        self.assertListEqual(result['pending'], ['nfs: Enable NFS'])
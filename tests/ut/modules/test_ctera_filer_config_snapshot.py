@@ -0,0 +1,154 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest.mock as mock
+
+try:
+    from cterasdk import Object, toxmlstr
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_config_snapshot as ctera_filer_config_snapshot
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+def _sha1(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def _configuration(hostname='vGateway-01ba', location='Tel Aviv'):
+    device = Object()
+    device.hostname = hostname
+    device.location = location
+    config = Object()
+    config.device = device
+    return config
+
+
+class TestCteraFilerConfigSnapshot(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_config_snapshot.CteraFilerConfigSnapshot)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'config.xml')
+
+    def _snapshot(self, check_mode=False, **parameters):
+        snapshot = ctera_filer_config_snapshot.CteraFilerConfigSnapshot()
+        snapshot.parameters = dict(dict(state='exported', path=self.path, compress=False), **parameters)
+        snapshot.ansible_module.check_mode = check_mode
+        snapshot.ansible_module.sha1.side_effect = _sha1
+        snapshot.ansible_module.atomic_move.side_effect = os.rename
+        snapshot._ctera_filer.openfile.return_value.iter_content.return_value = [b'<obj>', b'</obj>']
+        return snapshot
+
+    def test_export(self):
+        snapshot = self._snapshot()
+        snapshot._execute()
+        snapshot._ctera_filer.openfile.assert_called_once_with('/export')
+        snapshot._ctera_filer.openfile.return_value.close.assert_called_once_with()
+        with open(self.path, 'rb') as file:
+            self.assertEqual(file.read(), b'<obj></obj>')
+        result = snapshot.ansible_return_value.as_dict()
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['size'], 11)
+        self.assertEqual(result['checksum'], _sha1(self.path))
+        self.assertListEqual(os.listdir(self.directory), ['config.xml'])
+
+    def test_export_up_to_date(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'<obj></obj>')
+        snapshot = self._snapshot()
+        snapshot._execute()
+        snapshot.ansible_module.atomic_move.assert_not_called()
+        result = snapshot.ansible_return_value.as_dict()
+        self.assertNotIn('changed', result)
+        self.assertEqual(result['msg'], 'The exported configuration is up to date')
+        self.assertListEqual(os.listdir(self.directory), ['config.xml'])
+
+    def test_export_compressed(self):
+        self._snapshot(compress=True)._execute()
+        with gzip.open(self.path, 'rb') as file:
+            self.assertEqual(file.read(), b'<obj></obj>')
+        checksum = _sha1(self.path)
+        snapshot = self._snapshot(compress=True)
+        snapshot._execute()
+        self.assertNotIn('changed', snapshot.ansible_return_value.as_dict())
+        self.assertEqual(_sha1(self.path), checksum)
+
+    def test_export_check_mode(self):
+        snapshot = self._snapshot(check_mode=True)
+        snapshot._execute()
+        self.assertTrue(snapshot.ansible_return_value.as_dict()['changed'])
+        self.assertListEqual(os.listdir(self.directory), [])
+
+    def test_export_write_failure(self):
+        snapshot = self._snapshot(path=os.path.join(self.directory, 'missing', 'config.xml'))
+        snapshot._execute()
+        snapshot._ctera_filer.openfile.assert_not_called()
+        result = snapshot.ansible_return_value.as_dict()
+        self.assertTrue(result['failed'])
+        self.assertTrue(result['msg'].startswith('Failed to write'))
+
+    def test_import(self):
+        for compress in [False, True]:
+            with (gzip.open(self.path, 'wb') if compress else open(self.path, 'wb')) as file:
+                file.write(toxmlstr(_configuration()))
+            snapshot = self._snapshot(state='imported')
+            snapshot._ctera_filer.get.return_value = _configuration(location='Boston')
+            snapshot._execute()
+            snapshot._ctera_filer.get.assert_called_once_with('/config')
+            snapshot._ctera_filer.put.assert_called_once_with('/config', mock.ANY)
+            self.assertEqual(snapshot._ctera_filer.put.call_args[0][1].device.location, 'Tel Aviv')
+            self.assertTrue(snapshot.ansible_return_value.as_dict()['changed'])
+
+    def test_import_up_to_date(self):
+        with open(self.path, 'wb') as file:
+            file.write(toxmlstr(_configuration()))
+        snapshot = self._snapshot(state='imported', exclude=['device/location'])
+        snapshot._ctera_filer.get.return_value = _configuration(location='Boston')
+        snapshot._execute()
+        snapshot._ctera_filer.put.assert_not_called()
+        self.assertEqual(snapshot.ansible_return_value.as_dict()['msg'], 'The configuration is up to date')
+
+    def test_import_failure(self):
+        snapshot = self._snapshot(state='imported')
+        snapshot._execute()
+        self.assertTrue(snapshot.ansible_return_value.as_dict()['msg'].startswith('Failed to read'))
+        with open(self.path, 'wb') as file:
+            file.write(b'<obj>')
+        snapshot = self._snapshot(state='imported')
+        snapshot._execute()
+        self.assertEqual(snapshot.ansible_return_value.as_dict()['msg'], 'Failed to parse %s' % self.path)
+        snapshot._ctera_filer.put.assert_not_called()
@@ -23,6 +23,11 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_device_reset as ctera_filer_device_reset
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -38,12 +43,40 @@ class TestCteraFilerDeviceReset(BaseTest):
         for wait in [True, False]:
             self._test__execute(wait)
 
+    def test_no_logout(self):
+        device_reset = ctera_filer_device_reset.CteraFilerDeviceReset()
+        device_reset.parameters = dict(wait=False, filer_host='192.168.1.10')
+        device_reset._execute()
+        self.assertFalse(device_reset._logout)
+
+    def test_logout_on_failure(self):
+        device_reset = ctera_filer_device_reset.CteraFilerDeviceReset()
+        device_reset.parameters = dict(wait=False, filer_host='192.168.1.10')
+        device_reset._ctera_filer.power.reset.side_effect = CTERAException()
+        self.assertRaises(CTERAException, device_reset._execute)
+        self.assertTrue(device_reset._logout)
+
+    def test_check_mode(self):
+        for wait in [True, False]:
+            device_reset = ctera_filer_device_reset.CteraFilerDeviceReset()
+            device_reset.parameters = dict(wait=wait, filer_host='192.168.1.10')
+            device_reset.ansible_module.check_mode = True
+            device_reset._execute()
+            device_reset._ctera_filer.power.reset.assert_not_called()
+            self.assertTrue(device_reset._logout)
+            self.assertDictEqual(device_reset.ansible_return_value.as_dict(), dict(failed=False, changed=True, msg='Resetting device'))
+
     def _test__execute(self, wait):
         device_reset = ctera_filer_device_reset.CteraFilerDeviceReset()
-        device_reset.parameters = dict(wait=wait)
+        device_reset.parameters = dict(wait=wait, filer_host='192.168.1.10')
         device_reset._execute()
         device_reset._ctera_filer.power.reset.assert_called_once_with(wait)
         self.assertEqual(
             device_reset.ansible_return_value.param.msg,
             'Filer is up and running' if wait else 'Resetting device'
         )
+        if wait:
+            self.assertFalse(hasattr(device_reset.ansible_return_value.param, 'job'))
+        else:
+            self.assertEqual(device_reset.ansible_return_value.param.job['type'], 'restart')
+            self.assertEqual(device_reset.ansible_return_value.param.job['filer'], '192.168.1.10')
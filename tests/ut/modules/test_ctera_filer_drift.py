@@ -0,0 +1,69 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_drift as ctera_filer_drift
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerDrift(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_drift.CteraFilerDrift)
+        self.fingerprints = dict(nfs='1111', shares='2222', smb='3333')
+        self.resolve_subset_mock = self.patch_call(
+            "ansible_collections.ctera.ctera.plugins.modules.ctera_filer_drift.ctera_filer_facts_utils.resolve_subset",
+            return_value=['nfs', 'shares', 'smb']
+        )
+        self.gather_fingerprints_mock = self.patch_call(
+            "ansible_collections.ctera.ctera.plugins.modules.ctera_filer_drift.ctera_filer_facts_utils.gather_fingerprints",
+            return_value=self.fingerprints
+        )
+
+    def _execute(self, **parameters):
+        drift = ctera_filer_drift.CteraFilerDrift()
+        drift.parameters = dict(dict(sections=['all']), **parameters)
+        drift._execute()
+        self.resolve_subset_mock.assert_called_once_with(['all'], ctera_filer_drift.ctera_filer_facts_utils.fingerprinted)
+        self.gather_fingerprints_mock.assert_called_once_with(drift._ctera_filer, ['nfs', 'shares', 'smb'], max_workers=10)
+        result = drift.ansible_return_value.as_dict()
+        self.assertNotIn('changed', result)
+        self.assertDictEqual(result['fingerprints'], self.fingerprints)
+        return result
+
+    def test_fingerprints(self):
+        result = self._execute()
+        self.assertEqual(result['msg'], 'Fingerprinted 3 sections')
+        self.assertNotIn('drifted', result)
+
+    def test_drifted(self):
+        result = self._execute(baseline=dict(nfs='1111', shares='0000', smb='0000', users='0000'))
+        self.assertListEqual(result['drifted'], ['shares', 'smb'])
+        self.assertEqual(result['msg'], 'Drifted from the baseline: shares, smb')
+
+    def test_no_drift(self):
+        result = self._execute(baseline=dict(nfs='1111', shares='2222'))
+        self.assertListEqual(result['drifted'], [])
+        self.assertEqual(result['msg'], 'No drift from the baseline')
@@ -0,0 +1,54 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_facts as ctera_filer_facts
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerFacts(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_facts.CteraFilerFacts)
+
+    def test__execute(self):
+        facts = dict(hostname='vGateway', location='Tel Aviv')
+        resolve_subset_mock = self.patch_call(
+            "ansible_collections.ctera.ctera.plugins.modules.ctera_filer_facts.ctera_filer_facts_utils.resolve_subset",
+            return_value=['hostname', 'location']
+        )
+        gather_facts_mock = self.patch_call(
+            "ansible_collections.ctera.ctera.plugins.modules.ctera_filer_facts.ctera_filer_facts_utils.gather_facts",
+            return_value=facts
+        )
+        filer_facts = ctera_filer_facts.CteraFilerFacts()
+        filer_facts.parameters = dict(gather_subset=['hostname', 'location'])
+        filer_facts._execute()
+        resolve_subset_mock.assert_called_once_with(['hostname', 'location'])
+        gather_facts_mock.assert_called_once_with(filer_facts._ctera_filer, ['hostname', 'location'], max_workers=10)
+        result = filer_facts.ansible_return_value.as_dict()
+        self.assertDictEqual(result['ansible_facts'], dict(ctera_filer=facts))
+        self.assertNotIn('changed', result)
@@ -0,0 +1,129 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_job_status as ctera_filer_job_status
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerJobStatus(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_job_status.CteraFilerJobStatus)
+        self.clock = [1000]
+        self.patch_call("ansible_collections.ctera.ctera.plugins.modules.ctera_filer_job_status.time.time", side_effect=lambda: self.clock[0])
+        self.sleep_mock = self.patch_call(
+            "ansible_collections.ctera.ctera.plugins.modules.ctera_filer_job_status.time.sleep",
+            side_effect=self._sleep
+        )
+        self.tracker = mock.MagicMock(needs_session=False)
+        self.get_tracker_mock = self.patch_call(
+            "ansible_collections.ctera.ctera.plugins.modules.ctera_filer_job_status.ctera_filer_job_utils.get_tracker",
+            return_value=self.tracker
+        )
+        self.job = dict(id='1234', type='restart', filer='192.168.1.10', started=990)
+
+    def _sleep(self, seconds):
+        self.clock[0] += seconds
+
+    def _execute(self, **parameters):
+        job_status = ctera_filer_job_status.CteraFilerJobStatus()
+        job_status.parameters = dict(
+            dict(job=self.job, filer_host='192.168.1.10', wait=False, timeout=600, poll_interval=1, max_poll_interval=30),
+            **parameters
+        )
+        job_status._execute()
+        return job_status
+
+    def test_poll_once(self):
+        self.tracker.poll.return_value = ('running', 'The filer is restarting')
+        job_status = self._execute()
+        self.get_tracker_mock.assert_called_once_with(self.job)
+        job_status.ansible_module.ctera_login.assert_not_called()
+        self.assertFalse(job_status._logout)
+        self.sleep_mock.assert_not_called()
+        self.assertDictEqual(job_status.ansible_return_value.as_dict(), dict(
+            failed=False, msg='The filer is restarting', status='running', finished=False, elapsed=10, job=self.job
+        ))
+
+    def test_wait(self):
+        self.tracker.poll.side_effect = [
+            ('running', 'Syncing'), ('running', 'Syncing'), ('running', 'Syncing'), ('running', 'Scanning'), ('completed', 'Synced')
+        ]
+        self.tracker.needs_session = True
+        job_status = self._execute(wait=True)
+        job_status.ansible_module.ctera_login.assert_called_once_with()
+        self.assertTrue(job_status._logout)
+        self.assertEqual(job_status.ansible_module.ctera_invalidate_read_cache.call_count, 5)
+        self.assertListEqual([call[0][0] for call in self.sleep_mock.call_args_list], [1, 1.5, 2.25, 1])
+        result = job_status.ansible_return_value.as_dict()
+        self.assertEqual(result['status'], 'completed')
+        self.assertTrue(result['finished'])
+        self.assertFalse(result['failed'])
+        self.assertNotIn('changed', result)
+
+    def test_max_poll_interval(self):
+        self.tracker.poll.side_effect = [('running', 'Syncing')] * 4 + [('completed', 'Synced')]
+        self._execute(wait=True, poll_interval=2, max_poll_interval=3)
+        self.assertListEqual([call[0][0] for call in self.sleep_mock.call_args_list], [2, 3, 3, 3])
+
+    def test_timeout(self):
+        self.tracker.poll.return_value = ('running', 'Waiting for the filer to restart')
+        job_status = self._execute(wait=True, timeout=10, poll_interval=4)
+        self.assertListEqual([call[0][0] for call in self.sleep_mock.call_args_list], [4, 6])
+        result = job_status.ansible_return_value.as_dict()
+        self.assertTrue(result['failed'])
+        self.assertEqual(result['msg'], 'Timed out waiting for the job. Waiting for the filer to restart')
+        self.assertFalse(result['finished'])
+
+    def test_failed(self):
+        self.tracker.poll.return_value = ('failed', 'Cloud Sync status: ShouldSupportWinNtAcl')
+        result = self._execute(wait=True).ansible_return_value.as_dict()
+        self.assertTrue(result['failed'])
+        self.assertTrue(result['finished'])
+        self.assertEqual(result['msg'], 'Cloud Sync status: ShouldSupportWinNtAcl')
+
+    def test_other_filer(self):
+        job_status = self._execute(filer_host='192.168.1.11')
+        self.get_tracker_mock.assert_not_called()
+        self.assertTrue(job_status.ansible_return_value.has_failed())
+        self.assertEqual(job_status.ansible_return_value.param.msg, 'The job was started on 192.168.1.10')
+
+    def test_other_port(self):
+        self.job['port'] = 8080
+        job_status = self._execute(filer_port=8443)
+        self.get_tracker_mock.assert_not_called()
+        self.assertTrue(job_status.ansible_return_value.has_failed())
+        self.assertEqual(job_status.ansible_return_value.param.msg, 'The job was started on 192.168.1.10:8080')
+
+    def test_same_port(self):
+        self.job['port'] = 8080
+        self.tracker.poll.return_value = ('running', 'The filer is restarting')
+        job_status = self._execute(filer_port=8080)
+        self.get_tracker_mock.assert_called_once_with(self.job)
+        self.assertFalse(job_status.ansible_return_value.has_failed())
@@ -105,28 +105,6 @@ class TestCteraFilerShare(BaseTest):
         share._ctera_filer.shares.get = mock.MagicMock(side_effect=CTERAException(response=munch.Munch(code=401)))
         self.assertRaises(CTERAException, share._get_share)
 
-    def test__to_acl_dict_local(self):
-        expected_acl_dict = dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')
-        acl_obj = munch.Munch(
-            permissions=munch.Munch(allowedFileAccess='ReadWrite'),
-            principal2=munch.Munch(
-                _classname='LocalGroup',
-                ref='#Admins'
-            )
-        )
-        self.assertDictEqual(expected_acl_dict, ctera_filer_share.CteraFilerShare()._to_acl_dict(acl_obj))
-
-    def test__to_acl_dict_domain(self):
-        expected_acl_dict = dict(principal_type='DomainGroup', name='Admins', perm='ReadWrite')
-        acl_obj = munch.Munch(
-            permissions=munch.Munch(allowedFileAccess='ReadWrite'),
-            principal2=munch.Munch(
-                _classname='DomainGroup',
-                name='Admins'
-            )
-        )
-        self.assertDictEqual(expected_acl_dict, ctera_filer_share.CteraFilerShare()._to_acl_dict(acl_obj))
-
     def test_ensure_present(self):
         for is_present in [True, False]:
             self._test_ensure_present(is_present)
@@ -200,10 +178,27 @@ class TestCteraFilerShare(BaseTest):
         share.parameters = desired_attributes
         share._handle_modify(current_attributes)
         if change_attributes:
-            share._ctera_filer.shares.modify.assert_called_with(desired_attributes['name'], export_to_afp=desired_attributes['export_to_afp'], acl=mock.ANY)
-            self._verify_acl_dict(desired_acl_dict, share._ctera_filer.shares.modify.call_args[1]['acl'][0])
+            share._ctera_filer.shares.modify.assert_called_with(desired_attributes['name'], export_to_afp=desired_attributes['export_to_afp'])
+            share._ctera_filer.shares.set_acl.assert_called_with(desired_attributes['name'], mock.ANY)
+            self.assertListEqual(share.ansible_return_value.as_dict()['diff'], [dict(
+                before=dict(export_to_afp=True, acl=[acl_dict]),
+                after=dict(export_to_afp=False, acl=[desired_acl_dict])
+            )])
+            self._verify_acl_dict(desired_acl_dict, share._ctera_filer.shares.set_acl.call_args[0][1][0])
         else:
             share._ctera_filer.shares.modify.assert_not_called()
+            share._ctera_filer.shares.set_acl.assert_not_called()
+
+    def test__handle_modify_acl_only(self):
+        current_acl = [dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'), dict(principal_type='LocalUser', name='alice', perm='ReadOnly')]
+        share = ctera_filer_share.CteraFilerShare()
+        share.parameters = dict(name='demo', acl=[dict(principal_type='LocalUser', name='alice', perm='ReadWrite')], acl_mode='append')
+        share._handle_modify(dict(name='demo', acl=current_acl, comment='comment'))
+        share._ctera_filer.shares.modify.assert_not_called()
+        actual_acl = share._ctera_filer.shares.set_acl.call_args[0][1]
+        self.assertEqual(len(actual_acl), 2)
+        self._verify_acl_dict(current_acl[0], actual_acl[0])
+        self._verify_acl_dict(dict(principal_type='LocalUser', name='alice', perm='ReadWrite'), actual_acl[1])
 
     def _verify_acl_dict(self, acl_dict, actual_acl):
         expected_acl = gateway_types.ShareAccessControlEntry(**acl_dict)
@@ -0,0 +1,152 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_shares as ctera_filer_shares
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerShares(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_shares.CteraFilerShares)
+
+    @staticmethod
+    def _share_dict(name, comment='comment'):
+        return dict(
+            name=name,
+            directory='main/public/%s' % name,
+            acl=[dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')],
+            access='winAclMode',
+            csc='manual',
+            dir_permissions=777,
+            comment=comment,
+            export_to_afp=False,
+            export_to_ftp=False,
+            export_to_nfs=False,
+            export_to_pc_agent=False,
+            export_to_rsync=False,
+            indexed=False
+        )
+
+    def _desired_share(self, name, state='present', **kwargs):
+        share = self._share_dict(name, **kwargs)
+        share['state'] = state
+        return share
+
+    def test_get_shares_single_listing(self):
+        self.patch_call(
+            "ansible_collections.ctera.ctera.plugins.modules.ctera_filer_shares.ctera_filer_share_utils.to_share_dict",
+            side_effect=lambda share: dict(name=share.name)
+        )
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares._ctera_filer.shares.get.return_value = [munch.Munch(name='demo'), munch.Munch(name='public')]
+        self.assertDictEqual(shares._get_shares(), dict(demo=dict(name='demo'), public=dict(name='public')))
+        shares._ctera_filer.shares.get.assert_called_once_with()
+
+    def test_execute(self):
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares.parameters = dict(
+            shares=[
+                self._desired_share('unchanged'),
+                self._desired_share('modified', comment='new comment'),
+                self._desired_share('added'),
+                self._desired_share('absent', state='absent'),
+                self._desired_share('missing', state='absent')
+            ],
+            purge=False
+        )
+        shares._get_shares = mock.MagicMock(return_value=dict(
+            unchanged=self._share_dict('unchanged'),
+            modified=self._share_dict('modified'),
+            absent=self._share_dict('absent'),
+            unlisted=self._share_dict('unlisted')
+        ))
+        shares._execute()
+        shares._ctera_filer.shares.add.assert_called_once_with(
+            name='added', directory='main/public/added', acl=mock.ANY, access='winAclMode', csc='manual', dir_permissions=777, comment='comment',
+            export_to_afp=False, export_to_ftp=False, export_to_nfs=False, export_to_pc_agent=False, export_to_rsync=False, indexed=False
+        )
+        shares._ctera_filer.shares.modify.assert_called_once_with('modified', comment='new comment')
+        shares._ctera_filer.shares.delete.assert_called_once_with('absent')
+        result = shares.ansible_return_value.as_dict()
+        self.assertTrue(result['changed'])
+        self.assertListEqual(result['added'], ['added'])
+        self.assertListEqual(result['modified'], ['modified'])
+        self.assertListEqual(result['deleted'], ['absent'])
+
+    def test_execute_purge(self):
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares.parameters = dict(shares=[self._desired_share('demo')], purge=True)
+        shares._get_shares = mock.MagicMock(return_value=dict(demo=self._share_dict('demo'), legacy=self._share_dict('legacy')))
+        shares._execute()
+        shares._ctera_filer.shares.add.assert_not_called()
+        shares._ctera_filer.shares.modify.assert_not_called()
+        shares._ctera_filer.shares.delete.assert_called_once_with('legacy')
+        self.assertListEqual(shares.ansible_return_value.as_dict()['deleted'], ['legacy'])
+
+    def test_execute_no_changes(self):
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares.parameters = dict(shares=[self._desired_share('demo')], purge=False)
+        shares._get_shares = mock.MagicMock(return_value=dict(demo=self._share_dict('demo'), legacy=self._share_dict('legacy')))
+        shares._execute()
+        shares._ctera_filer.shares.delete.assert_not_called()
+        result = shares.ansible_return_value.as_dict()
+        self.assertTrue(result['skipped'])
+        self.assertNotIn('changed', result)
+
+    def test_execute_failure_returns_partial_results(self):
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares.parameters = dict(
+            shares=[self._desired_share('added'), self._desired_share('absent', state='absent'), self._desired_share('failed')],
+            purge=True
+        )
+        shares._get_shares = mock.MagicMock(return_value=dict(absent=self._share_dict('absent'), legacy=self._share_dict('legacy')))
+        shares._ctera_filer.shares.add.side_effect = [None, CTERAException()]
+        shares._execute()
+        shares._ctera_filer.shares.delete.assert_called_once_with('absent')
+        result = shares.ansible_return_value.as_dict()
+        self.assertTrue(result['failed'])
+        self.assertTrue(result['changed'])
+        self.assertTrue(result['msg'].startswith('Failed to manage share failed. Exception: '))
+        self.assertListEqual(result['added'], ['added'])
+        self.assertListEqual(result['modified'], [])
+        self.assertListEqual(result['deleted'], ['absent'])
+
+    def test_execute_duplicate_names(self):
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares.parameters = dict(shares=[self._desired_share('demo'), self._desired_share('demo')], purge=False)
+        shares._get_shares = mock.MagicMock()
+        self.assertRaises(CTERAException, shares._execute)
+        shares._get_shares.assert_not_called()
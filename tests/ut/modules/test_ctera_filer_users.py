@@ -0,0 +1,118 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_users as ctera_filer_users
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerUsers(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_users.CteraFilerUsers)
+
+    def test_get_users_single_listing(self):
+        users = ctera_filer_users.CteraFilerUsers()
+        users._ctera_filer.users.get.return_value = [
+            munch.Munch(username='alice', fullName='Alice Wonderland', email='alice@example.com'),
+            munch.Munch(username='bob', email='bob@example.com')
+        ]
+        self.assertDictEqual(users._get_users(), dict(
+            alice=dict(username='alice', full_name='Alice Wonderland', email='alice@example.com'),
+            bob=dict(username='bob', email='bob@example.com')
+        ))
+        users._ctera_filer.users.get.assert_called_once_with()
+
+    def test_execute(self):
+        users = ctera_filer_users.CteraFilerUsers()
+        users.parameters = dict(users=[
+            dict(state='present', username='alice', password='secret', full_name=None, email='alice@example.com', uid=None),
+            dict(state='present', username='bob', password=None, full_name=None, email='robert@example.com', uid=None),
+            dict(state='present', username='carol', password=None, full_name=None, email='carol@example.com', uid=None),
+            dict(state='absent', username='eve', password=None, full_name=None, email=None, uid=None),
+            dict(state='absent', username='mallory', password=None, full_name=None, email=None, uid=None)
+        ])
+        users._get_users = mock.MagicMock(return_value=dict(
+            bob=dict(username='bob', email='bob@example.com'),
+            carol=dict(username='carol', email='carol@example.com'),
+            eve=dict(username='eve')
+        ))
+        users._execute()
+        users._ctera_filer.users.add.assert_called_once_with(username='alice', password='secret', email='alice@example.com')
+        users._ctera_filer.users.modify.assert_called_once_with('bob', email='robert@example.com')
+        users._ctera_filer.users.delete.assert_called_once_with('eve')
+        result = users.ansible_return_value.as_dict()
+        self.assertTrue(result['changed'])
+        self.assertListEqual(result['users'], [
+            dict(username='alice', status='created', changed=True),
+            dict(username='bob', status='modified', changed=True, modified_attributes=['email']),
+            dict(username='carol', status='unchanged', changed=False),
+            dict(username='eve', status='deleted', changed=True),
+            dict(username='mallory', status='absent', changed=False)
+        ])
+
+    def test_execute_create_no_password(self):
+        users = ctera_filer_users.CteraFilerUsers()
+        users.parameters = dict(users=[dict(state='present', username='alice')])
+        users._get_users = mock.MagicMock(return_value=dict())
+        users._execute()
+        users._ctera_filer.users.add.assert_not_called()
+        result = users.ansible_return_value.as_dict()
+        self.assertTrue(result['failed'])
+        self.assertNotIn('changed', result)
+        self.assertListEqual(result['users'], [])
+
+    def test_execute_failure_returns_partial_results(self):
+        users = ctera_filer_users.CteraFilerUsers()
+        users.parameters = dict(users=[
+            dict(state='absent', username='eve', password=None, full_name=None, email=None, uid=None),
+            dict(state='present', username='alice', password='secret', full_name=None, email=None, uid=None),
+            dict(state='present', username='bob', password='secret', full_name=None, email=None, uid=None)
+        ])
+        users._get_users = mock.MagicMock(return_value=dict(eve=dict(username='eve')))
+        users._ctera_filer.users.add.side_effect = CTERAException()
+        users._execute()
+        users._ctera_filer.users.add.assert_called_once_with(username='alice', password='secret')
+        result = users.ansible_return_value.as_dict()
+        self.assertTrue(result['failed'])
+        self.assertTrue(result['changed'])
+        self.assertTrue(result['msg'].startswith('Failed to manage user alice. Exception: '))
+        self.assertListEqual(result['users'], [dict(username='eve', status='deleted', changed=True)])
+
+    def test_execute_duplicate_names(self):
+        users = ctera_filer_users.CteraFilerUsers()
+        users.parameters = dict(users=[dict(state='present', username='alice'), dict(state='absent', username='alice')])
+        users._get_users = mock.MagicMock()
+        self.assertRaises(CTERAException, users._execute)
+        users._get_users.assert_not_called()
@@ -0,0 +1,139 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import os
+import sys
+import unittest.mock as mock
+
+from ansible.playbook.play_context import PlayContext
+from ansible.playbook.task import Task
+
+from ansible_collections.ctera.ctera.plugins.action.ctera_filer_hostname import ActionModule
+from tests.simulator import GatewaySimulator, filer_args
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerAction(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.simulator = GatewaySimulator().start()
+        self.addCleanup(self.simulator.stop)
+        self.play_context = PlayContext()
+        self.connection = mock.MagicMock(transport='local', socket_path=None, has_native_async=False)
+
+    def _action(self, **args):
+        task = Task()
+        task.action = 'ctera.ctera.ctera_filer_hostname'
+        task.args = filer_args(self.simulator, **args)
+        action = ActionModule(task, self.connection, self.play_context, loader=None, templar=mock.MagicMock(), shared_loader_obj=None)
+        action._execute_module = mock.MagicMock(return_value=dict(changed=True, msg='Ran on the host'))
+        return action
+
+    def test_in_process(self):
+        action = self._action(hostname='vGateway-02')
+        result = action.run(task_vars=dict(ctera_in_process=True))
+        action._execute_module.assert_not_called()
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['current_hostname'], 'vGateway-02')
+        self.assertEqual(self.simulator.database.get('/config/device/hostname'), 'vGateway-02')
+        self.assertFalse(self._action(hostname='vGateway-02').run(task_vars=dict(ctera_in_process=True)).get('changed'))
+
+    def test_in_process_controller_interpreter(self):
+        for interpreter in [sys.executable, 'auto_silent']:
+            action = self._action(hostname='vGateway-02')
+            action._templar.template.side_effect = lambda value: value
+            action.run(task_vars=dict(ctera_in_process=True, ansible_python_interpreter=interpreter))
+            action._execute_module.assert_not_called()
+
+    def test_in_process_check_mode(self):
+        self.play_context.check_mode = True
+        result = self._action(hostname='vGateway-02').run(task_vars=dict(ctera_in_process=True))
+        self.assertTrue(result['changed'])
+        self.assertEqual(self.simulator.database.get('/config/device/hostname'), 'vGateway-01ba')
+
+    def test_in_process_socket(self):
+        self.connection.transport = 'ctera.ctera.ctera_filer'
+        self.connection.socket_path = '/tmp/ctera_filer.socket'
+        run_module_mock = self.patch_call(
+            'ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_filer_action.ctera_module_runner.run_module',
+            return_value=dict(changed=False)
+        )
+        self._action(hostname='vGateway-02').run(task_vars=dict(ctera_in_process=True))
+        self.assertEqual(run_module_mock.call_args[0][1]['_ansible_socket'], '/tmp/ctera_filer.socket')
+
+    def test_on_host(self):
+        cases = [
+            ('ssh', dict(ctera_in_process=True), 0, None),
+            ('local', {}, 0, None),
+            ('local', dict(ctera_in_process='no'), 0, None),
+            ('local', dict(ctera_in_process=True), 60, None),
+            ('local', dict(ctera_in_process=True), 0, [dict(CTERA_READ_TIMEOUT='5')]),
+            ('local', dict(ctera_in_process=True, ansible_python_interpreter='/opt/ctera/venv/bin/python'), 0, None),
+            ('local', dict(ctera_in_process=True, ansible_facts=dict(discovered_interpreter_python='/opt/ctera/venv/bin/python')), 0, None),
+        ]
+        for transport, task_vars, async_val, environment in cases:
+            self.connection.transport = transport
+            action = self._action(hostname='vGateway-02')
+            action._templar.template.side_effect = lambda value: value
+            action._task.async_val = async_val
+            action._task.environment = environment
+            result = action.run(task_vars=task_vars)
+            action._execute_module.assert_called_once_with(module_args=action._task.args, task_vars=task_vars, wrap_async=bool(async_val))
+            self.assertEqual(result['msg'], 'Ran on the host')
+        self.assertEqual(self.simulator.database.get('/config/device/hostname'), 'vGateway-01ba')
+
+    def test_on_host_unsupported_ansible_core(self):
+        self.patch_call('ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_filer_action.ctera_module_runner.supported', return_value=False)
+        action = self._action(hostname='vGateway-02')
+        result = action.run(task_vars=dict(ctera_in_process=True))
+        action._execute_module.assert_called_once_with(module_args=action._task.args, task_vars=dict(ctera_in_process=True), wrap_async=False)
+        self.assertEqual(result['msg'], 'Ran on the host')
+
+    def test_host_options(self):
+        run_module_mock = self.patch_call(
+            'ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_filer_action.ctera_module_runner.run_module',
+            return_value=dict(changed=False)
+        )
+        action = self._action(hostname='vGateway-02', ctera_rate_burst=5)
+        action._templar.template.side_effect = lambda value: value
+        action.run(task_vars=dict(ctera_in_process=True, ctera_rate_limit=2.5, ctera_rate_burst=10, ctera_retries=3))
+        args = run_module_mock.call_args[0][1]
+        self.assertEqual(args['ctera_rate_limit'], 2.5)
+        self.assertEqual(args['ctera_rate_burst'], 5)
+        self.assertNotIn('ctera_retries', args)
+        self.assertNotIn('ctera_max_in_flight', args)
+
+    def test_action_plugins_cover_all_modules(self):
+        plugins_path = os.path.dirname(os.path.dirname(importlib.import_module('ansible_collections.ctera.ctera.plugins.modules').__file__))
+        for name in os.listdir(os.path.join(plugins_path, 'modules')):
+            if not name.startswith('ctera_filer_') or name == 'ctera_filer_fleet.py':
+                continue
+            with open(os.path.join(plugins_path, 'modules', name)) as f:
+                if '\ndef main(' not in f.read():
+                    continue
+            action = importlib.import_module('ansible_collections.ctera.ctera.plugins.action.%s' % name[:-len('.py')])
+            self.assertTrue(issubclass(action.ActionModule, ActionModule.__mro__[1]), name)
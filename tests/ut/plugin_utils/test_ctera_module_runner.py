@@ -0,0 +1,85 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_hostname as ctera_filer_hostname
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_in_process
+from ansible_collections.ctera.ctera.plugins.plugin_utils import ctera_module_runner
+from tests.simulator import GatewaySimulator, filer_args
+from tests.ut.base import BaseTest
+
+
+class TestCteraModuleRunner(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.simulators = [GatewaySimulator().start() for _ in range(3)]
+        for simulator in self.simulators:
+            self.addCleanup(simulator.stop)
+
+    def test_supported(self):
+        self.assertTrue(ctera_module_runner.supported())
+
+    def test_load_module(self):
+        self.assertIs(ctera_module_runner.load_module('ctera_filer_hostname'), ctera_filer_hostname)
+        self.assertIs(ctera_module_runner.load_module('ctera.ctera.ctera_filer_hostname'), ctera_filer_hostname)
+
+    def test_load_module_invalid(self):
+        self.assertRaisesRegex(ValueError, 'Unknown module', ctera_module_runner.load_module, 'ctera_filer_missing')
+        self.assertRaisesRegex(ValueError, 'not a CTERA Filer module', ctera_module_runner.load_module, 'ansible.builtin.copy')
+        self.assertRaisesRegex(ValueError, 'cannot run in-process', ctera_module_runner.load_module, 'ctera_filer_fleet')
+
+    def test_run_module(self):
+        result = ctera_module_runner.run_module(ctera_filer_hostname, filer_args(self.simulators[0], hostname='vGateway-02'))
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['current_hostname'], 'vGateway-02')
+        self.assertEqual(result['invocation']['module_args']['filer_password'], 'VALUE_SPECIFIED_IN_NO_LOG_PARAMETER')
+        self.assertEqual(self.simulators[0].database.get('/config/device/hostname'), 'vGateway-02')
+        self.assertIsNone(ctera_in_process.current())
+
+    def test_run_module_check_mode(self):
+        result = ctera_module_runner.run_module(ctera_filer_hostname, filer_args(self.simulators[0], hostname='vGateway-02'), check_mode=True)
+        self.assertTrue(result['changed'])
+        self.assertEqual(self.simulators[0].database.get('/config/device/hostname'), 'vGateway-01ba')
+
+    def test_run_module_invalid_arguments(self):
+        result = ctera_module_runner.run_module(ctera_filer_hostname, filer_args(self.simulators[0]))
+        self.assertTrue(result['failed'])
+        self.assertIn('hostname', result['msg'])
+
+    def test_run_module_exception(self):
+        self.patch_call('ansible_collections.ctera.ctera.plugins.modules.ctera_filer_hostname.CteraFilerHostname', side_effect=RuntimeError('boom'))
+        result = ctera_module_runner.run_module(ctera_filer_hostname, filer_args(self.simulators[0], hostname='vGateway-02'))
+        self.assertTrue(result['failed'])
+        self.assertEqual(result['msg'], 'Module failure: boom')
+
+    def test_run_module_concurrently(self):
+        args_list = [filer_args(simulator, hostname='vGateway-%d' % index) for index, simulator in enumerate(self.simulators)]
+        results = ctera_module_runner.run_module_concurrently(ctera_filer_hostname, args_list, 2)
+        self.assertListEqual([result['current_hostname'] for result in results], ['vGateway-0', 'vGateway-1', 'vGateway-2'])
+        for index, simulator in enumerate(self.simulators):
+            self.assertEqual(simulator.database.get('/config/device/hostname'), 'vGateway-%d' % index)
+
+    def test_run_module_concurrently_no_arguments(self):
+        self.assertListEqual(ctera_module_runner.run_module_concurrently(ctera_filer_hostname, [], 2), [])
@@ -0,0 +1,147 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+
+try:
+    from cterasdk import Gateway, CTERAException
+    from cterasdk.edge import session as gateway_session
+    from cterasdk.edge.types import ShareAccessControlEntry
+except ImportError:  # pragma: no cover
+    pass
+
+from tests.simulator import GatewaySimulator
+from tests.ut.base import BaseTest
+
+
+class TestGatewaySimulator(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.simulator = GatewaySimulator(seed=1).start()
+        self.addCleanup(self.simulator.stop)
+        self.gateway = Gateway(self.simulator.host, self.simulator.port)
+
+    def test_login_required(self):
+        self.assertEqual(self.gateway.get('/nosession/logininfo').hostname, 'vGateway-01ba')
+        self.gateway.login('admin', 'password')
+        self.assertEqual(self.gateway.config.get_hostname(), 'vGateway-01ba')
+        self.gateway.logout()
+        gateway_session.start_local_session(self.gateway, self.simulator.host, 'admin')
+        self.assertRaises(CTERAException, self.gateway.get, '/config/device/hostname')
+
+    def test_login_failed(self):
+        self.assertRaises(CTERAException, self.gateway.login, 'admin', 'wrong')
+
+    def test_rejects_unknown_session(self):
+        self.gateway.login('admin', 'password')
+        self.simulator.sessions.clear()
+        self.assertRaises(CTERAException, self.gateway.config.get_hostname)
+
+    def test_configuration(self):
+        self.gateway.login('admin', 'password')
+        self.gateway.config.set_hostname('vGateway-02')
+        self.gateway.syslog.enable('192.168.1.1')
+        self.assertEqual(self.gateway.config.get_hostname(), 'vGateway-02')
+        self.assertEqual(self.gateway.syslog.get_configuration().server, '192.168.1.1')
+        self.assertEqual(self.simulator.database.get('/config/device/hostname'), 'vGateway-02')
+
+    def test_collections(self):
+        self.gateway.login('admin', 'password')
+        self.gateway.shares.add('demo', 'main/demo', acl=[ShareAccessControlEntry('LocalGroup', 'Everyone', 'ReadWrite')])
+        share = self.gateway.shares.get('demo')
+        self.assertEqual((share.volume, share.directory), ('main', '/demo'))
+        self.assertEqual(share.acl[0].permissions.allowedFileAccess, 'ReadWrite')
+        self.gateway.shares.modify('demo', comment='Demo')
+        self.assertEqual(self.gateway.shares.get('demo').comment, 'Demo')
+        self.gateway.shares.delete('demo')
+        self.assertListEqual(self.gateway.shares.get(), [])
+        self.gateway.users.add('alice', 'password1')
+        self.assertListEqual([user.username for user in self.gateway.users.get()], ['admin', 'alice'])
+
+    def test_not_found(self):
+        self.gateway.login('admin', 'password')
+        self.assertRaises(CTERAException, self.gateway.shares.get, 'missing')
+
+    def test_first_user(self):
+        simulator = GatewaySimulator(username=None).start()
+        self.addCleanup(simulator.stop)
+        gateway = Gateway(simulator.host, simulator.port)
+        self.assertTrue(gateway.get('/nosession/logininfo').isfirstlogin)
+        gateway.users.add_first_user('admin', 'password')
+        self.assertFalse(gateway.get('/nosession/logininfo').isfirstlogin)
+
+    def test_inject_error(self):
+        self.gateway.login('admin', 'password')
+        self.simulator.inject_error('/config/device', method='GET', status=503, count=2)
+        for _ in range(2):
+            self.assertRaises(CTERAException, self.gateway.config.get_hostname)
+        self.gateway.config.set_hostname('vGateway-02')
+        self.assertEqual(self.gateway.config.get_hostname(), 'vGateway-02')
+
+    def test_error_rate(self):
+        self.gateway.login('admin', 'password')
+        self.simulator.error_rate = 0.5
+        failures = 0
+        for _ in range(20):
+            try:
+                self.gateway.config.get_hostname()
+            except CTERAException:
+                failures += 1
+        self.assertGreater(failures, 0)
+        self.assertLess(failures, 20)
+
+    def test_latency(self):
+        self.simulator.latency = 0.05
+        start = time.monotonic()
+        self.gateway.login('admin', 'password')
+        self.gateway.config.get_hostname()
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+        self.assertListEqual(self.simulator.requests, [('POST', '/login'), ('GET', '/config/device/hostname')])
+
+    def test_traffic(self):
+        self.gateway.login('admin', 'password')
+        self.simulator.reset_requests()
+        self.gateway.logout()
+        self.assertGreater(self.simulator.request_bytes, len('POST /admingui/api/logout HTTP/1.1\r\n'))
+        self.assertGreater(self.simulator.response_bytes, len('HTTP/1.1 200 OK\r\n'))
+        self.simulator.reset_requests()
+        self.assertEqual((self.simulator.request_bytes, self.simulator.response_bytes), (0, 0))
+
+    def test_backup(self):
+        self.patch_call('cterasdk.edge.taskmgr.time.sleep')
+        self.gateway.login('admin', 'password')
+        self.assertFalse(self.gateway.backup.is_configured())
+        self.gateway.backup.configure('passphrase')
+        self.assertTrue(self.gateway.backup.is_configured())
+        self.assertEqual(self.simulator.database.get('/config/backup').sharedSecret, 'passphrase')
+
+    def test_telnet(self):
+        self.gateway.login('admin', 'password')
+        self.gateway.telnet.enable('123456')
+        self.assertTrue(self.simulator.telnetd)
+        self.gateway.telnet.enable('123456')
+        self.gateway.telnet.disable()
+        self.assertFalse(self.simulator.telnetd)
@@ -0,0 +1,204 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import time
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_config as ctera_filer_config
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_config_snapshot as ctera_filer_config_snapshot
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_device_reboot as ctera_filer_device_reboot
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_drift as ctera_filer_drift
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_facts as ctera_filer_facts
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_ftp as ctera_filer_ftp
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_hostname as ctera_filer_hostname
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_job_status as ctera_filer_job_status
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_location as ctera_filer_location
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_network as ctera_filer_network
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_nfs as ctera_filer_nfs
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_rsync as ctera_filer_rsync
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_share as ctera_filer_share
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_shares as ctera_filer_shares
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_smb as ctera_filer_smb
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_syslog as ctera_filer_syslog
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_timezone as ctera_filer_timezone
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_user as ctera_filer_user
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_users as ctera_filer_users
+from tests.simulator import GatewaySimulator, run_module, filer_args
+from tests.ut.base import BaseTest
+
+
+class TestModulesEndToEnd(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.simulator = GatewaySimulator().start()
+        self.addCleanup(self.simulator.stop)
+
+    def _run(self, module, check_mode=False, **args):
+        result = run_module(module, filer_args(self.simulator, **args), check_mode=check_mode)
+        self.assertFalse(result.get('failed'), result.get('msg'))
+        return result
+
+    def _assert_idempotent(self, module, **args):
+        self.assertTrue(self._run(module, **args).get('changed'))
+        self.assertFalse(self._run(module, **args).get('changed'))
+
+    def test_device_settings(self):
+        self._assert_idempotent(ctera_filer_hostname, hostname='vGateway-02')
+        self._assert_idempotent(ctera_filer_location, location='Tel Aviv')
+        self._assert_idempotent(ctera_filer_timezone, timezone='(GMT+02:00) Jerusalem')
+        self.assertEqual(self.simulator.database.get('/config/device/hostname'), 'vGateway-02')
+
+    def test_file_services(self):
+        self._assert_idempotent(ctera_filer_smb, idle_disconnect_time=10)
+        self._assert_idempotent(ctera_filer_nfs, async_write=True)
+        self._assert_idempotent(ctera_filer_ftp, banner_message='Welcome')
+        self._assert_idempotent(ctera_filer_rsync, max_connections=20)
+        self._assert_idempotent(ctera_filer_syslog, server='192.168.1.1')
+
+    def test_network(self):
+        self._assert_idempotent(ctera_filer_network, mode='static', address='192.168.1.20', subnet='255.255.255.0', gateway='192.168.1.1',
+                                primary_dns_server='8.8.8.8')
+
+    def test_share(self):
+        acl = [dict(principal_type='LocalGroup', name='Everyone', perm='ReadWrite')]
+        self._assert_idempotent(ctera_filer_share, name='demo', directory='main/demo', acl=acl)
+        self._assert_idempotent(ctera_filer_share, name='demo', acl=[dict(principal_type='LocalUser', name='admin', perm='ReadOnly')], acl_mode='append')
+        self.assertEqual(len(self.simulator.database.get('/config/fileservices/share/demo/acl')), 2)
+        self._assert_idempotent(ctera_filer_share, name='demo', state='absent')
+
+    def test_shares(self):
+        shares = [dict(name='demo', directory='main/demo'), dict(name='public', directory='main/public', export_to_nfs=True)]
+        self._assert_idempotent(ctera_filer_shares, shares=shares)
+        self._assert_idempotent(ctera_filer_shares, shares=shares[:1], purge=True)
+        self.assertListEqual([share.name for share in self.simulator.database.get('/config/fileservices/share')], ['demo'])
+
+    def test_users(self):
+        self._assert_idempotent(ctera_filer_user, username='alice', password='password1', email='alice@example.com')
+        self._assert_idempotent(ctera_filer_users, users=[dict(username='alice', full_name='Alice'), dict(username='bob', password='password2')])
+        self._assert_idempotent(ctera_filer_user, username='bob', state='absent')
+
+    def test_check_mode(self):
+        result = self._run(ctera_filer_shares, check_mode=True, shares=[dict(name='demo', directory='main/demo')])
+        self.assertTrue(result['changed'])
+        self.assertListEqual(self.simulator.database.get('/config/fileservices/share'), [])
+        self.assertNotIn('POST', [method for method, path in self.simulator.requests if path != '/login' and path != '/logout'])
+
+    def test_config(self):
+        config = dict(
+            hostname='branch-01',
+            cloud_services=dict(server='portal.example.com', user='admin', password='password'),
+            license='EV32',
+            volumes=[dict(name='data', device='SATA1')],
+            shares=[dict(name='demo', directory='data/demo')],
+            smb=dict(idle_disconnect_time=10),
+            syslog=dict(server='192.168.1.1')
+        )
+        result = self._run(ctera_filer_config, check_mode=True, **config)
+        self.assertTrue(result['changed'])
+        self.assertEqual(self.simulator.database.get('/config/device/hostname'), 'vGateway-01ba')
+        self.assertListEqual(self.simulator.database.get('/config/fileservices/share'), [])
+        self._assert_idempotent(ctera_filer_config, **config)
+        self.assertEqual(self.simulator.database.get('/config/device/activeLicenseType'), 'vGateway32')
+        self.assertListEqual([share.name for share in self.simulator.database.get('/config/fileservices/share')], ['demo'])
+
+    def test_config_snapshot(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'config.xml.gz')
+        self._assert_idempotent(ctera_filer_config_snapshot, path=path, compress=True)
+        self.simulator.database.put('/config/device/hostname', 'branch-01')
+        self.simulator.database.put('/config/device/location', 'Tel Aviv')
+        self._assert_idempotent(ctera_filer_config_snapshot, state='imported', path=path, exclude=['device/location'])
+        self.assertEqual(self.simulator.database.get('/config/device/hostname'), 'vGateway-01ba')
+        self.assertEqual(self.simulator.database.get('/config/device/location'), 'Tel Aviv')
+
+    def test_drift(self):
+        baseline = self._run(ctera_filer_drift, sections=['!hostname', '!location'])['fingerprints']
+        self.assertNotIn('hostname', baseline)
+        self._run(ctera_filer_hostname, hostname='vGateway-02')
+        self._run(ctera_filer_shares, shares=[dict(name='demo', directory='main/demo')])
+        result = self._run(ctera_filer_drift, baseline=baseline)
+        self.assertFalse(result.get('changed'))
+        self.assertListEqual(result['drifted'], ['shares'])
+
+    def test_facts(self):
+        facts = self._run(ctera_filer_facts)['ansible_facts']['ctera_filer']
+        self.assertEqual(facts['hostname'], 'vGateway-01ba')
+        self.assertEqual(facts['volumes'][0]['name'], 'main')
+
+    def test_facts_concurrent(self):
+        self.simulator.latency = 0.1
+        results = []
+        max_in_flight = []
+        for pool_size in [1, 10]:
+            self.simulator.reset_requests()
+            results.append(self._run(ctera_filer_facts, ctera_pool_size=pool_size)['ansible_facts']['ctera_filer'])
+            max_in_flight.append(self.simulator.max_in_flight)
+        self.assertDictEqual(results[0], results[1])
+        self.assertEqual(max_in_flight[0], 1)
+        self.assertGreater(max_in_flight[1], 1)
+
+    def test_job_status(self):
+        self.simulator.restart_duration = 0.5
+        job = self._run(ctera_filer_device_reboot)['job']
+        self.assertEqual(job['port'], self.simulator.port)
+        result = self._run(ctera_filer_job_status, job=job)
+        self.assertEqual(result['status'], 'running')
+        self.assertEqual(result['msg'], 'The filer is restarting')
+        self.assertTrue(result['job']['stopped'])
+        result = self._run(ctera_filer_job_status, job=result['job'], wait=True, timeout=10, poll_interval=0.05, max_poll_interval=0.1)
+        self.assertEqual(result['status'], 'completed')
+        self.assertTrue(result['finished'])
+        self.assertFalse(result.get('changed'))
+
+    def test_retries(self):
+        self.simulator.inject_error('/login', status=503)
+        self.simulator.inject_error('/config/device/hostname', method='GET', status=503, count=2)
+        result = self._run(ctera_filer_hostname, hostname='vGateway-02', ctera_retries=2, ctera_retry_backoff=0.01)
+        self.assertTrue(result['changed'])
+        self.assertDictEqual(result['ctera_retries'], dict(count=3, calls={'login': 1, 'config.get_hostname': 2}))
+
+    def test_read_timeout(self):
+        self.simulator.latency = 10
+        started = time.time()
+        result = run_module(ctera_filer_hostname, filer_args(self.simulator, hostname='vGateway-02', ctera_read_timeout=0.2))
+        self.assertTrue(result['failed'])
+        self.assertLess(time.time() - started, 5)
+
+    def test_rate_limit(self):
+        # One request every 0.2 seconds, far more than the time between the requests of the module, so the requests after the first one wait
+        result = self._run(ctera_filer_hostname, hostname='vGateway-02', ctera_rate_limit=5, ctera_max_in_flight=1)
+        self.assertTrue(result['changed'])
+        self.assertGreaterEqual(result['ctera_throttle']['count'], 2)
+        self.assertEqual(self.simulator.max_in_flight, 1)
+
+    def test_injected_error(self):
+        self.simulator.inject_error('/config/device/hostname', method='PUT')
+        result = run_module(ctera_filer_hostname, filer_args(self.simulator, hostname='vGateway-02'))
+        self.assertTrue(result['failed'])
+        self.assertEqual(self.simulator.database.get('/config/device/hostname'), 'vGateway-01ba')